@@ -0,0 +1,95 @@
+"""
+CIAF Canonical JSON Benchmark
+=============================
+
+Compares ``json.dumps(..., sort_keys=True, separators=(',', ':'))`` (the
+previous per-call encoder) with ``canonical_json`` and the precompiled
+receipt/anchor schemas, and runs the encoder conformance checks from
+``ciaf.core.test_vectors`` before timing.
+
+Usage:
+    python benchmarks/canonicalization/canonical_json_benchmark.py --iterations 50000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.core import AnchorRecord, Receipt, RecordType, canonical_json, validate_canonical_encoder  # noqa: E402
+from ciaf.core.canonicalization import ORJSON_AVAILABLE  # noqa: E402
+
+
+def dumps(data) -> str:
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
+
+
+def per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Canonical JSON benchmark")
+    parser.add_argument("--iterations", type=int, default=50_000, help="encodings per measurement")
+    args = parser.parse_args()
+
+    print("📊 CIAF Canonical JSON Benchmark")
+    print("=" * 50)
+
+    report = validate_canonical_encoder()
+    print(f"backend: {report['backend']} | conformance {report['passed']}/{report['total_tests']}")
+    if report["failed"]:
+        print("❌ Encoder output differs from the stdlib reference")
+        return
+
+    metadata = {
+        "dataset_id": "credit_scoring_2025", "dataset_hash": hashlib.sha256(b"ds").hexdigest(),
+        "timestamp": "2025-01-01T12:00:00Z", "policy_id": "policy_v1", "schema_version": "1.0",
+        "actor_id": "pipeline", "system_id": "ciaf", "location": "eu-west-1", "rows": 125000,
+        "features": ["age", "income", "tenure"],
+    }
+    anchor = AnchorRecord(
+        root=hashlib.sha256(b"root").hexdigest(), policy_id="policy_v1", schema_version="1.0",
+        timestamp="2025-01-01T12:00:00Z", domain_labels=["finance", "audit"],
+        signature="s" * 88, signing_key_id="ciaf_production_key_001",
+    )
+    receipt = Receipt(metadata, anchor, hashlib.sha256(b"leaf").hexdigest(), RecordType.DATASET)
+
+    def old_receipt_hash() -> str:
+        return hashlib.sha256(dumps({
+            "metadata": receipt.metadata, "anchor": asdict(receipt.anchor),
+            "leaf_hash": receipt.leaf_hash, "record_type": receipt.record_type.value,
+        }).encode("utf-8")).hexdigest()
+
+    def old_anchor_bytes() -> bytes:
+        return dumps({
+            "root": anchor.root, "policy_id": anchor.policy_id, "schema_version": anchor.schema_version,
+            "timestamp": anchor.timestamp, "domain_labels": sorted(anchor.domain_labels),
+        }).encode("utf-8")
+
+    cases = [
+        ("metadata", lambda: dumps(metadata), lambda: canonical_json(metadata)),
+        ("anchor bytes", old_anchor_bytes, anchor.get_anchor_bytes),
+        ("receipt hash", old_receipt_hash, receipt.get_receipt_hash),
+    ]
+    for name, old, new in cases:
+        assert old() == new()
+        old_us = per_call_us(old, args.iterations)
+        new_us = per_call_us(new, args.iterations)
+        print(f"{name:>13} | json.dumps {old_us:6.2f} µs | canonical {new_us:6.2f} µs | {old_us / new_us:.2f}x")
+
+    if not ORJSON_AVAILABLE:
+        print("ℹ️  orjson not installed; only the cached encoder and schemas are active")
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+CIAF Nonce Tracker Benchmark
+============================
+
+Compares the previous set-based nonce tracker, which evicted by converting
+the whole set to a list, with the windowed ``NonceTracker`` (exact ring of
+hash sets) with and without the long-horizon Bloom filter. Reports mean and
+worst-case register latency, so eviction spikes are visible, and the Bloom
+filter's measured false-positive rate and memory.
+
+Usage:
+    python benchmarks/crypto-health/nonce_tracker_benchmark.py --nonces 500000 --max-size 100000
+"""
+
+import argparse
+import os
+import secrets
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.crypto_health import NonceTracker  # noqa: E402
+
+
+class LegacyNonceTracker:
+    """Nonce tracker as implemented before the windowed replay detector."""
+
+    def __init__(self, max_size: int):
+        self._nonces = set()
+        self._max_size = max_size
+
+    def register_nonce(self, nonce: str) -> bool:
+        if nonce in self._nonces:
+            return False
+        self._nonces.add(nonce)
+        if len(self._nonces) > self._max_size:
+            self._nonces = set(list(self._nonces)[self._max_size // 2:])
+        return True
+
+
+def bench(tracker, nonces: list) -> tuple[float, float]:
+    worst = 0.0
+    start = time.perf_counter()
+    for nonce in nonces:
+        t0 = time.perf_counter()
+        tracker.register_nonce(nonce)
+        worst = max(worst, time.perf_counter() - t0)
+    mean_us = (time.perf_counter() - start) / len(nonces) * 1e6
+    return mean_us, worst * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Nonce replay detection benchmark")
+    parser.add_argument("--nonces", type=int, default=500_000, help="nonces to register")
+    parser.add_argument("--max-size", type=int, default=100_000, help="exact entries kept")
+    parser.add_argument("--error-rate", type=float, default=1e-6, help="Bloom false-positive target")
+    args = parser.parse_args()
+
+    print("📊 CIAF Nonce Tracker Benchmark")
+    print("=" * 50)
+
+    nonces = [secrets.token_hex(16) for _ in range(args.nonces)]
+    trackers = {
+        "legacy set": LegacyNonceTracker(args.max_size),
+        "windowed": NonceTracker(max_size=args.max_size),
+        "windowed+bloom": NonceTracker(max_size=args.max_size, bloom_horizon_seconds=86_400.0,
+                                       bloom_error_rate=args.error_rate),
+    }
+    for name, tracker in trackers.items():
+        mean_us, worst_ms = bench(tracker, nonces)
+        print(f"{name:>15} | mean {mean_us:6.2f} µs/nonce | worst {worst_ms:8.2f} ms")
+
+    bloom_tracker = trackers["windowed+bloom"]
+    probes = [secrets.token_hex(16) for _ in range(100_000)]
+    false_positives = sum(bloom_tracker.seen(nonce) for nonce in probes)
+    replays = sum(not bloom_tracker.register_nonce(nonce) for nonce in nonces[:10_000])
+    stats = bloom_tracker.get_stats()
+    print(f"bloom: {stats['bloom_filters']} filters, {stats['bloom_memory_bytes'] / 1024:.0f} KiB, "
+          f"false positives {false_positives}/{len(probes)}, replays caught {replays}/10000")
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
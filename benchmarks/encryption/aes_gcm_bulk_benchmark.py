@@ -0,0 +1,95 @@
+"""
+CIAF Bulk AES-GCM Benchmark
+===========================
+
+Compares per-item ``encrypt_aes_gcm``/``decrypt_aes_gcm`` calls, the previous
+``Cipher``-per-call implementation and the bulk ``encrypt_aes_gcm_many`` /
+``decrypt_aes_gcm_many`` API, reporting throughput in MB/s and items/s.
+
+Usage:
+    python benchmarks/encryption/aes_gcm_bulk_benchmark.py --items 50000 --size 256 --keys 16
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.core import (  # noqa: E402
+    decrypt_aes_gcm,
+    decrypt_aes_gcm_many,
+    encrypt_aes_gcm,
+    encrypt_aes_gcm_many,
+)
+
+
+def cipher_encrypt(key: bytes, plaintext: bytes, aad: bytes) -> tuple[bytes, bytes, bytes]:
+    nonce = os.urandom(12)
+    enc = Cipher(algorithms.AES(key), modes.GCM(nonce)).encryptor()
+    enc.authenticate_additional_data(aad)
+    ciphertext = enc.update(plaintext) + enc.finalize()
+    return ciphertext, nonce, enc.tag
+
+
+def report(label: str, elapsed: float, items: int, payload_bytes: int) -> None:
+    print(f"{label:>27} | {payload_bytes / elapsed / 1e6:8.1f} MB/s | {items / elapsed:10.0f} items/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk AES-GCM benchmark")
+    parser.add_argument("--items", type=int, default=50_000, help="items per configuration")
+    parser.add_argument("--size", type=int, default=256, help="plaintext bytes per item")
+    parser.add_argument("--keys", type=int, default=16, help="distinct keys across the batch")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size for the parallel run")
+    args = parser.parse_args()
+
+    print("📊 CIAF Bulk AES-GCM Benchmark")
+    print("=" * 50)
+
+    keys = [os.urandom(32) for _ in range(max(args.keys, 1))]
+    items = [(keys[i % len(keys)], os.urandom(args.size), f"capsule_{i}".encode()) for i in range(args.items)]
+    payload_bytes = args.items * args.size
+
+    start = time.perf_counter()
+    for key, plaintext, aad in items:
+        cipher_encrypt(key, plaintext, aad)
+    report("encrypt (Cipher per call)", time.perf_counter() - start, args.items, payload_bytes)
+
+    start = time.perf_counter()
+    for key, plaintext, aad in items:
+        encrypt_aes_gcm(key, plaintext, aad)
+    report("encrypt_aes_gcm", time.perf_counter() - start, args.items, payload_bytes)
+
+    start = time.perf_counter()
+    sealed = encrypt_aes_gcm_many(items, workers=1)
+    report("encrypt_aes_gcm_many", time.perf_counter() - start, args.items, payload_bytes)
+
+    start = time.perf_counter()
+    encrypt_aes_gcm_many(items, workers=args.workers, parallel_min_bytes=0)
+    report("encrypt_aes_gcm_many (pool)", time.perf_counter() - start, args.items, payload_bytes)
+
+    decrypt_items = [(key, ct, nonce, tag, aad) for (key, _, aad), (ct, nonce, tag) in zip(items, sealed)]
+
+    start = time.perf_counter()
+    for key, ct, nonce, tag, aad in decrypt_items:
+        decrypt_aes_gcm(key, ct, nonce, tag, aad)
+    report("decrypt_aes_gcm", time.perf_counter() - start, args.items, payload_bytes)
+
+    start = time.perf_counter()
+    decrypt_aes_gcm_many(decrypt_items, workers=1)
+    report("decrypt_aes_gcm_many", time.perf_counter() - start, args.items, payload_bytes)
+
+    start = time.perf_counter()
+    decrypt_aes_gcm_many(decrypt_items, workers=args.workers, parallel_min_bytes=0)
+    report("decrypt_aes_gcm_many (pool)", time.perf_counter() - start, args.items, payload_bytes)
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
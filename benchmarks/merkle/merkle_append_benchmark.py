@@ -0,0 +1,97 @@
+"""
+CIAF Merkle Append Benchmark
+============================
+
+Compares the incremental (frontier) append path of ``ciaf.core.MerkleTree``
+against the legacy behaviour of rebuilding every level on each ``add_leaf``.
+
+The legacy path is quadratic, so it is measured on a smaller prefix
+(``--rebuild-leaves``) and both paths are checked to produce identical roots.
+
+Usage:
+    python benchmarks/merkle/merkle_append_benchmark.py --leaves 1000000
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.core import MerkleTree  # noqa: E402
+
+
+def make_leaves(count: int) -> list[str]:
+    """Deterministic 32-byte hex leaves."""
+    return [hashlib.sha256(f"sample-{i}".encode("utf-8")).hexdigest() for i in range(count)]
+
+
+def rebuild_append(leaves: list[str]) -> str:
+    """Legacy add_leaf behaviour: full level rebuild after every append."""
+    tree = MerkleTree()
+    current: list[str] = []
+    root = tree.get_root()
+    for leaf in leaves:
+        current.append(leaf)
+        level = current
+        while len(level) > 1:
+            level = [
+                tree._hash_pair(level[i], level[i + 1] if i + 1 < len(level) else level[i])
+                for i in range(0, len(level), 2)
+            ]
+        root = level[0]
+    return root
+
+
+def incremental_append(leaves: list[str]) -> str:
+    """Frontier append path used by MerkleTree.add_leaf."""
+    tree = MerkleTree()
+    root = tree.get_root()
+    for leaf in leaves:
+        root = tree.add_leaf(leaf)
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MerkleTree append benchmark")
+    parser.add_argument("--leaves", type=int, default=1_000_000, help="sequential appends (incremental)")
+    parser.add_argument("--rebuild-leaves", type=int, default=5_000, help="sequential appends (rebuild)")
+    args = parser.parse_args()
+
+    print("📊 CIAF MerkleTree Append Benchmark")
+    print("=" * 50)
+
+    leaves = make_leaves(max(args.leaves, args.rebuild_leaves))
+
+    start = time.perf_counter()
+    rebuild_root = rebuild_append(leaves[:args.rebuild_leaves])
+    rebuild_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prefix_root = incremental_append(leaves[:args.rebuild_leaves])
+    prefix_s = time.perf_counter() - start
+
+    if prefix_root != rebuild_root:
+        raise SystemExit("❌ Root mismatch between incremental and rebuild paths")
+
+    start = time.perf_counter()
+    incremental_root = incremental_append(leaves[:args.leaves])
+    incremental_s = time.perf_counter() - start
+
+    if incremental_root != MerkleTree(leaves[:args.leaves]).get_root():
+        raise SystemExit("❌ Root mismatch between incremental append and bulk build")
+
+    print(f"Rebuild path      : {args.rebuild_leaves:>9,} appends in {rebuild_s:8.2f}s "
+          f"({args.rebuild_leaves / rebuild_s:,.0f} appends/s)")
+    print(f"Incremental path  : {args.rebuild_leaves:>9,} appends in {prefix_s:8.2f}s "
+          f"({args.rebuild_leaves / prefix_s:,.0f} appends/s)")
+    print(f"Incremental path  : {args.leaves:>9,} appends in {incremental_s:8.2f}s "
+          f"({args.leaves / incremental_s:,.0f} appends/s)")
+    print(f"Speedup @ {args.rebuild_leaves:,} leaves: {rebuild_s / prefix_s:,.1f}x")
+    print("✅ Roots identical to full rebuild")
+
+
+if __name__ == "__main__":
+    main()
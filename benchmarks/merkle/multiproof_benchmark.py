@@ -0,0 +1,87 @@
+"""
+CIAF Merkle Multiproof Benchmark
+================================
+
+Compares one compact multiproof for k leaves against k independent inclusion
+proofs, for both ``MerkleTree`` and ``WORMMerkleTree``. Reports serialized
+proof size (canonical JSON bytes) and generation/verification time.
+
+Usage:
+    python benchmarks/merkle/multiproof_benchmark.py --leaves 100000 --k 10 100 1000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.core import MerkleTree, WORMMerkleTree  # noqa: E402
+from ciaf.core.merkle import verify_multiproof  # noqa: E402
+
+
+def encoded_size(obj) -> int:
+    return len(json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+def run_case(name: str, tree, leaves: list[str], k: int, rng: random.Random) -> None:
+    selected = rng.sample(leaves, k)
+    root = tree.get_root()
+
+    start = time.perf_counter()
+    proofs = [tree.get_proof(leaf) for leaf in selected]
+    single_gen_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single_ok = all(tree.verify_proof(leaf, proof, root) for leaf, proof in zip(selected, proofs))
+    single_ver_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multiproof = tree.get_multiproof(selected)
+    multi_gen_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multi_ok = verify_multiproof(multiproof, root)
+    multi_ver_s = time.perf_counter() - start
+
+    if not (single_ok and multi_ok):
+        raise SystemExit(f"❌ Verification failed for {name} (k={k})")
+
+    single_bytes = encoded_size(list(zip(selected, proofs)))
+    multi_bytes = encoded_size(multiproof)
+    print(f"{name:<15} k={k:>6,} | size {single_bytes:>12,}B -> {multi_bytes:>11,}B "
+          f"({single_bytes / multi_bytes:5.1f}x) | gen {single_gen_s * 1000:9.1f}ms -> "
+          f"{multi_gen_s * 1000:8.1f}ms | verify {single_ver_s * 1000:9.1f}ms -> {multi_ver_s * 1000:8.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Merkle multiproof benchmark")
+    parser.add_argument("--leaves", type=int, default=100_000)
+    parser.add_argument("--k", type=int, nargs="+", default=[10, 100, 1_000, 10_000])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print("📊 CIAF Merkle Multiproof Benchmark")
+    print("=" * 50)
+
+    leaves = [hashlib.sha256(f"receipt-{i}".encode("utf-8")).hexdigest() for i in range(args.leaves)]
+    merkle_tree = MerkleTree(list(leaves))
+    worm_tree = WORMMerkleTree()
+    for leaf in leaves:
+        worm_tree.append_leaf(leaf, {})
+
+    rng = random.Random(args.seed)
+    for k in args.k:
+        k = min(k, args.leaves)
+        run_case("MerkleTree", merkle_tree, leaves, k, rng)
+        run_case("WORMMerkleTree", worm_tree, leaves, k, rng)
+
+    print("✅ All proofs verified")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+CIAF JSON Metadata Index Benchmark
+==================================
+
+Compares lookups of the json backend of ``MetadataStorage`` before and after
+the persistent file index: the previous directory scan for one ID and the
+previous read-every-file model listing, against ``get_metadata`` and a
+paginated ``get_model_metadata`` served from the index. It also times
+``rebuild_index`` (the repair path) over the same files.
+
+Usage:
+    python benchmarks/metadata-storage/json_index_benchmark.py --sizes 1000 5000 20000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.metadata_storage import MetadataStorage  # noqa: E402
+
+
+def legacy_search_files(storage_path, metadata_id: str):
+    for model_dir in storage_path.iterdir():
+        if model_dir.is_dir():
+            for file_path in model_dir.iterdir():
+                if metadata_id[:8] in file_path.name and file_path.suffix == ".json":
+                    with open(file_path, "r") as f:
+                        record = json.load(f)
+                        if record["id"] == metadata_id:
+                            return record
+    return None
+
+
+def legacy_get_model_files(storage_path, model_name: str, limit: int):
+    records = []
+    for file_path in (storage_path / model_name).iterdir():
+        if file_path.suffix == ".json":
+            with open(file_path, "r") as f:
+                records.append(json.load(f))
+    records.sort(key=lambda x: x["timestamp"], reverse=True)
+    return records[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON metadata index benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 5_000, 20_000])
+    parser.add_argument("--models", type=int, default=4)
+    parser.add_argument("--lookups", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    print("📊 CIAF JSON Metadata Index Benchmark")
+    print("=" * 50)
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = MetadataStorage(tmp, backend="json")
+            records = [MetadataStorage.build_record(f"model_{i % args.models}", "training", "epoch", {"i": i})
+                       for i in range(size)]
+            storage.save_records(records)
+            targets = random.Random(7).choices([record["id"] for record in records], k=args.lookups)
+
+            start = time.perf_counter()
+            for metadata_id in targets:
+                legacy_search_files(storage.storage_path, metadata_id)
+            scan_ms = (time.perf_counter() - start) / len(targets) * 1e3
+
+            start = time.perf_counter()
+            for metadata_id in targets:
+                storage.get_metadata(metadata_id)
+            index_ms = (time.perf_counter() - start) / len(targets) * 1e3
+
+            start = time.perf_counter()
+            legacy_page = legacy_get_model_files(storage.storage_path, "model_0", args.page_size)
+            list_scan_ms = (time.perf_counter() - start) * 1e3
+
+            start = time.perf_counter()
+            page = storage.get_model_metadata("model_0", limit=args.page_size)
+            list_index_ms = (time.perf_counter() - start) * 1e3
+            assert [r["id"] for r in page] == [r["id"] for r in legacy_page]
+
+            start = time.perf_counter()
+            stats = storage.rebuild_index()
+            rebuild_ms = (time.perf_counter() - start) * 1e3
+
+            print(f"{size:>7,} records | get: scan {scan_ms:8.3f} ms, index {index_ms:6.3f} ms | "
+                  f"page of {args.page_size}: scan {list_scan_ms:8.2f} ms, index {list_index_ms:6.2f} ms | "
+                  f"rebuild {rebuild_ms:8.1f} ms ({stats['records']:,} indexed)")
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+CIAF HighPerformanceMetadataStorage Read Cache Benchmark
+========================================================
+
+Compares ``get_metadata`` cache lookups of the previous unbounded dict cache,
+which scanned every cached item for a matching ID, with the bounded LRU
+cache keyed by metadata ID, as the number of saved records grows. It also
+reports cache size and hit ratio from ``get_performance_metrics``.
+
+Usage:
+    python benchmarks/metadata-storage/read_cache_benchmark.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.metadata_storage_optimized import HighPerformanceMetadataStorage  # noqa: E402
+
+
+def legacy_lookup(cache: dict, metadata_id: str):
+    for cached_item in cache.values():
+        if cached_item["metadata_id"] == metadata_id:
+            return cached_item
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Metadata read cache benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--cache-size", type=int, default=10_000, help="LRU capacity")
+    parser.add_argument("--lookups", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print("📊 CIAF Metadata Read Cache Benchmark")
+    print("=" * 50)
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = HighPerformanceMetadataStorage({"storage_path": tmp, "cache_size": args.cache_size,
+                                                      "batch_write_size": 500, "memory_buffer_size": 5000})
+            ids = [storage.save_metadata(f"model_{i % 10}", "inference", "prediction", {"i": i})
+                   for i in range(size)]
+            storage.flush()
+            legacy_cache = {f"model_{i % 10}:inference:{metadata_id}": {"metadata_id": metadata_id}
+                            for i, metadata_id in enumerate(ids)}
+
+            # Recent records: hits for both caches
+            recent = random.Random(3).choices(ids[-min(size, args.cache_size):], k=args.lookups)
+            start = time.perf_counter()
+            for metadata_id in recent:
+                legacy_lookup(legacy_cache, metadata_id)
+            legacy_us = (time.perf_counter() - start) / len(recent) * 1e6
+
+            start = time.perf_counter()
+            for metadata_id in recent:
+                storage.get_metadata(metadata_id)
+            lru_us = (time.perf_counter() - start) / len(recent) * 1e6
+
+            cache = storage.get_performance_metrics()["cache"]
+            storage.shutdown()
+            print(f"{size:>7,} records | scan {legacy_us:9.2f} µs | LRU {lru_us:6.2f} µs | "
+                  f"cached {cache['size']:6,} (legacy {len(legacy_cache):6,}) | hit ratio {cache['hit_ratio']:.2f}")
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+CIAF Segment Log Metadata Storage Benchmark
+===========================================
+
+Compares the json backend (one file per record, with its ID index) against
+the segment backend (records appended to rolling segment files) for batch
+writes, lookups by ID, a page of model records, and reopening the store.
+It then deletes half of the records and reports one compaction pass.
+
+Usage:
+    python benchmarks/metadata-storage/segment_log_benchmark.py --sizes 5000 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.metadata_storage import MetadataStorage  # noqa: E402
+
+
+def run_backend(backend: str, path: str, records, targets, page_size: int, segment_bytes: int):
+    options = {"max_segment_bytes": segment_bytes, "compaction_interval": 0} if backend == "segment" else None
+    storage = MetadataStorage(path, backend=backend, segment_options=options)
+    start = time.perf_counter()
+    for i in range(0, len(records), 100):
+        storage.save_records(records[i:i + 100])
+    write_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for metadata_id in targets:
+        storage.get_metadata(metadata_id)
+    get_us = (time.perf_counter() - start) / len(targets) * 1e6
+
+    start = time.perf_counter()
+    storage.get_model_metadata("model_0", limit=page_size)
+    page_ms = (time.perf_counter() - start) * 1e3
+    storage.close()
+
+    start = time.perf_counter()
+    reopened = MetadataStorage(path, backend=backend, segment_options=options)
+    reopen_ms = (time.perf_counter() - start) * 1e3
+    files = sum(len(names) for _, _, names in os.walk(path))
+    return reopened, len(records) / write_s, get_us, page_ms, reopen_ms, files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Segment log metadata storage benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000])
+    parser.add_argument("--lookups", type=int, default=1_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--segment-bytes", type=int, default=1024 * 1024, help="Segment size for the benchmark")
+    args = parser.parse_args()
+
+    print("📊 CIAF Segment Log Metadata Storage Benchmark")
+    print("=" * 50)
+
+    for size in args.sizes:
+        records = [MetadataStorage.build_record(f"model_{i % 4}", "inference", "prediction", {"i": i, "score": 0.5})
+                   for i in range(size)]
+        targets = random.Random(11).choices([record["id"] for record in records], k=args.lookups)
+        print(f"{size:,} records")
+        for backend in ("json", "segment"):
+            with tempfile.TemporaryDirectory() as tmp:
+                storage, writes, get_us, page_ms, reopen_ms, files = run_backend(
+                    backend, tmp, records, targets, args.page_size, args.segment_bytes
+                )
+                print(f"  {backend:<8} write {writes:9,.0f} rec/s | get {get_us:7.1f} µs | "
+                      f"page {page_ms:6.2f} ms | reopen {reopen_ms:8.1f} ms | {files:6,} files")
+                if backend == "segment":
+                    segments = storage._segments
+                    segments.delete([record["id"] for record in records[::2]])
+                    start = time.perf_counter()
+                    result = segments.compact()
+                    compact_ms = (time.perf_counter() - start) * 1e3
+                    print(f"  compaction after deleting half: {result['segments_compacted']} segments, "
+                          f"{result['bytes_reclaimed'] / 1e6:.1f} MB reclaimed in {compact_ms:.1f} ms")
+                storage.close()
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
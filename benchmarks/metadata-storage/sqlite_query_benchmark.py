@@ -0,0 +1,138 @@
+"""
+CIAF MetadataStorage SQLite Query Benchmark
+===========================================
+
+Measures queries per second of the sqlite ``MetadataStorage`` backend at
+several table sizes, before and after the schema migration. The baseline
+opens a new connection per query against the unindexed pre-migration
+schema, as the backend used to; the pooled run opens the same database
+through ``MetadataStorage``, which migrates it (indexes, WAL) in place.
+
+Query mix: ``get_model_metadata`` by model, by model and stage, and
+``get_metadata`` by id.
+
+Usage:
+    python benchmarks/metadata-storage/sqlite_query_benchmark.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.metadata_storage import MetadataStorage  # noqa: E402
+
+MODELS = [f"model_{i}" for i in range(100)]
+STAGES = ["data_ingestion", "preprocessing", "training", "validation", "inference"]
+
+LEGACY_SCHEMA = """
+    CREATE TABLE metadata (
+        id TEXT PRIMARY KEY, model_name TEXT NOT NULL, model_version TEXT,
+        stage TEXT NOT NULL, event_type TEXT NOT NULL, timestamp TEXT NOT NULL,
+        metadata_hash TEXT, details TEXT, metadata_json TEXT NOT NULL
+    )
+"""
+
+
+def populate(db_path: str, count: int) -> list:
+    conn = sqlite3.connect(db_path)
+    conn.execute(LEGACY_SCHEMA)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    ids = []
+    batch = []
+    for i in range(count):
+        record_id = f"{i:08x}-bench"
+        ids.append(record_id)
+        batch.append((
+            record_id, MODELS[i % len(MODELS)], "1.0.0", STAGES[i % len(STAGES)], "event",
+            (start + timedelta(seconds=i)).isoformat(), "0" * 64, None,
+            json.dumps({"batch": i // 1000, "score": i * 0.001}),
+        ))
+        if len(batch) == 50_000:
+            conn.executemany("INSERT INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+            batch.clear()
+    conn.executemany("INSERT INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+    conn.commit()
+    conn.close()
+    return ids
+
+
+def legacy_query(db_path: str, kind: str, arg):
+    conn = sqlite3.connect(db_path)
+    if kind == "id":
+        conn.execute("SELECT * FROM metadata WHERE id = ?", (arg,)).fetchone()
+    elif kind == "model":
+        conn.execute("SELECT * FROM metadata WHERE model_name = ? ORDER BY timestamp DESC LIMIT 100",
+                     (arg,)).fetchall()
+    else:
+        conn.execute("SELECT * FROM metadata WHERE model_name = ? AND stage = ? "
+                     "ORDER BY timestamp DESC LIMIT 100", arg).fetchall()
+    conn.close()
+
+
+def pooled_query(storage: MetadataStorage, kind: str, arg):
+    if kind == "id":
+        storage.get_metadata(arg)
+    elif kind == "model":
+        storage.get_model_metadata(arg)
+    else:
+        storage.get_model_metadata(arg[0], stage=arg[1])
+
+
+def queries_per_second(run, ids: list, kind: str, seconds: float) -> float:
+    rng = random.Random(7)
+    done = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        if kind == "id":
+            arg = rng.choice(ids)
+        elif kind == "model":
+            arg = rng.choice(MODELS)
+        else:
+            arg = (rng.choice(MODELS), rng.choice(STAGES))
+        run(kind, arg)
+        done += 1
+    return done / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MetadataStorage SQLite query benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--seconds", type=float, default=2.0, help="time budget per query kind")
+    args = parser.parse_args()
+
+    print("📊 CIAF MetadataStorage SQLite Query Benchmark")
+    print("=" * 50)
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "ciaf_metadata.db")
+            ids = populate(db_path, size)
+
+            baseline = {kind: queries_per_second(lambda k, a: legacy_query(db_path, k, a), ids, kind, args.seconds)
+                        for kind in ("id", "model", "model+stage")}
+
+            start = time.perf_counter()
+            storage = MetadataStorage(tmp, backend="sqlite")
+            migrate_s = time.perf_counter() - start
+            pooled = {kind: queries_per_second(lambda k, a: pooled_query(storage, k, a), ids, kind, args.seconds)
+                      for kind in ("id", "model", "model+stage")}
+            storage.close()
+
+            print(f"{size:>9,} records | migration {migrate_s:6.2f} s")
+            for kind in ("id", "model", "model+stage"):
+                print(f"    {kind:>11} | baseline {baseline[kind]:9.1f} q/s | pooled+indexed "
+                      f"{pooled[kind]:9.1f} q/s | {pooled[kind] / baseline[kind]:7.1f}x")
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+CIAF Provenance Capsule Factory Benchmark
+=========================================
+
+Compares building capsules one at a time with ``ProvenanceCapsule(...)``
+against ``ProvenanceCapsuleFactory.build`` on a process pool, and the size
+and encode time of per-capsule base64 JSON against the binary container.
+
+Each capsule costs one PBKDF2 derivation, so the one-at-a-time baseline is
+timed on a sample (``--baseline-sample``) and extrapolated to the full run.
+
+Usage:
+    python benchmarks/provenance/capsule_factory_benchmark.py --records 100000
+    python benchmarks/provenance/capsule_factory_benchmark.py --records 2000 --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.provenance import ProvenanceCapsule, ProvenanceCapsuleFactory  # noqa: E402
+
+
+def make_items(count: int) -> list:
+    return [
+        (
+            json.dumps({"patient_age": 30 + i % 50, "diagnosis_code": f"E{i % 90:02d}", "visit": i}),
+            {"id": f"record_{i}", "source": "benchmark", "consent_status": "granted"},
+            f"secret_for_record_{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Provenance capsule factory benchmark")
+    parser.add_argument("--records", type=int, default=100_000, help="capsules to build")
+    parser.add_argument("--baseline-sample", type=int, default=500,
+                        help="capsules built one at a time to estimate the baseline")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    args = parser.parse_args()
+
+    print("📊 CIAF Provenance Capsule Factory Benchmark")
+    print("=" * 50)
+    print(f"records: {args.records:,} | CPUs: {os.cpu_count()}")
+
+    sample = make_items(min(args.baseline_sample, args.records))
+    start = time.perf_counter()
+    for data, metadata, secret in sample:
+        ProvenanceCapsule(data, metadata, secret)
+    per_capsule = (time.perf_counter() - start) / len(sample)
+    baseline = per_capsule * args.records
+    print(f"one at a time  | {per_capsule * 1000:7.2f} ms/capsule | est. {baseline:9.1f} s total")
+
+    batch = ProvenanceCapsuleFactory(workers=args.workers).build(make_items(args.records))
+    print(f"factory        | {batch.elapsed_seconds / len(batch) * 1000:7.2f} ms/capsule | "
+          f"{batch.elapsed_seconds:9.1f} s total | {batch.workers} workers")
+    print(f"build speedup: {baseline / batch.elapsed_seconds:.2f}x")
+
+    start = time.perf_counter()
+    json_bytes = sum(len(json.dumps(capsule.to_json()).encode("utf-8")) for capsule in batch.capsules)
+    json_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    container = batch.to_bytes()
+    container_seconds = time.perf_counter() - start
+    print(f"base64 JSON    | {json_bytes / 1024 / 1024:8.2f} MiB | encode {json_seconds * 1000:8.1f} ms")
+    print(f"container      | {len(container) / 1024 / 1024:8.2f} MiB | encode {container_seconds * 1000:8.1f} ms")
+    print(f"container size: {len(container) / json_bytes:.0%} of JSON")
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+CIAF WORM Record Codec Benchmark
+================================
+
+Compares the JSON and msgpack record formats of the SQLite and LMDB WORM
+stores: encoded record size, on-disk size, codec encode/decode latency, and
+point-read and full-scan latency through the store. Records mirror the leaf
+records written by ``DurableWORMMerkleTree``.
+
+Usage:
+    python benchmarks/worm-store/record_codec_benchmark.py --records 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from ciaf.core import RecordType, WORMRecord, sha256_hash  # noqa: E402
+from ciaf.core.worm_store import (  # noqa: E402
+    LMDB_AVAILABLE,
+    MSGPACK_AVAILABLE,
+    create_lmdb_worm_store,
+    create_sqlite_worm_store,
+    decode_record,
+    encode_record,
+)
+
+
+def make_records(count: int) -> list:
+    timestamp = datetime.now(timezone.utc).isoformat()
+    records = []
+    for i in range(count):
+        leaf_hash = sha256_hash(f"leaf-{i}".encode())
+        records.append(WORMRecord(
+            id=f"bench:{leaf_hash}",
+            timestamp=timestamp,
+            record_type=RecordType.DATASET,
+            data={
+                "tree_id": "bench",
+                "leaf_hash": leaf_hash,
+                "metadata": {"model": "credit_scoring_v2", "batch": i // 100, "score": i * 0.001,
+                             "features": list(range(8))},
+                "root_after_append": sha256_hash(f"root-{i}".encode()),
+            },
+            hash="",
+        ))
+    return records
+
+
+def store_size(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def bench_codec(records: list, record_format: str) -> tuple[int, float, float]:
+    start = time.perf_counter()
+    encoded = [encode_record(record, record_format) for record in records]
+    encode_us = (time.perf_counter() - start) / len(records) * 1e6
+    start = time.perf_counter()
+    for value in encoded:
+        decode_record(value)
+    decode_us = (time.perf_counter() - start) / len(records) * 1e6
+    return sum(len(value) for value in encoded), encode_us, decode_us
+
+
+def bench_store(backend: str, records: list, record_format: str) -> tuple[int, float, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        if backend == "sqlite":
+            path = os.path.join(tmp, "worm.db")
+            store = create_sqlite_worm_store(path, group_commit=True, record_format=record_format)
+        else:
+            path = os.path.join(tmp, "worm_lmdb")
+            store = create_lmdb_worm_store(path, record_format=record_format)
+        for record in records:
+            store.append_record(record)
+
+        start = time.perf_counter()
+        for record in records[::10]:
+            store.get_record(record.id)
+        get_us = (time.perf_counter() - start) / len(records[::10]) * 1e6
+
+        start = time.perf_counter()
+        store.list_records(RecordType.DATASET)
+        list_ms = (time.perf_counter() - start) * 1000
+
+        store.close()
+        return store_size(path), get_us, list_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WORM record codec benchmark")
+    parser.add_argument("--records", type=int, default=5_000, help="records per configuration")
+    args = parser.parse_args()
+
+    if not MSGPACK_AVAILABLE:
+        print("❌ msgpack is not installed (pip install msgpack)")
+        return
+
+    print("📊 CIAF WORM Record Codec Benchmark")
+    print("=" * 50)
+
+    records = make_records(args.records)
+    codec = {fmt: bench_codec(records, fmt) for fmt in ("json", "msgpack")}
+    for fmt, (size, encode_us, decode_us) in codec.items():
+        print(f"codec {fmt:>7} | {size / len(records):6.1f} B/record | "
+              f"encode {encode_us:6.2f} µs | decode {decode_us:6.2f} µs")
+    print(f"msgpack record size: {codec['msgpack'][0] / codec['json'][0]:.0%} of JSON")
+
+    backends = ["sqlite"] + (["lmdb"] if LMDB_AVAILABLE else [])
+    for backend in backends:
+        results = {fmt: bench_store(backend, records, fmt) for fmt in ("json", "msgpack")}
+        for fmt, (size, get_us, list_ms) in results.items():
+            print(f"{backend:>6} {fmt:>7} | on disk {size / 1024:8.1f} KiB | "
+                  f"get {get_us:6.1f} µs | list {list_ms:7.1f} ms")
+        print(f"{backend:>6} list speedup: {results['json'][2] / results['msgpack'][2]:.2f}x")
+
+    print("✅ Benchmark complete")
+
+
+if __name__ == "__main__":
+    main()
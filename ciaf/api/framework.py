@@ -16,12 +16,14 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 # Removed redundant anchoring imports - using LCM system instead
-from ..core import CryptoUtils, MerkleTree, derive_model_anchor, derive_master_anchor, sha256_hash, secure_random_bytes, SALT_LENGTH, to_hex
+from ..core import CryptoUtils, MerkleTree, get_merkle_cache_metrics, get_master_anchor_cache, derive_model_anchor, derive_master_anchor, sha256_hash, secure_random_bytes, SALT_LENGTH, to_hex
 from ..core.canonicalization import (
     Policy, RecordType, AnchorRecord, Receipt, Signer, WORMMerkleTree, CapsuleBuilder,
     canonical_json, canonicalize_and_hash, validate_required_fields, 
     enrich_metadata_with_defaults, make_anchor, HashAlgorithm
 )
+from ..core.constants import ANCHOR_EPOCH_MAX_RECORDS, ANCHOR_EPOCH_MAX_SECONDS
+from ..core.epoch_signing import EpochSigner
 from ..provenance import ModelAggregationAnchor, ProvenanceCapsule, TrainingSnapshot
 from ..simulation import MLFrameworkSimulator
 from ..inference import InferenceReceipt, ZKEConnections
@@ -59,8 +61,22 @@ class CIAFFramework:
         self, 
         framework_name: str = "CIAF",
         policy: Optional[Policy] = None,
-        anchor_signer: Optional[Signer] = None
+        anchor_signer: Optional[Signer] = None,
+        epoch_signing: bool = False,
+        epoch_max_records: int = ANCHOR_EPOCH_MAX_RECORDS,
+        epoch_max_seconds: float = ANCHOR_EPOCH_MAX_SECONDS
     ):
+        """
+        Initialize the framework.
+        
+        Args:
+            framework_name: Name of this framework instance
+            policy: Audit policy (defaults to ciaf_default_v1)
+            anchor_signer: Signer for anchors (defaults to a production Ed25519 signer)
+            epoch_signing: Sign one Merkle root per epoch of commits instead of every anchor
+            epoch_max_records: Commits per epoch when epoch_signing is enabled
+            epoch_max_seconds: Epoch time window when epoch_signing is enabled
+        """
         self.framework_name = framework_name
         
         # Compliance-enhanced initialization
@@ -93,6 +109,14 @@ class CIAFFramework:
         # Core WORM Merkle ledger
         self.ledger = WORMMerkleTree(self.policy.hash_algorithm)
         
+        # Optional epoch signer: record anchors are covered by one signature per epoch
+        self.epoch_signer: Optional[EpochSigner] = None
+        if epoch_signing:
+            self.epoch_signer = EpochSigner(
+                self.anchor_signer, self.policy, epoch_max_records, epoch_max_seconds,
+                on_seal=self.ledger.append_epoch_anchor
+            )
+        
 
         
         # Legacy components (removed - using LCM system)
@@ -272,8 +296,11 @@ class CIAFFramework:
         # Step 2: Append to WORM Merkle ledger (dual anchoring)
         root = self.ledger.append_leaf(leaf_hash, metadata)
         
-        # Step 3: Create signed anchor
-        anchor = make_anchor(root, self.policy, self.anchor_signer)
+        # Step 3: Create signed anchor (or an anchor signed later as part of an epoch)
+        if self.epoch_signer is not None:
+            anchor = self.epoch_signer.make_record_anchor(root)
+        else:
+            anchor = make_anchor(root, self.policy, self.anchor_signer)
         
         # Step 4: Append anchor to WORM log
         self.ledger.append_anchor(anchor)
@@ -286,6 +313,10 @@ class CIAFFramework:
             record_type=record_type
         )
         
+        # Epoch mode: receipt.epoch_proof is filled in when the epoch is sealed
+        if self.epoch_signer is not None:
+            self.epoch_signer.add(anchor, receipt)
+        
         print(f"Record anchored - Root: {root[:16]}..., Leaf: {leaf_hash[:16]}...")
         return receipt
     
@@ -334,6 +365,17 @@ class CIAFFramework:
         if not anchor:
             raise ValueError("No anchor found for proof generation")
         
+        epoch_proof = None
+        if self.epoch_signer is not None:
+            # Record anchors are unsigned in epoch mode: a capsule needs the epoch proof
+            epoch_proof = self.epoch_signer.get_proof(anchor)
+            if epoch_proof is None:
+                # The anchor is still in the open epoch: seal it rather than emit an unsigned anchor
+                self.epoch_signer.flush()
+                epoch_proof = self.epoch_signer.get_proof(anchor)
+            if epoch_proof is None:
+                raise ValueError("No signed epoch covers the latest anchor (its epoch is no longer retained)")
+        
         # Build proof capsule
         capsule = CapsuleBuilder.build(
             metadata=metadata,
@@ -343,8 +385,17 @@ class CIAFFramework:
             leaf_hash=leaf_hash
         )
         
+        if epoch_proof is not None:
+            capsule["proofs"]["epoch_proof"] = epoch_proof.to_dict()
+        
         print(f"Proof capsule materialized with {len(merkle_path)} proof elements")
         return capsule
+    
+    def flush_epoch(self) -> Optional[AnchorRecord]:
+        """Seal the open signing epoch so pending receipts get their epoch proofs."""
+        if self.epoch_signer is None:
+            return None
+        return self.epoch_signer.flush()
 
     def create_dataset_anchor_lcm(
         self, dataset_id: str, dataset_metadata: Dict[str, Any], master_password: str
@@ -1183,7 +1234,7 @@ class CIAFFramework:
         metrics["framework_summary"] = {
             "total_datasets": len(self.dataset_anchors),
             "total_models": len(self.model_anchors),
-            "total_lazy_managers": len(self.lazy_managers),
+            "total_lazy_managers": len(getattr(self, "lazy_managers", {})),
             "total_ml_simulators": len(self.ml_simulators),
             "total_inference_connections": len(self.inference_connections),
             "total_audit_generators": len(self.audit_generators),
@@ -1197,6 +1248,10 @@ class CIAFFramework:
             }
         }
 
+        # Process-wide Merkle proof/verification cache counters
+        metrics["merkle_caches"] = get_merkle_cache_metrics()
+        metrics["master_anchor_cache"] = get_master_anchor_cache().get_stats()
+
         return metrics
 
     def lcm_complete_workflow(
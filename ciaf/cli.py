@@ -22,6 +22,7 @@ from datetime import datetime
 
 from .metadata_config import create_config_template
 from .metadata_integration import ModelMetadataManager
+from .metadata_storage import MetadataStorage
 
 
 def main():
@@ -48,10 +49,13 @@ def main():
     
     # Verify command - proof verification
     verify_parser = subparsers.add_parser("verify", help="Verify cryptographic proof")
-    verify_parser.add_argument("--proof", required=True, help="Path to Merkle proof file")
+    verify_parser.add_argument("--proof", help="Path to Merkle proof file")
     verify_parser.add_argument("--receipt", help="Specific receipt ID to verify")
     verify_parser.add_argument("--root-hash", help="Expected root hash for verification")
     verify_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose verification output")
+    verify_parser.add_argument("--worm-store", help="Verify a WORM ledger (SQLite file or LMDB directory) instead of a proof file")
+    verify_parser.add_argument("--worm-backend", choices=["sqlite", "lmdb"], help="WORM store backend (default: lmdb for directories)")
+    verify_parser.add_argument("--tree-id", help="Only verify the leaf records of this Merkle tree")
     
     # Materialize command - evidence reconstruction
     materialize_parser = subparsers.add_parser("materialize", help="Materialize evidence from receipt")
@@ -64,7 +68,7 @@ def main():
     setup_parser.add_argument("project_name", help="Name of your project")
     setup_parser.add_argument(
         "--backend", 
-        choices=["json", "sqlite", "pickle"], 
+        choices=["json", "sqlite", "pickle", "segment"], 
         default="json",
         help="Storage backend (default: json)"
     )
@@ -115,6 +119,11 @@ def main():
     show_parser = metadata_subparsers.add_parser("show", help="Show detailed model metadata")
     show_parser.add_argument("model_name", help="Model name to show")
     show_parser.add_argument("--version", help="Model version (default: latest)")
+
+    # Rebuild the json/pickle record file index
+    repair_parser = metadata_subparsers.add_parser("repair-index", help="Rebuild the metadata file index from the record files")
+    repair_parser.add_argument("--path", default="ciaf_metadata", help="Metadata storage path")
+    repair_parser.add_argument("--backend", choices=["json", "pickle"], default="json", help="Storage backend")
     
     # Version command
     version_parser = subparsers.add_parser("version", help="Show CIAF version")
@@ -328,6 +337,11 @@ def batch_command(args):
 
 def verify_command(args):
     """Handle verify command - verifies cryptographic proof."""
+    if args.worm_store:
+        return _verify_worm_store(args)
+    if not args.proof:
+        raise ValueError("Either --proof or --worm-store is required")
+    
     print(">>> Verifying cryptographic proof...")
     
     proof_path = Path(args.proof)
@@ -415,6 +429,85 @@ def verify_command(args):
     return True
 
 
+def _verify_worm_store(args) -> bool:
+    """Stream a WORM ledger, re-deriving record hashes and Merkle roots in constant memory."""
+    from .core.crypto import sha256_hash
+    from .core.merkle import MerkleFrontier
+    from .core.worm_store import create_lmdb_worm_store, create_sqlite_worm_store
+    
+    print(">>> Verifying WORM ledger...")
+    
+    store_path = Path(args.worm_store)
+    if not store_path.exists():
+        raise FileNotFoundError(f"WORM store not found: {store_path}")
+    backend = args.worm_backend or ("lmdb" if store_path.is_dir() else "sqlite")
+    # Verification never writes: an unmigrated store is reported instead of being migrated
+    if backend == "lmdb":
+        store = create_lmdb_worm_store(str(store_path), read_only=True)
+    else:
+        store = create_sqlite_worm_store(str(store_path), read_only=True)
+    if store.needs_migration:
+        store.close()
+        print(f"   Backend: {backend}")
+        print("[FAILED] Ledger verification: store needs migration "
+              "(open it once with write access to add the sequence and tree indexes)")
+        return False
+    
+    records_checked = 0
+    failures = []
+    frontiers: Dict[str, MerkleFrontier] = {}
+    try:
+        if args.tree_id:
+            stream = store.iter_tree_records(args.tree_id)
+        else:
+            stream = store.iter_records()
+        
+        for seq, record in stream:
+            records_checked += 1
+            expected_hash = sha256_hash(json.dumps(record.data, sort_keys=True).encode('utf-8'))
+            if record.hash != expected_hash:
+                failures.append(f"seq {seq} ({record.id}): record hash mismatch")
+            
+            tree_id = record.data.get('tree_id') if isinstance(record.data, dict) else None
+            if isinstance(tree_id, str) and 'leaf_hash' in record.data:
+                frontier = frontiers.setdefault(tree_id, MerkleFrontier())
+                root = frontier.append(record.data['leaf_hash'])
+                if record.data.get('root_after_append') not in (None, root):
+                    failures.append(f"seq {seq} ({record.id}): root_after_append mismatch")
+            
+            if args.verbose and records_checked % 100000 == 0:
+                print(f"   ... {records_checked} records verified")
+    finally:
+        store.close()
+    
+    print(f"   Backend: {backend}")
+    print(f"   Records verified: {records_checked}")
+    print(f"   Merkle trees: {len(frontiers)}")
+    for tree_id, frontier in sorted(frontiers.items()):
+        print(f"   Tree {tree_id}: {frontier.leaf_count} leaves, root {frontier.get_root()}")
+    
+    for failure in failures[:20]:
+        print(f"[FAILED] {failure}")
+    if failures:
+        print(f"[FAILED] Ledger verification: FAILED ({len(failures)} problems)")
+        return False
+    
+    if args.root_hash:
+        if not args.tree_id or args.tree_id not in frontiers:
+            print("[FAILED] Root hash verification requires --tree-id of a tree in the ledger")
+            return False
+        actual_root = frontiers[args.tree_id].get_root()
+        if actual_root != args.root_hash:
+            print("[FAILED] Root hash verification: FAILED")
+            print(f"   Expected: {args.root_hash}")
+            print(f"   Actual: {actual_root}")
+            return False
+        print("[SUCCESS] Root hash verification: PASSED")
+    
+    print("[SUCCESS] Ledger verification: PASSED")
+    return True
+
+
 def materialize_command(args):
     """Handle materialize command - reconstructs evidence from receipt."""
     print(">>> Materializing evidence from receipt...")
@@ -983,8 +1076,10 @@ def metadata_command(args):
             list_models_command(args)
         elif args.metadata_action == "show":
             show_model_command(args)
+        elif args.metadata_action == "repair-index":
+            repair_index_command(args)
         else:
-            print("Please specify a metadata action (list, show)")
+            print("Please specify a metadata action (list, show, repair-index)")
             sys.exit(1)
     except Exception as e:
         print(f"❌ Metadata command failed: {e}")
@@ -1056,6 +1151,24 @@ def show_model_command(args):
         sys.exit(1)
 
 
+def repair_index_command(args):
+    """Rebuild the metadata file index of a json or pickle storage directory."""
+    if not Path(args.path).is_dir():
+        print(f"❌ Metadata storage path not found: {args.path}")
+        sys.exit(1)
+
+    storage = MetadataStorage(storage_path=args.path, backend=args.backend)
+    # A directory without an index already had it built when the storage was opened
+    stats = storage.index_rebuild_stats or storage.rebuild_index()
+
+    print(f"\n🔧 Metadata index rebuilt: {storage.config['index_path']}")
+    print("=" * 50)
+    print(f"Records indexed: {stats['records']}")
+    print(f"Models: {stats['models']}")
+    print(f"Unreadable files skipped: {stats['skipped']}")
+    print()
+
+
 def version_command(args):
     """Handle version command."""
     print("CIAF (Cognitive Insight Audit Framework)")
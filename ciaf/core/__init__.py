@@ -18,7 +18,16 @@ from .constants import (
     DEFAULT_PUBKEY_ID,
     HASH_OUTPUT_LENGTH,
     EVENT_ID_PREFIX,
-    SUPPORTED_RNG_SOURCES
+    SUPPORTED_RNG_SOURCES,
+    MERKLE_PROOF_CACHE_SIZE,
+    MERKLE_PROOF_CACHE_BYTES,
+    MERKLE_VERIFICATION_CACHE_SIZE,
+    ANCHOR_EPOCH_MAX_RECORDS,
+    ANCHOR_EPOCH_MAX_SECONDS,
+    MASTER_ANCHOR_CACHE_SIZE,
+    MASTER_ANCHOR_CACHE_TTL_SECONDS,
+    KEY_HANDLE_CACHE_SIZE,
+    KEY_HANDLE_CACHE_TTL_SECONDS
 )
 
 from .enums import RecordType, HashAlgorithm, SignatureAlgorithm
@@ -28,6 +37,8 @@ from .crypto import (
     CryptoUtils,
     decrypt_aes_gcm,
     encrypt_aes_gcm,
+    decrypt_aes_gcm_many,
+    encrypt_aes_gcm_many,
     hmac_sha256,
     secure_random_bytes,
     sha256_hash,
@@ -39,6 +50,8 @@ from .crypto import (
     derive_dataset_anchor,
     derive_model_anchor,
     derive_capsule_anchor,
+    MasterAnchorCache,
+    get_master_anchor_cache,
     to_hex,
     from_hex,
     make_aad,
@@ -55,13 +68,18 @@ from .canonicalization import (
     WORMMerkleTree,
     CapsuleBuilder,
     canonical_json,
+    canonical_json_stdlib,
+    CanonicalSchema,
     canonicalize_and_hash,
     validate_required_fields,
     enrich_metadata_with_defaults,
     make_anchor,
     REQUIRED_FIELDS
 )
-from .merkle import MerkleTree
+from .merkle import MerkleTree, MerkleFrontier, get_merkle_cache_metrics, verify_consistency_proof
+from .cache import BoundedLRUCache, CacheMetrics
+from .batch_hashing import DigestBatch, hash_many, hash_pairs
+from .epoch_signing import EpochSigner, EpochProof
 
 # New enhanced modules
 from .policy_enforcement import (
@@ -113,6 +131,7 @@ from .key_management import (
 
 from .worm_store import (
     WORMRecord,
+    RecordPage,
     WORMStore,
     SQLiteWORMStore,
     LMDBWORMStore,
@@ -128,7 +147,8 @@ from .test_vectors import (
     generate_test_vectors,
     export_test_vectors,
     load_test_vectors,
-    validate_ciaf_implementation
+    validate_ciaf_implementation,
+    validate_canonical_encoder
 )
 
 # Legacy anchor managers removed - using LCM system instead
@@ -148,6 +168,15 @@ __all__ = [
     "HASH_OUTPUT_LENGTH",
     "EVENT_ID_PREFIX", 
     "SUPPORTED_RNG_SOURCES",
+    "MERKLE_PROOF_CACHE_SIZE",
+    "MERKLE_PROOF_CACHE_BYTES",
+    "MERKLE_VERIFICATION_CACHE_SIZE",
+    "ANCHOR_EPOCH_MAX_RECORDS",
+    "ANCHOR_EPOCH_MAX_SECONDS",
+    "MASTER_ANCHOR_CACHE_SIZE",
+    "MASTER_ANCHOR_CACHE_TTL_SECONDS",
+    "KEY_HANDLE_CACHE_SIZE",
+    "KEY_HANDLE_CACHE_TTL_SECONDS",
     # Enums
     "RecordType",
     "HashAlgorithm",
@@ -165,6 +194,8 @@ __all__ = [
     # Crypto
     "encrypt_aes_gcm",
     "decrypt_aes_gcm",
+    "encrypt_aes_gcm_many",
+    "decrypt_aes_gcm_many",
     "sha256_hash",
     "blake3_hash",
     "sha3_256_hash",
@@ -184,6 +215,8 @@ __all__ = [
     "derive_dataset_anchor",
     "derive_model_anchor",
     "derive_capsule_anchor",
+    "MasterAnchorCache",
+    "get_master_anchor_cache",
     "to_hex",
     "from_hex",
     "make_aad",
@@ -195,14 +228,28 @@ __all__ = [
     "WORMMerkleTree",
     "CapsuleBuilder",
     "canonical_json",
+    "canonical_json_stdlib",
+    "CanonicalSchema",
     "canonicalize_and_hash",
     "validate_required_fields",
     "enrich_metadata_with_defaults",
     "make_anchor",
     "REQUIRED_FIELDS",
+    "EpochSigner",
+    "EpochProof",
     # Merkle
     "MerkleTree",
+    "MerkleFrontier",
+    "verify_consistency_proof",
     "DurableWORMMerkleTree",
+    "get_merkle_cache_metrics",
+    # Batch hashing
+    "DigestBatch",
+    "hash_many",
+    "hash_pairs",
+    # Caching
+    "BoundedLRUCache",
+    "CacheMetrics",
     # Policy enforcement
     "PolicyViolation",
     "RiskAssessment",
@@ -242,6 +289,7 @@ __all__ = [
     "get_ciaf_signer",
     # WORM storage
     "WORMRecord",
+    "RecordPage",
     "WORMStore",
     "SQLiteWORMStore",
     "LMDBWORMStore",
@@ -254,5 +302,6 @@ __all__ = [
     "generate_test_vectors",
     "export_test_vectors",
     "load_test_vectors",
-    "validate_ciaf_implementation"
+    "validate_ciaf_implementation",
+    "validate_canonical_encoder"
 ]
@@ -0,0 +1,160 @@
+"""
+Batch hashing for CIAF core components.
+
+Hashes sequences of byte buffers in one call and returns their raw digests
+packed into a single contiguous buffer, so callers that build Merkle levels
+or hash many leaves avoid per-item hex encoding and decoding. Large batches
+are split across threads: hashlib (and blake3) release the GIL while hashing
+buffers of more than a few kilobytes.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Union
+
+# Optional blake3
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+from .constants import BATCH_HASH_PARALLEL_MIN_BYTES
+
+DIGEST_SIZE = 32
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _hash_constructor(algorithm: str) -> Callable[[BytesLike], Any]:
+    """Return a constructor whose result exposes digest() for the algorithm."""
+    alg = algorithm.lower()
+    if alg == "sha256":
+        return hashlib.sha256
+    if alg == "sha3-256":
+        return hashlib.sha3_256
+    if alg == "blake3":
+        if not BLAKE3_AVAILABLE:
+            raise ImportError("blake3 library is required (pip install blake3)")
+        return blake3.blake3
+    supported = ["sha256", "sha3-256"]
+    if BLAKE3_AVAILABLE:
+        supported.append("blake3")
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}. Supported: {supported}")
+
+
+class DigestBatch:
+    """
+    Fixed-size raw digests stored back to back in one buffer.
+
+    Args:
+        buffer: Concatenated digests
+        digest_size: Size of every digest in bytes
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray], digest_size: int = DIGEST_SIZE):
+        if len(buffer) % digest_size:
+            raise ValueError(f"Buffer length {len(buffer)} is not a multiple of {digest_size}")
+        self.buffer = buffer
+        self.digest_size = digest_size
+
+    @classmethod
+    def from_hex(cls, hex_digests: Sequence[str], digest_size: int = DIGEST_SIZE) -> "DigestBatch":
+        """Pack hex digests into a batch (raises ValueError on invalid or wrongly sized input)."""
+        buffer = bytes.fromhex("".join(hex_digests))
+        if len(buffer) != len(hex_digests) * digest_size:
+            raise ValueError(f"Hex digests must all be {digest_size} bytes")
+        return cls(buffer, digest_size)
+
+    def __len__(self) -> int:
+        return len(self.buffer) // self.digest_size
+
+    def __getitem__(self, index: int) -> bytes:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("digest index out of range")
+        start = index * self.digest_size
+        return bytes(self.buffer[start:start + self.digest_size])
+
+    def __iter__(self) -> Iterator[bytes]:
+        view = memoryview(self.buffer)
+        for start in range(0, len(self.buffer), self.digest_size):
+            yield bytes(view[start:start + self.digest_size])
+
+    def hex(self, index: int) -> str:
+        return self[index].hex()
+
+    def hexdigests(self) -> List[str]:
+        """All digests as hex strings (the API boundary representation)."""
+        hex_buffer = self.buffer.hex()
+        width = 2 * self.digest_size
+        return [hex_buffer[i:i + width] for i in range(0, len(hex_buffer), width)]
+
+
+def _hash_range(new: Callable[[BytesLike], Any], buffers: Sequence[BytesLike], start: int, stop: int) -> bytes:
+    return b"".join([new(buffers[i]).digest() for i in range(start, stop)])
+
+
+def hash_many(
+    buffers: Sequence[BytesLike],
+    algorithm: str = "sha256",
+    workers: Optional[int] = None,
+    parallel_min_bytes: int = BATCH_HASH_PARALLEL_MIN_BYTES,
+) -> DigestBatch:
+    """
+    Hash many byte buffers into one contiguous digest buffer.
+
+    Batches whose total size reaches ``parallel_min_bytes`` are split into
+    contiguous ranges hashed on a thread pool and joined in input order.
+
+    Args:
+        buffers: Byte buffers to hash
+        algorithm: "sha256", "sha3-256" or "blake3"
+        workers: Thread count (defaults to the machine's CPU count)
+        parallel_min_bytes: Minimum total input size for using threads
+
+    Returns:
+        DigestBatch with one 32-byte digest per buffer, in input order
+    """
+    new = _hash_constructor(algorithm)
+    count = len(buffers)
+    workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+    workers = min(workers, count)
+    if workers <= 1 or sum(len(buffer) for buffer in buffers) < parallel_min_bytes:
+        return DigestBatch(_hash_range(new, buffers, 0, count))
+
+    bounds = [count * w // workers for w in range(workers + 1)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chunks = pool.map(lambda w: _hash_range(new, buffers, bounds[w], bounds[w + 1]), range(workers))
+        return DigestBatch(b"".join(chunks))
+
+
+def hash_pairs(nodes: Union[DigestBatch, Sequence[BytesLike]], algorithm: str = "sha256") -> DigestBatch:
+    """
+    Hash consecutive complete pairs of nodes (0+1, 2+3, ...) into parent digests.
+
+    A trailing unpaired node is ignored, as in the stored Merkle levels.
+
+    Args:
+        nodes: Child nodes as a DigestBatch or a sequence of raw byte strings
+        algorithm: "sha256", "sha3-256" or "blake3"
+
+    Returns:
+        DigestBatch of len(nodes) // 2 parent digests
+    """
+    new = _hash_constructor(algorithm)
+    parents = len(nodes) // 2
+    if isinstance(nodes, DigestBatch) and nodes.digest_size == DIGEST_SIZE:
+        # Sibling pairs are adjacent 64-byte slices of the child buffer
+        buffer = bytes(nodes.buffer)
+        pair_size = 2 * DIGEST_SIZE
+        return DigestBatch(b"".join([
+            new(buffer[i:i + pair_size]).digest() for i in range(0, parents * pair_size, pair_size)
+        ]))
+    return DigestBatch(b"".join([new(nodes[2 * i] + nodes[2 * i + 1]).digest() for i in range(parents)]))
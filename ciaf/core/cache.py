@@ -0,0 +1,164 @@
+"""
+Bounded LRU caching primitives for CIAF core components.
+
+Provides an entry- and byte-bounded LRU cache with hit, miss and eviction
+counters. Caches can report into a shared CacheMetrics accumulator so that
+process-wide totals survive individual cache owners (e.g. short-lived
+Merkle trees) being garbage collected.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class CacheMetrics:
+    """Thread-safe hit/miss/eviction counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def record(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class BoundedLRUCache:
+    """
+    Least-recently-used cache bounded by entry count and approximate byte size.
+
+    Args:
+        max_entries: Maximum number of entries (0 disables caching)
+        max_bytes: Maximum total size as reported by ``sizeof`` (None for no byte bound)
+        sizeof: Callable returning the approximate size of a (key, value) pair
+        parent_metrics: Optional shared accumulator that also receives every count
+        on_evict: Optional callable invoked with (key, value) for each LRU eviction,
+            outside the cache lock
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Hashable, Any], int]] = None,
+        parent_metrics: Optional[CacheMetrics] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda key, value: 0)
+        self._parent = parent_metrics
+        self._on_evict = on_evict
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self.metrics = CacheMetrics()
+
+    def _record(self, hits: int = 0, misses: int = 0, evictions: int = 0) -> None:
+        self.metrics.record(hits, misses, evictions)
+        if self._parent is not None:
+            self._parent.record(hits, misses, evictions)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value (marking it most recently used) or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            self._record(misses=1)
+            return default
+        self._record(hits=1)
+        return entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Insert or replace an entry, evicting least-recently-used entries as needed."""
+        if self.max_entries == 0:
+            return
+        size = self._sizeof(key, value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                evicted_key, (evicted_value, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                evicted.append((evicted_key, evicted_value))
+        if evicted:
+            self._record(evictions=len(evicted))
+            if self._on_evict is not None:
+                for evicted_key, evicted_value in evicted:
+                    self._on_evict(evicted_key, evicted_value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry without counting it as an eviction."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.metrics.to_dict()
+        stats.update({
+            "size": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        })
+        return stats
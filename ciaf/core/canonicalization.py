@@ -18,14 +18,30 @@ Version: 1.0.0
 
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Optional fast JSON backend
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .crypto import sha256_hash, compute_hash
 from .enums import RecordType, HashAlgorithm
 from .constants import ANCHOR_SCHEMA_VERSION
 from .interfaces import Signer
+from .merkle import (
+    build_consistency_proof,
+    build_multiproof,
+    derive_right_edge,
+    extend_levels,
+    verify_consistency_proof,
+    verify_multiproof,
+)
 from .signers import Ed25519Signer, Ed25519Verifier
 
 
@@ -83,14 +99,13 @@ class AnchorRecord:
     
     def get_anchor_bytes(self) -> bytes:
         """Get canonical anchor bytes for signing."""
-        anchor_data = {
-            "root": self.root,
-            "policy_id": self.policy_id,
-            "schema_version": self.schema_version,
-            "timestamp": self.timestamp,
-            "domain_labels": sorted(self.domain_labels)
-        }
-        return canonical_json(anchor_data).encode('utf-8')
+        return ANCHOR_SIGNING_SCHEMA.encode_parts({
+            "root": _canonical_value(self.root),
+            "policy_id": _canonical_value(self.policy_id),
+            "schema_version": _canonical_value(self.schema_version),
+            "timestamp": _canonical_value(self.timestamp),
+            "domain_labels": canonical_json(sorted(self.domain_labels))
+        }).encode('utf-8')
 
 
 @dataclass
@@ -100,16 +115,18 @@ class Receipt:
     anchor: AnchorRecord
     leaf_hash: str
     record_type: RecordType
+    # Set when the anchor is signed as part of an epoch (see epoch_signing.EpochProof)
+    epoch_proof: Optional[Any] = None
     
     def get_receipt_hash(self) -> str:
         """Get hash of complete receipt."""
-        receipt_data = {
-            "metadata": self.metadata,
-            "anchor": asdict(self.anchor),
-            "leaf_hash": self.leaf_hash,
-            "record_type": self.record_type.value
-        }
-        return sha256_hash(canonical_json(receipt_data).encode('utf-8'))
+        receipt_json = RECEIPT_SCHEMA.encode_parts({
+            "metadata": canonical_json(self.metadata),
+            "anchor": ANCHOR_RECORD_SCHEMA.encode_object(self.anchor),
+            "leaf_hash": _canonical_value(self.leaf_hash),
+            "record_type": _canonical_value(self.record_type.value)
+        })
+        return sha256_hash(receipt_json.encode('utf-8'))
 
 
 class MockSigner:
@@ -144,11 +161,72 @@ def create_production_signer(key_id: str = "ciaf_production_key") -> Ed25519Sign
     return Ed25519Signer(key_id)
 
 
+# Reused stdlib encoder: json.dumps() builds a new JSONEncoder for every call with non-default options
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'), ensure_ascii=True)
+
+if ORJSON_AVAILABLE:
+    # Subclasses are passed through, which makes orjson raise and the stdlib encoder take over
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+# Scalar types orjson encodes byte-identically to the stdlib encoder
+_ORJSON_SCALARS = frozenset((str, int, bool, type(None)))
+
+
+def _orjson_eligible(data: Any) -> bool:
+    """
+    Check that a document holds only JSON-native types orjson and the stdlib agree on.
+
+    orjson natively encodes types the stdlib rejects (UUID, Enum, datetime,
+    dataclasses, numpy arrays) and formats floats differently, so anything
+    other than exact dict/list/tuple containers of str, int, bool and None
+    is left to the stdlib encoder, which keeps both paths raising the same
+    TypeError for non-JSON input.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        for item in (value.values() if type(value) is dict else value):
+            item_type = type(item)
+            if item_type is dict or item_type is list or item_type is tuple:
+                stack.append(item)
+            elif item_type not in _ORJSON_SCALARS:
+                return False
+    return True
+
+
+def _orjson_canonical(data: Any) -> Optional[str]:
+    """
+    Canonical JSON via orjson, or None when the output might differ from the stdlib.
+
+    Only container documents passing _orjson_eligible() are encoded. orjson
+    writes non-ASCII text unescaped, so any output containing non-ASCII
+    bytes or DEL is handed back to the stdlib encoder as well.
+    """
+    data_type = type(data)
+    if not (data_type is dict or data_type is list or data_type is tuple) or not _orjson_eligible(data):
+        return None
+    try:
+        out = orjson.dumps(data, option=_ORJSON_OPTIONS)
+    except (orjson.JSONEncodeError, TypeError):
+        return None
+    if not out.isascii() or b'\x7f' in out:
+        return None
+    return out.decode('ascii')
+
+
+def canonical_json_stdlib(data: Any) -> str:
+    """Reference canonical JSON encoding (stdlib only); canonical_json() output is identical."""
+    return _CANONICAL_ENCODER.encode(data)
+
+
 def canonical_json(data: Dict[str, Any]) -> str:
     """
     Convert data to canonical JSON representation.
     
     Non-bypassable invariant: all metadata must be canonicalized before hashing.
+    Output is sorted-key, compact, ASCII-escaped JSON. When orjson is installed
+    it is used for documents it encodes byte-identically to the stdlib;
+    everything else goes through a cached stdlib encoder.
     
     Args:
         data: Dictionary to canonicalize
@@ -156,7 +234,78 @@ def canonical_json(data: Dict[str, Any]) -> str:
     Returns:
         Canonical JSON string
     """
-    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
+    if ORJSON_AVAILABLE:
+        fast = _orjson_canonical(data)
+        if fast is not None:
+            return fast
+    return _CANONICAL_ENCODER.encode(data)
+
+
+def _canonical_value(value: Any) -> str:
+    """Canonical JSON for a single value, short-circuiting common scalar types."""
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return 'null'
+    if value_type is bool:
+        return 'true' if value else 'false'
+    if value_type is int:
+        return int.__repr__(value)
+    return canonical_json(value)
+
+
+class CanonicalSchema:
+    """
+    Precompiled canonical JSON layout for records with a fixed set of fields.
+
+    The sorted key order and the encoded key prefixes are computed once, so
+    encoding a record only encodes its values. Output is identical to
+    canonical_json() of the equivalent dictionary.
+
+    Args:
+        field_names: Top-level field names of the record
+    """
+    
+    def __init__(self, field_names: Iterable[str]):
+        self.fields: Tuple[str, ...] = tuple(sorted(field_names))
+        self._prefixes = tuple(
+            ('{' if i == 0 else ',') + encode_basestring_ascii(name) + ':'
+            for i, name in enumerate(self.fields)
+        )
+    
+    @classmethod
+    def for_dataclass(cls, dataclass_type: type) -> "CanonicalSchema":
+        """Schema for all fields of a dataclass (as serialized by asdict())."""
+        return cls(f.name for f in fields(dataclass_type))
+    
+    def encode_parts(self, encoded: Mapping[str, str]) -> str:
+        """Join already-encoded field values (missing fields raise KeyError)."""
+        if not self.fields:
+            return '{}'
+        parts = []
+        for prefix, name in zip(self._prefixes, self.fields):
+            parts.append(prefix)
+            parts.append(encoded[name])
+        parts.append('}')
+        return ''.join(parts)
+    
+    def encode(self, values: Mapping[str, Any]) -> str:
+        """Encode a mapping holding exactly the schema's fields."""
+        if len(values) != len(self.fields):
+            raise ValueError(f"Expected fields {list(self.fields)}, got {sorted(values)}")
+        return self.encode_parts({name: _canonical_value(values[name]) for name in self.fields})
+    
+    def encode_object(self, obj: Any) -> str:
+        """Encode the schema's fields read as attributes of ``obj`` (e.g. a flat dataclass)."""
+        return self.encode_parts({name: _canonical_value(getattr(obj, name)) for name in self.fields})
+
+
+# Fixed-shape records
+ANCHOR_SIGNING_SCHEMA = CanonicalSchema(["root", "policy_id", "schema_version", "timestamp", "domain_labels"])
+ANCHOR_RECORD_SCHEMA = CanonicalSchema.for_dataclass(AnchorRecord)
+RECEIPT_SCHEMA = CanonicalSchema(["metadata", "anchor", "leaf_hash", "record_type"])
+CAPSULE_CONTENT_SCHEMA = CanonicalSchema(["metadata", "merkle_path", "anchor", "leaf_hash", "record_type"])
 
 
 def canonicalize_and_hash(
@@ -251,8 +400,21 @@ class WORMMerkleTree:
         self.leaves: List[str] = []
         self.hash_table: Dict[str, Dict[str, Any]] = {}  # leaf_hash -> metadata
         self.anchors: List[AnchorRecord] = []
+        # Signed epoch anchors covering the (unsigned) record anchors in epoch mode
+        self.epoch_anchors: List[AnchorRecord] = []
         self.hash_algorithm = hash_algorithm
         self.root_cache: Optional[str] = None
+        
+        # Level arrays grown on append: level k+1 holds parents of complete
+        # pairs on level k; unpaired right-edge nodes are derived per append
+        self._levels: List[List[str]] = [self.leaves]
+        self._right_edge: List[Optional[str]] = []
+        self._leaf_positions: Dict[str, int] = {}
+    
+    @staticmethod
+    def _hash_pair(left: str, right: str) -> str:
+        """Parent hash using deterministic byte concatenation."""
+        return sha256_hash(bytes.fromhex(left) + bytes.fromhex(right))
     
     def add_leaf(self, leaf_hash: str) -> str:
         """Add leaf implementing unified Merkle interface."""
@@ -273,14 +435,19 @@ class WORMMerkleTree:
         if leaf_hash in self.hash_table:
             raise ValueError(f"Leaf {leaf_hash} already exists (WORM violation)")
         
+        # Validate before mutating so a bad leaf cannot corrupt the levels
+        bytes.fromhex(leaf_hash)
+        
         # Append to leaves and hash table
+        self._leaf_positions[leaf_hash] = len(self.leaves)
         self.leaves.append(leaf_hash)
         self.hash_table[leaf_hash] = metadata
         
-        # Invalidate root cache
-        self.root_cache = None
+        # Extend the rightmost path and refresh the root in O(log n)
+        extend_levels(self._levels, self._hash_pair)
+        self.root_cache = self._compute_root()
         
-        return self.get_root()
+        return self.root_cache
     
     def get_root(self) -> str:
         """Get current Merkle root."""
@@ -289,29 +456,18 @@ class WORMMerkleTree:
         return self.root_cache
     
     def _compute_root(self) -> str:
-        """Compute Merkle root from current leaves."""
+        """Compute Merkle root from the cached levels."""
         if not self.leaves:
+            self._right_edge = []
             return sha256_hash(b"empty_tree")
         
-        if len(self.leaves) == 1:
-            return self.leaves[0]
-        
-        # Build tree bottom-up with deterministic byte concatenation
-        current_level = self.leaves[:]
-        
-        while len(current_level) > 1:
-            next_level = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                right = current_level[i + 1] if i + 1 < len(current_level) else left
-                
-                # Use byte concatenation for deterministic results
-                parent_hash = sha256_hash(bytes.fromhex(left) + bytes.fromhex(right))
-                next_level.append(parent_hash)
-            
-            current_level = next_level
-        
-        return current_level[0]
+        self._right_edge, root = derive_right_edge(self._levels, self._hash_pair)
+        return root
+    
+    def _get_node(self, level_index: int, index: int) -> str:
+        """Read a node from the cached levels (including right-edge nodes)."""
+        level = self._levels[level_index] if level_index < len(self._levels) else []
+        return level[index] if index < len(level) else self._right_edge[level_index]
     
     def get_proof(self, leaf_hash: str) -> List[Tuple[str, str]]:
         """Get Merkle proof implementing unified interface."""
@@ -327,41 +483,84 @@ class WORMMerkleTree:
         Returns:
             List of (sibling_hash, position) tuples where position is "left" or "right"
         """
-        if leaf_hash not in self.leaves:
+        if leaf_hash not in self._leaf_positions:
             raise ValueError(f"Leaf {leaf_hash} not found in tree")
         
-        leaf_index = self.leaves.index(leaf_hash)
+        self.get_root()  # ensure right-edge nodes are current
+        
         proof = []
-        current_level = self.leaves[:]
-        current_index = leaf_index
+        current_index = self._leaf_positions[leaf_hash]
         
-        while len(current_level) > 1:
-            # Find sibling and determine position
+        for level_index, extra in enumerate(self._right_edge[:-1]):
+            level_size = (len(self._levels[level_index]) if level_index < len(self._levels) else 0) + (extra is not None)
             if current_index % 2 == 0:
-                # Current is left child, sibling is right
-                sibling_index = current_index + 1
-                if sibling_index < len(current_level):
-                    proof.append((current_level[sibling_index], "right"))
-                else:
-                    proof.append((current_level[current_index], "right"))  # Self if no right sibling
+                # Current is left child, sibling is right (self if no right sibling)
+                sibling_index = current_index + 1 if current_index + 1 < level_size else current_index
+                proof.append((self._get_node(level_index, sibling_index), "right"))
             else:
                 # Current is right child, sibling is left
-                sibling_index = current_index - 1
-                proof.append((current_level[sibling_index], "left"))
-            
-            # Move up one level with deterministic byte concatenation
-            next_level = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                right = current_level[i + 1] if i + 1 < len(current_level) else left
-                parent_hash = sha256_hash(bytes.fromhex(left) + bytes.fromhex(right))
-                next_level.append(parent_hash)
+                proof.append((self._get_node(level_index, current_index - 1), "left"))
             
-            current_level = next_level
             current_index = current_index // 2
         
         return proof
     
+    def get_multiproof(self, leaf_hashes: List[str]) -> Dict[str, Any]:
+        """
+        Get a compact multiproof proving several leaves against the current root.
+        
+        Args:
+            leaf_hashes: Hashes of the leaves (duplicates are ignored)
+            
+        Returns:
+            Multiproof with deduplicated sibling nodes (see verify_multiproof)
+        """
+        positions = {}
+        for leaf_hash in leaf_hashes:
+            if leaf_hash not in self._leaf_positions:
+                raise ValueError(f"Leaf {leaf_hash} not found in tree")
+            positions[self._leaf_positions[leaf_hash]] = leaf_hash
+        
+        self.get_root()  # ensure right-edge nodes are current
+        
+        indices = sorted(positions)
+        return {
+            "leaf_count": len(self.leaves),
+            "indices": indices,
+            "leaf_hashes": [positions[i] for i in indices],
+            "nodes": build_multiproof(indices, len(self.leaves), self._get_node)
+        }
+    
+    def verify_multiproof(self, multiproof: Dict[str, Any], root: str) -> bool:
+        """Verify a multiproof in a single bottom-up pass."""
+        return verify_multiproof(multiproof, root)
+    
+    def get_consistency_proof(self, old_size: int) -> Dict[str, Any]:
+        """
+        Prove that the ledger at ``old_size`` leaves is a prefix of the current ledger.
+        
+        Lets external monitors holding an earlier (size, root) pair confirm that
+        the current root was reached by appends only, with O(log n) nodes.
+        
+        Args:
+            old_size: Earlier leaf count (1 <= old_size <= current leaf count)
+            
+        Returns:
+            Consistency proof (see verify_consistency_proof)
+        """
+        self.get_root()  # ensure right-edge nodes are current
+        
+        new_size = len(self.leaves)
+        return {
+            "old_size": old_size,
+            "new_size": new_size,
+            "nodes": build_consistency_proof(old_size, new_size, self._get_node)
+        }
+    
+    def verify_consistency_proof(self, proof: Dict[str, Any], old_root: str, new_root: str) -> bool:
+        """Verify a consistency proof without access to the tree."""
+        return verify_consistency_proof(proof, old_root, new_root)
+    
     def verify_proof(self, leaf_hash: str, proof: List[Tuple[str, str]], root: str) -> bool:
         """Verify Merkle inclusion proof implementing unified interface."""
         return self.verify_merkle_path(leaf_hash, proof, root)
@@ -406,6 +605,19 @@ class WORMMerkleTree:
     def get_latest_anchor(self) -> Optional[AnchorRecord]:
         """Get the most recent anchor."""
         return self.anchors[-1] if self.anchors else None
+    
+    def append_epoch_anchor(self, anchor: AnchorRecord) -> None:
+        """
+        Append a signed epoch anchor to the WORM log.
+        
+        Its root is the epoch Merkle root over record anchors, not a ledger root.
+        
+        Args:
+            anchor: Signed epoch anchor (see epoch_signing.EpochSigner)
+        """
+        if not anchor.signature:
+            raise ValueError("Epoch anchor must be signed")
+        self.epoch_anchors.append(anchor)
 
 
 class CapsuleBuilder:
@@ -512,18 +724,16 @@ class CapsuleBuilder:
                 verification_results["policy_compliant"] = False
         
         # Create capsule content for hashing
-        capsule_content = {
-            "metadata": metadata,
-            "merkle_path": merkle_path,
-            "anchor": asdict(anchor),
-            "leaf_hash": leaf_hash,
-            "record_type": record_type.value
-        }
+        capsule_content = CAPSULE_CONTENT_SCHEMA.encode_parts({
+            "metadata": canonical_json(metadata),
+            "merkle_path": canonical_json(merkle_path),
+            "anchor": ANCHOR_RECORD_SCHEMA.encode_object(anchor),
+            "leaf_hash": _canonical_value(leaf_hash),
+            "record_type": _canonical_value(record_type.value)
+        })
         
         # Calculate capsule hash
-        verification_results["capsule_hash"] = sha256_hash(
-            canonical_json(capsule_content).encode('utf-8')
-        )
+        verification_results["capsule_hash"] = sha256_hash(capsule_content.encode('utf-8'))
         
         # Build complete capsule
         capsule = {
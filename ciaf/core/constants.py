@@ -30,6 +30,58 @@ DEFAULT_PUBKEY_ID = "ciaf_production_key_001"
 # Hash Algorithm Properties
 HASH_OUTPUT_LENGTH = 64  # SHA-256 produces 64 hex chars
 
+# Merkle proof/verification cache bounds (per tree)
+MERKLE_PROOF_CACHE_SIZE = 4096  # entries
+MERKLE_PROOF_CACHE_BYTES = 16 * 1024 * 1024  # approximate payload bytes
+MERKLE_VERIFICATION_CACHE_SIZE = 16384  # entries
+
+# Batch hashing: smaller batches are hashed on the calling thread
+BATCH_HASH_PARALLEL_MIN_BYTES = 1024 * 1024
+
+# Epoch anchor signing: an epoch is sealed at whichever bound is reached first
+ANCHOR_EPOCH_MAX_RECORDS = 1024  # record anchors per epoch
+ANCHOR_EPOCH_MAX_SECONDS = 1.0  # epoch window
+ANCHOR_EPOCH_MAX_RETAINED = 256  # sealed epochs kept for get_proof()
+
+# Batch signature verification
+SIGNATURE_VERIFY_CHUNK_SIZE = 1024  # signatures per worker task
+SIGNATURE_VERIFY_PARALLEL_MIN = 4096  # smaller batches are verified in-process
+
+# Bulk AES-GCM encryption/decryption
+AES_GCM_BULK_CHUNK_SIZE = 512  # items per worker task
+AES_GCM_BULK_PARALLEL_MIN_BYTES = 32 * 1024 * 1024  # smaller batches run in-process
+
+# Bulk provenance capsule construction (ProvenanceCapsuleFactory)
+CAPSULE_FACTORY_CHUNK_SIZE = 64  # capsules per worker task (one PBKDF2 derivation each)
+CAPSULE_FACTORY_PARALLEL_MIN = 128  # smaller batches are built in-process
+
+# KeyManager key handle cache
+KEY_HANDLE_CACHE_SIZE = 64  # loaded key bundles and signers
+KEY_HANDLE_CACHE_TTL_SECONDS = 60.0  # reload age for changes made outside the manager
+
+# Nonce replay detection (crypto_health.NonceTracker)
+NONCE_WINDOW_SECONDS = 3600.0  # exact replay detection horizon
+NONCE_WINDOW_BUCKETS = 8  # rotating hash sets per window
+NONCE_TRACKER_MAX_SIZE = 10000  # exact entries before the oldest bucket is dropped early
+NONCE_BLOOM_ERROR_RATE = 1e-6  # target false-positive rate of the long-horizon Bloom filter
+NONCE_BLOOM_INITIAL_CAPACITY = 65536  # nonces in the first Bloom filter of a generation
+
+# MetadataStorage SQLite backend
+METADATA_SCHEMA_VERSION = 1  # stored in PRAGMA user_version
+METADATA_SQLITE_POOL_SIZE = 5  # pooled connections per database
+METADATA_SQLITE_TIMEOUT_SECONDS = 30.0  # busy timeout and pool checkout wait
+METADATA_WRITE_FLUSH_INTERVAL_SECONDS = 0.05  # write-behind: max wait to fill a batch
+METADATA_WRITE_RETRY_ATTEMPTS = 4  # write-behind: tries per batch before it is reported as failed
+METADATA_WRITE_RETRY_BACKOFF_SECONDS = 0.05  # write-behind: first retry delay, doubled per retry
+METADATA_INDEX_FILENAME = "metadata_index.jsonl"  # json/pickle backends: ID and model index
+METADATA_SEGMENT_MAX_BYTES = 64 * 1024 * 1024  # segment backend: size at which a segment is sealed
+METADATA_SEGMENT_COMPACTION_RATIO = 0.5  # dead share of a sealed segment that triggers compaction
+METADATA_SEGMENT_COMPACTION_INTERVAL_SECONDS = 60.0  # background compaction pass interval
+
+# Master anchor (PBKDF2) derivation cache, process-wide
+MASTER_ANCHOR_CACHE_SIZE = 256  # entries
+MASTER_ANCHOR_CACHE_TTL_SECONDS = 900.0  # lifetime of a derived anchor
+
 # IDs / Misc
 EVENT_ID_PREFIX = "evt"
 
@@ -10,7 +10,12 @@ Version: 1.1.0
 import hashlib
 import hmac
 import os
-from typing import Optional
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 # Optional blake3
 try:
@@ -19,10 +24,19 @@ try:
 except ImportError:
     BLAKE3_AVAILABLE = False
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-from .constants import SALT_LENGTH, PBKDF2_ITERATIONS, KDF_DKLEN
+from .cache import CacheMetrics
+from .constants import (
+    AES_GCM_BULK_CHUNK_SIZE,
+    AES_GCM_BULK_PARALLEL_MIN_BYTES,
+    SALT_LENGTH,
+    PBKDF2_ITERATIONS,
+    KDF_DKLEN,
+    MASTER_ANCHOR_CACHE_SIZE,
+    MASTER_ANCHOR_CACHE_TTL_SECONDS,
+)
 
 
 def make_aad(dataset_anchor_hex: str, capsule_id: str, policy_id: str) -> bytes:
@@ -42,22 +56,132 @@ def make_aad(dataset_anchor_hex: str, capsule_id: str, policy_id: str) -> bytes:
     return f"{dataset_anchor_hex}|{capsule_id}|{policy_id}".encode("utf-8")
 
 
+AES_GCM_NONCE_LENGTH = 12
+AES_GCM_TAG_LENGTH = 16
+
+
 def encrypt_aes_gcm(key: bytes, plaintext: bytes, aad: Optional[bytes] = None) -> tuple[bytes, bytes, bytes]:
-    nonce = os.urandom(12)
-    cipher = Cipher(algorithms.AES(key), modes.GCM(nonce), backend=default_backend())
-    enc = cipher.encryptor()
-    if aad:
-        enc.authenticate_additional_data(aad)
-    ciphertext = enc.update(plaintext) + enc.finalize()
-    return ciphertext, nonce, enc.tag
+    nonce = os.urandom(AES_GCM_NONCE_LENGTH)
+    sealed = AESGCM(key).encrypt(nonce, plaintext, aad or None)
+    return sealed[:-AES_GCM_TAG_LENGTH], nonce, sealed[-AES_GCM_TAG_LENGTH:]
 
 
 def decrypt_aes_gcm(key: bytes, ciphertext: bytes, nonce: bytes, tag: bytes, aad: Optional[bytes] = None) -> bytes:
-    cipher = Cipher(algorithms.AES(key), modes.GCM(nonce, tag), backend=default_backend())
-    dec = cipher.decryptor()
-    if aad:
-        dec.authenticate_additional_data(aad)
-    return dec.update(ciphertext) + dec.finalize()
+    return AESGCM(key).decrypt(nonce, ciphertext + tag, aad or None)
+
+
+EncryptItem = Tuple[bytes, bytes, Optional[bytes]]
+DecryptItem = Tuple[bytes, bytes, bytes, bytes, Optional[bytes]]
+
+
+def _encrypt_chunk(items: Sequence[EncryptItem]) -> List[tuple[bytes, bytes, bytes]]:
+    contexts: Dict[bytes, AESGCM] = {}
+    results = []
+    for key, plaintext, aad in items:
+        context = contexts.get(key)
+        if context is None:
+            context = contexts[key] = AESGCM(key)
+        nonce = os.urandom(AES_GCM_NONCE_LENGTH)
+        sealed = context.encrypt(nonce, plaintext, aad or None)
+        results.append((sealed[:-AES_GCM_TAG_LENGTH], nonce, sealed[-AES_GCM_TAG_LENGTH:]))
+    return results
+
+
+def _decrypt_chunk(items: Sequence[DecryptItem]) -> List[Optional[bytes]]:
+    contexts: Dict[bytes, AESGCM] = {}
+    results: List[Optional[bytes]] = []
+    for key, ciphertext, nonce, tag, aad in items:
+        context = contexts.get(key)
+        if context is None:
+            context = contexts[key] = AESGCM(key)
+        try:
+            results.append(context.decrypt(nonce, ciphertext + tag, aad or None))
+        except InvalidTag:
+            results.append(None)
+    return results
+
+
+def _run_bulk(
+    worker: Callable[[Sequence[Any]], List[Any]],
+    items: List[Any],
+    payload_bytes: int,
+    workers: Optional[int],
+    chunk_size: int,
+    parallel_min_bytes: int
+) -> List[Any]:
+    workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+    chunk_size = max(1, chunk_size)
+    if workers == 1 or payload_bytes < parallel_min_bytes or len(items) < 2 * chunk_size:
+        return worker(items)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [result for chunk in pool.map(worker, chunks) for result in chunk]
+
+
+def encrypt_aes_gcm_many(
+    items: Iterable[EncryptItem],
+    workers: Optional[int] = None,
+    chunk_size: int = AES_GCM_BULK_CHUNK_SIZE,
+    parallel_min_bytes: int = AES_GCM_BULK_PARALLEL_MIN_BYTES
+) -> List[tuple[bytes, bytes, bytes]]:
+    """
+    AES-GCM-encrypt many (key, plaintext, aad) items.
+    
+    One AESGCM context is built per distinct key and reused for all of its
+    items, and every item gets a fresh random nonce. Batches whose total
+    plaintext size reaches ``parallel_min_bytes`` are split into chunks and
+    encrypted on a process pool; smaller batches, or ``workers=1``, run
+    in-process.
+    
+    Args:
+        items: Iterable of (key, plaintext, aad) tuples; aad may be None
+        workers: Pool size (defaults to the machine's CPU count)
+        chunk_size: Items per worker task
+        parallel_min_bytes: Minimum total plaintext size for using the process pool
+        
+    Returns:
+        List of (ciphertext, nonce, tag) tuples in input order, as encrypt_aes_gcm() returns
+    """
+    items = list(items)
+    payload_bytes = sum(len(plaintext) for _, plaintext, _ in items)
+    return _run_bulk(_encrypt_chunk, items, payload_bytes, workers, chunk_size, parallel_min_bytes)
+
+
+def decrypt_aes_gcm_many(
+    items: Iterable[DecryptItem],
+    workers: Optional[int] = None,
+    chunk_size: int = AES_GCM_BULK_CHUNK_SIZE,
+    parallel_min_bytes: int = AES_GCM_BULK_PARALLEL_MIN_BYTES,
+    raise_on_error: bool = True
+) -> List[Optional[bytes]]:
+    """
+    AES-GCM-decrypt many (key, ciphertext, nonce, tag, aad) items.
+    
+    Contexts are reused per key and large batches are spread across a
+    process pool exactly as in encrypt_aes_gcm_many().
+    
+    Args:
+        items: Iterable of (key, ciphertext, nonce, tag, aad) tuples; aad may be None
+        workers: Pool size (defaults to the machine's CPU count)
+        chunk_size: Items per worker task
+        parallel_min_bytes: Minimum total ciphertext size for using the process pool
+        raise_on_error: Raise InvalidTag if any item fails authentication;
+            when False, failed items are returned as None
+        
+    Returns:
+        List of plaintexts in input order
+        
+    Raises:
+        InvalidTag: If an item fails authentication and raise_on_error is True
+    """
+    items = list(items)
+    payload_bytes = sum(len(ciphertext) for _, ciphertext, _, _, _ in items)
+    results = _run_bulk(_decrypt_chunk, items, payload_bytes, workers, chunk_size, parallel_min_bytes)
+    if raise_on_error:
+        failed = [i for i, plaintext in enumerate(results) if plaintext is None]
+        if failed:
+            raise InvalidTag(f"AES-GCM authentication failed for {len(failed)} item(s), first at index {failed[0]}")
+    return results
 
 
 def sha256_hash(data: bytes) -> str:
@@ -105,11 +229,174 @@ def derive_anchor_from_master(master_password: str, dataset_id: str) -> bytes:
     return bytes.fromhex(hmac_sha256(key_bytes, data_bytes))
 
 
-def derive_master_anchor(password: str, salt: bytes) -> bytes:
+def _pbkdf2_master_anchor(password: str, salt: bytes) -> bytes:
     password_bytes = password.encode("utf-8")
     return hashlib.pbkdf2_hmac("sha256", password_bytes, salt, PBKDF2_ITERATIONS, dklen=KDF_DKLEN)
 
 
+class MasterAnchorCache:
+    """
+    Process-wide cache of PBKDF2-derived master anchors.
+
+    Entries are keyed by an HMAC-SHA256 digest of the password, salt and KDF
+    parameters under a random per-cache key, so neither the plaintext password
+    nor a digest that could be brute-forced offline is ever held. Derived
+    anchors are kept in mutable buffers that are overwritten with zeros when
+    an entry expires, is evicted or the cache is cleared.
+
+    Args:
+        max_entries: Maximum number of cached anchors (0 disables caching)
+        ttl_seconds: Lifetime of an entry after it is derived (None for no expiry)
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MASTER_ANCHOR_CACHE_SIZE,
+        ttl_seconds: Optional[float] = MASTER_ANCHOR_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._key = os.urandom(32)
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, tuple[bytearray, float]]" = OrderedDict()
+        self.metrics = CacheMetrics()
+        self.expirations = 0
+
+    def _cache_key(self, password: str, salt: bytes) -> bytes:
+        password_bytes = password.encode("utf-8")
+        mac = hmac.new(self._key, digestmod=hashlib.sha256)
+        mac.update(struct.pack(">III", PBKDF2_ITERATIONS, KDF_DKLEN, len(password_bytes)))
+        mac.update(password_bytes)
+        mac.update(bytes(salt))
+        return mac.digest()
+
+    @staticmethod
+    def _zeroize(buffer: bytearray) -> None:
+        buffer[:] = bytes(len(buffer))
+
+    def _discard_locked(self, key: bytes) -> None:
+        buffer, _ = self._entries.pop(key)
+        self._zeroize(buffer)
+
+    def get_or_derive(self, password: str, salt: bytes) -> bytes:
+        """
+        Return the master anchor for a password and salt, deriving it on a miss.
+
+        Args:
+            password: Master password
+            salt: PBKDF2 salt
+
+        Returns:
+            Derived master anchor bytes (a copy; the cached buffer stays private)
+        """
+        if self.max_entries == 0:
+            self.metrics.record(misses=1)
+            return _pbkdf2_master_anchor(password, salt)
+
+        key = self._cache_key(password, salt)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self.ttl_seconds is not None and self._clock() >= entry[1]:
+                    self._discard_locked(key)
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.metrics.record(hits=1)
+                    return bytes(entry[0])
+        self.metrics.record(misses=1)
+
+        anchor = _pbkdf2_master_anchor(password, salt)
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+        evicted = 0
+        with self._lock:
+            if key in self._entries:
+                self._discard_locked(key)
+            self._entries[key] = (bytearray(anchor), expires_at)
+            while len(self._entries) > self.max_entries:
+                self._discard_locked(next(iter(self._entries)))
+                evicted += 1
+        if evicted:
+            self.metrics.record(evictions=evicted)
+        return anchor
+
+    def evict(self, password: str, salt: bytes) -> bool:
+        """Remove and zeroize the entry for a password and salt; returns True if one existed."""
+        key = self._cache_key(password, salt)
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._discard_locked(key)
+        self.metrics.record(evictions=1)
+        return True
+
+    def purge_expired(self) -> int:
+        """Remove and zeroize all expired entries; returns the number removed."""
+        if self.ttl_seconds is None:
+            return 0
+        now = self._clock()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._entries.items() if now >= expires_at]
+            for key in expired:
+                self._discard_locked(key)
+            self.expirations += len(expired)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Zeroize and drop all entries and rotate the keying secret (counters are kept)."""
+        with self._lock:
+            for buffer, _ in self._entries.values():
+                self._zeroize(buffer)
+            self._entries.clear()
+            self._key = os.urandom(32)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.metrics.to_dict()
+        stats.update({
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        })
+        return stats
+
+
+_master_anchor_cache = MasterAnchorCache()
+
+
+def get_master_anchor_cache() -> MasterAnchorCache:
+    """Return the process-wide master anchor cache used by derive_master_anchor()."""
+    return _master_anchor_cache
+
+
+def derive_master_anchor(password: str, salt: bytes, use_cache: bool = True) -> bytes:
+    """
+    Derive a master anchor from a password and salt with PBKDF2-HMAC-SHA256.
+
+    Args:
+        password: Master password
+        salt: PBKDF2 salt
+        use_cache: Serve repeated (password, salt) pairs from the process-wide
+            MasterAnchorCache instead of re-running PBKDF2
+
+    Returns:
+        KDF_DKLEN-byte master anchor
+    """
+    if use_cache:
+        return _master_anchor_cache.get_or_derive(password, salt)
+    return _pbkdf2_master_anchor(password, salt)
+
+
 def _derive_hmac_bytes(key: bytes, data: bytes) -> bytes:
     return bytes.fromhex(hmac_sha256(key, data))
 
@@ -158,4 +445,10 @@ class CryptoUtils:
     def decrypt_aes_gcm(key: bytes, ciphertext: bytes, nonce: bytes, tag: bytes, aad: Optional[bytes] = None) -> bytes:
         return decrypt_aes_gcm(key, ciphertext, nonce, tag, aad)
     @staticmethod
+    def encrypt_aes_gcm_many(items: Iterable[EncryptItem], workers: Optional[int] = None) -> List[tuple[bytes, bytes, bytes]]:
+        return encrypt_aes_gcm_many(items, workers)
+    @staticmethod
+    def decrypt_aes_gcm_many(items: Iterable[DecryptItem], workers: Optional[int] = None) -> List[Optional[bytes]]:
+        return decrypt_aes_gcm_many(items, workers)
+    @staticmethod
     def secure_random_bytes(length: int) -> bytes: return secure_random_bytes(length)
\ No newline at end of file
@@ -0,0 +1,285 @@
+"""
+Epoch-based anchor signing for CIAF.
+
+Instead of signing one anchor per committed record, record anchors are
+collected into epochs bounded by a record count and a time window. When an
+epoch is sealed, its anchors are hashed into a Merkle tree and only the epoch
+root is signed. Every record receives an inclusion proof from its anchor to
+the signed epoch root, so signing cost scales with time rather than with
+request volume.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .canonicalization import AnchorRecord, Policy, Receipt, make_anchor
+from .constants import ANCHOR_EPOCH_MAX_RECORDS, ANCHOR_EPOCH_MAX_RETAINED, ANCHOR_EPOCH_MAX_SECONDS
+from .crypto import sha256_hash
+from .interfaces import Signer
+from .merkle import MerkleTree
+
+# Signed domain labels binding an epoch anchor to its position and size
+EPOCH_ID_LABEL = "ciaf_epoch:"
+EPOCH_SIZE_LABEL = "ciaf_epoch_size:"
+
+
+def anchor_leaf_hash(anchor: AnchorRecord) -> str:
+    """Epoch tree leaf for a record anchor: hash of its canonical anchor bytes."""
+    return sha256_hash(anchor.get_anchor_bytes())
+
+
+@dataclass
+class EpochProof:
+    """Inclusion proof of a record anchor in a signed epoch."""
+    epoch_id: int
+    leaf_index: int
+    leaf_hash: str
+    merkle_path: List[Tuple[str, str]]
+    epoch_anchor: AnchorRecord
+
+    def verify(self, anchor: AnchorRecord, verifier: Optional[Any] = None) -> bool:
+        """
+        Verify that a record anchor is covered by the signed epoch root.
+
+        Args:
+            anchor: Record anchor from the receipt
+            verifier: Optional object with verify(data, signature) (e.g. Ed25519Verifier);
+                when omitted only the inclusion proof is checked
+
+        Returns:
+            True if the anchor is included under the epoch root (and the signature is valid)
+        """
+        leaf_hash = anchor_leaf_hash(anchor)
+        if leaf_hash != self.leaf_hash:
+            return False
+        if not MerkleTree.verify_proof_static(leaf_hash, self.epoch_anchor.root, self.merkle_path):
+            return False
+        if verifier is None:
+            return True
+        return verifier.verify(self.epoch_anchor.get_anchor_bytes(), self.epoch_anchor.signature)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "epoch_id": self.epoch_id,
+            "leaf_index": self.leaf_index,
+            "leaf_hash": self.leaf_hash,
+            "merkle_path": [list(step) for step in self.merkle_path],
+            "epoch_anchor": asdict(self.epoch_anchor),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EpochProof":
+        return cls(
+            epoch_id=data["epoch_id"],
+            leaf_index=data["leaf_index"],
+            leaf_hash=data["leaf_hash"],
+            merkle_path=[(sibling, position) for sibling, position in data["merkle_path"]],
+            epoch_anchor=AnchorRecord(**data["epoch_anchor"]),
+        )
+
+
+@dataclass
+class _PendingAnchor:
+    anchor: AnchorRecord
+    leaf_hash: str
+    receipt: Optional[Receipt] = None
+
+
+@dataclass
+class _SealedEpoch:
+    anchor: AnchorRecord
+    tree: MerkleTree
+
+
+class EpochSigner:
+    """
+    Collects record anchors into epochs and signs one Merkle root per epoch.
+
+    An epoch is sealed when it reaches ``max_records`` anchors, when a
+    deadline timer fires ``max_seconds`` after it was opened (or at the next
+    add() past that age), on flush(), or on close(). Receipts passed to add()
+    get their ``epoch_proof`` filled in when their epoch is sealed. Only the
+    ``max_retained_epochs`` most recent epochs are kept for get_proof().
+
+    Args:
+        signer: Signer for epoch roots (e.g. Ed25519Signer)
+        policy: Policy whose identifiers and domain labels are used in anchors
+        max_records: Maximum record anchors per epoch
+        max_seconds: Maximum age of an open epoch before it is sealed
+        clock: Monotonic time source
+        max_retained_epochs: Sealed epochs kept in memory for get_proof()
+        seal_timer: Seal open epochs from a background timer at their deadline
+        on_seal: Called with each signed epoch anchor as it is sealed, to persist it
+            (e.g. WORMMerkleTree.append_epoch_anchor)
+    """
+
+    def __init__(
+        self,
+        signer: Signer,
+        policy: Policy,
+        max_records: int = ANCHOR_EPOCH_MAX_RECORDS,
+        max_seconds: float = ANCHOR_EPOCH_MAX_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        max_retained_epochs: int = ANCHOR_EPOCH_MAX_RETAINED,
+        seal_timer: bool = True,
+        on_seal: Optional[Callable[[AnchorRecord], None]] = None,
+    ):
+        if max_records < 1:
+            raise ValueError("max_records must be at least 1")
+        if max_retained_epochs < 1:
+            raise ValueError("max_retained_epochs must be at least 1")
+        self.signer = signer
+        self.policy = policy
+        self.max_records = max_records
+        self.max_seconds = max(max_seconds, 0.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: List[_PendingAnchor] = []
+        self._opened_at = 0.0
+        self.max_retained_epochs = max_retained_epochs
+        self.seal_timer = seal_timer
+        self.on_seal = on_seal
+        self._timer: Optional[threading.Timer] = None
+        self._next_epoch_id = 0
+        self._epochs: "OrderedDict[int, _SealedEpoch]" = OrderedDict()
+        self._leaf_epochs: Dict[str, int] = {}
+        self.stats = {"epochs": 0, "records": 0}
+
+    def make_record_anchor(self, root: str) -> AnchorRecord:
+        """Create the unsigned anchor for a ledger root; it is covered by the epoch signature."""
+        return AnchorRecord(
+            root=root,
+            policy_id=self.policy.policy_id,
+            schema_version=self.policy.schema_version,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            domain_labels=sorted(self.policy.domain_labels),
+            signature="",
+            signing_key_id=self.signer.key_id
+        )
+
+    def add(self, anchor: AnchorRecord, receipt: Optional[Receipt] = None) -> Optional[AnchorRecord]:
+        """
+        Add a record anchor to the open epoch.
+
+        Args:
+            anchor: Record anchor (usually from make_record_anchor())
+            receipt: Receipt whose epoch_proof is set when the epoch is sealed
+
+        Returns:
+            Signed epoch anchor if this call sealed an epoch containing the anchor, else None
+        """
+        leaf_hash = anchor_leaf_hash(anchor)
+        with self._lock:
+            now = self._clock()
+            if self._pending and now - self._opened_at >= self.max_seconds:
+                self._seal_locked()
+            if not self._pending:
+                self._opened_at = now
+                self._start_timer_locked()
+            self._pending.append(_PendingAnchor(anchor, leaf_hash, receipt))
+            if len(self._pending) >= self.max_records:
+                return self._seal_locked()
+        return None
+
+    def flush(self) -> Optional[AnchorRecord]:
+        """Seal the open epoch, if any, and return its signed anchor."""
+        with self._lock:
+            return self._seal_locked() if self._pending else None
+
+    def close(self) -> Optional[AnchorRecord]:
+        """Seal the open epoch and stop the deadline timer; returns the last epoch anchor, if any."""
+        with self._lock:
+            self.seal_timer = False
+            return self._seal_locked() if self._pending else None
+
+    def _start_timer_locked(self) -> None:
+        if not self.seal_timer:
+            return
+        timer = threading.Timer(self.max_seconds, self._seal_expired)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _seal_expired(self) -> None:
+        with self._lock:
+            # A timer that lost the race with a seal must not cut the next epoch short
+            if self._timer is threading.current_thread() and self._pending:
+                self._seal_locked()
+
+    def _seal_locked(self) -> AnchorRecord:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        epoch_id = self._next_epoch_id
+        self._next_epoch_id += 1
+        leaf_hashes = [entry.leaf_hash for entry in pending]
+        tree = MerkleTree(leaf_hashes, proof_cache_size=0, verification_cache_size=0)
+
+        epoch_policy = Policy(
+            policy_id=self.policy.policy_id,
+            schema_version=self.policy.schema_version,
+            domain_labels=list(self.policy.domain_labels) + [
+                f"{EPOCH_ID_LABEL}{epoch_id}",
+                f"{EPOCH_SIZE_LABEL}{len(leaf_hashes)}",
+            ],
+            hash_algorithm=self.policy.hash_algorithm,
+        )
+        epoch_anchor = make_anchor(tree.get_root(), epoch_policy, self.signer)
+        if self.on_seal is not None:
+            self.on_seal(epoch_anchor)
+
+        self._epochs[epoch_id] = _SealedEpoch(epoch_anchor, tree)
+        while len(self._epochs) > self.max_retained_epochs:
+            self._evict_oldest_locked()
+        for index, entry in enumerate(pending):
+            self._leaf_epochs.setdefault(entry.leaf_hash, epoch_id)
+            if entry.receipt is not None:
+                entry.receipt.epoch_proof = EpochProof(
+                    epoch_id, index, entry.leaf_hash, tree.get_proof(entry.leaf_hash), epoch_anchor
+                )
+
+        self.stats["epochs"] += 1
+        self.stats["records"] += len(pending)
+        return epoch_anchor
+
+    def _evict_oldest_locked(self) -> None:
+        epoch_id, epoch = self._epochs.popitem(last=False)
+        for leaf_hash in epoch.tree.leaves:
+            if self._leaf_epochs.get(leaf_hash) == epoch_id:
+                del self._leaf_epochs[leaf_hash]
+
+    def get_proof(self, anchor: AnchorRecord) -> Optional[EpochProof]:
+        """Return the epoch inclusion proof for a record anchor, or None if it is not sealed yet or evicted."""
+        leaf_hash = anchor_leaf_hash(anchor)
+        with self._lock:
+            epoch_id = self._leaf_epochs.get(leaf_hash)
+            if epoch_id is None:
+                return None
+            epoch = self._epochs[epoch_id]
+            return EpochProof(
+                epoch_id,
+                epoch.tree.get_leaf_index(leaf_hash),
+                leaf_hash,
+                epoch.tree.get_proof(leaf_hash),
+                epoch.anchor,
+            )
+
+    @property
+    def epoch_anchors(self) -> List[AnchorRecord]:
+        """Signed anchors of the retained sealed epochs, oldest first."""
+        with self._lock:
+            return [epoch.anchor for epoch in self._epochs.values()]
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
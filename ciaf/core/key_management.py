@@ -11,8 +11,11 @@ Version: 1.0.0
 
 import json
 import os
+import threading
+import time
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
@@ -22,6 +25,8 @@ from typing import Dict, List, Optional, Tuple
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+from .cache import CacheMetrics
+from .constants import KEY_HANDLE_CACHE_SIZE, KEY_HANDLE_CACHE_TTL_SECONDS
 from .crypto import secure_random_bytes
 from .determinism import canonical_timestamp
 from .enums import SignatureAlgorithm
@@ -264,24 +269,150 @@ class FileSystemKeyStore(KeyStore):
             return False
 
 
+@dataclass
+class _KeyHandle:
+    """Loaded key bundle with its parsed signer, as held by the KeyManager cache."""
+    bundle: KeyBundle
+    signer: Optional[Ed25519Signer]
+    loaded_at: float
+
+
 class KeyManager:
     """
     Central key management system for CIAF.
     
     Provides high-level key lifecycle management including generation,
     storage, rotation, and access control.
+    
+    Loaded key bundles and their parsed signers are kept in an in-memory
+    handle cache, so hot signing paths skip the key store read and key
+    parse. Rotation, revocation, status changes and deletions made through
+    this manager invalidate affected handles immediately; changes made to
+    the store by other processes are picked up once a handle is older than
+    ``cache_ttl_seconds``.
     """
     
-    def __init__(self, key_store: KeyStore, default_key_validity_days: int = 365):
+    def __init__(self, key_store: KeyStore, default_key_validity_days: int = 365,
+                 cache_size: int = KEY_HANDLE_CACHE_SIZE,
+                 cache_ttl_seconds: Optional[float] = KEY_HANDLE_CACHE_TTL_SECONDS):
         """
         Initialize key manager.
         
         Args:
             key_store: Backend key storage
             default_key_validity_days: Default key validity period
+            cache_size: Maximum cached key handles (0 disables the cache)
+            cache_ttl_seconds: Age after which a cached handle is reloaded (None for no expiry)
         """
         self.key_store = key_store
         self.default_key_validity_days = default_key_validity_days
+        self.cache_size = max(0, cache_size)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_metrics = CacheMetrics()
+        self._cache_lock = threading.RLock()
+        self._handles: "OrderedDict[str, _KeyHandle]" = OrderedDict()
+        self._active_key_ids: Dict[str, str] = {}
+        # Bumped by invalidate(); handles loaded across a bump are not cached
+        self._generation = 0
+    
+    def _load_handle(self, key_id: str) -> Optional[_KeyHandle]:
+        """Return the cached handle for a key, loading it from the store on a miss."""
+        now = time.monotonic()
+        with self._cache_lock:
+            handle = self._handles.get(key_id)
+            if handle is not None and (
+                self.cache_ttl_seconds is None or now - handle.loaded_at < self.cache_ttl_seconds
+            ):
+                self._handles.move_to_end(key_id)
+                self.cache_metrics.record(hits=1)
+                return handle
+            generation = self._generation
+        self.cache_metrics.record(misses=1)
+        
+        bundle = self.key_store.retrieve_key(key_id)
+        if bundle is None:
+            self.invalidate(key_id)
+            return None
+        handle = _KeyHandle(bundle, bundle.get_signer(), now)
+        if self.cache_size == 0:
+            return handle
+        
+        evicted = 0
+        with self._cache_lock:
+            if self._generation != generation:
+                # Invalidated while loading: the bundle may predate the change, so it is not cached
+                return handle
+            self._handles[key_id] = handle
+            self._handles.move_to_end(key_id)
+            while len(self._handles) > self.cache_size:
+                self._handles.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self.cache_metrics.record(evictions=evicted)
+        return handle
+    
+    def invalidate(self, key_id: Optional[str] = None) -> None:
+        """
+        Drop cached handles so the next access reloads from the key store.
+        
+        Args:
+            key_id: Key to invalidate, or None to clear the whole cache
+        """
+        with self._cache_lock:
+            if key_id is None:
+                self._handles.clear()
+                self._active_key_ids.clear()
+            else:
+                self._handles.pop(key_id, None)
+                for purpose, active_id in list(self._active_key_ids.items()):
+                    if active_id == key_id:
+                        del self._active_key_ids[purpose]
+            self._generation += 1
+    
+    def get_key(self, key_id: str) -> Optional[KeyBundle]:
+        """
+        Get a key bundle through the handle cache.
+        
+        Args:
+            key_id: Key identifier
+            
+        Returns:
+            Key bundle or None if the key does not exist
+        """
+        handle = self._load_handle(key_id)
+        return handle.bundle if handle else None
+    
+    def get_signer(self, key_id: Optional[str] = None, purpose: str = "") -> Optional[Ed25519Signer]:
+        """
+        Get a cached signer for a key, or for the active signing key of a purpose.
+        
+        Args:
+            key_id: Specific key ID, or None for any active signing key
+            purpose: Purpose filter used when key_id is None
+            
+        Returns:
+            Ed25519Signer instance, or None if the key is missing or not active
+        """
+        if key_id is None:
+            key_bundle = self.get_active_signing_key(purpose)
+            if key_bundle is None:
+                return None
+            key_id = key_bundle.metadata.key_id
+        handle = self._load_handle(key_id)
+        if handle is None or not handle.bundle.metadata.is_active():
+            return None
+        return handle.signer
+    
+    def get_cache_stats(self) -> Dict[str, object]:
+        """Hit/miss/eviction counters and size of the key handle cache."""
+        stats = self.cache_metrics.to_dict()
+        stats.update({
+            "invalidations": self._generation,
+            "size": len(self._handles),
+            "max_entries": self.cache_size,
+            "ttl_seconds": self.cache_ttl_seconds,
+        })
+        return stats
     
     def generate_signing_key(self, key_id: str, purpose: str = "", 
                            validity_days: Optional[int] = None,
@@ -340,6 +471,7 @@ class KeyManager:
         # Store the key
         if not self.key_store.store_key(key_bundle):
             raise RuntimeError(f"Failed to store key {key_id}")
+        self.invalidate(key_id)
         
         return key_bundle
     
@@ -381,6 +513,7 @@ class KeyManager:
         # Store the key
         if not self.key_store.store_key(key_bundle):
             raise RuntimeError(f"Failed to store key {key_id}")
+        self.invalidate(key_id)
         
         return key_bundle
     
@@ -394,6 +527,14 @@ class KeyManager:
         Returns:
             Active signing key bundle or None
         """
+        cached_id = self._active_key_ids.get(purpose)
+        if cached_id is not None:
+            handle = self._load_handle(cached_id)
+            if handle and handle.bundle.metadata.is_active():
+                return handle.bundle
+            self.invalidate(cached_id)
+        
+        generation = self._generation
         signing_keys = self.key_store.list_keys(
             key_type=KeyType.SIGNING,
             status=KeyStatus.ACTIVE
@@ -406,7 +547,14 @@ class KeyManager:
         # Find keys that are actually active (not expired)
         for key_meta in signing_keys:
             if key_meta.is_active():
-                return self.key_store.retrieve_key(key_meta.key_id)
+                handle = self._load_handle(key_meta.key_id)
+                if handle is None:
+                    continue
+                if self.cache_size:
+                    with self._cache_lock:
+                        if self._generation == generation:
+                            self._active_key_ids[purpose] = key_meta.key_id
+                return handle.bundle
         
         return None
     
@@ -427,7 +575,9 @@ class KeyManager:
             return None
         
         # Retire old key
-        if not self.key_store.update_key_status(old_key_id, KeyStatus.RETIRED):
+        retired = self.key_store.update_key_status(old_key_id, KeyStatus.RETIRED)
+        self.invalidate(old_key_id)
+        if not retired:
             return None
         
         # Generate new key with same properties
@@ -458,7 +608,9 @@ class KeyManager:
         Returns:
             True if revocation successful
         """
-        return self.key_store.update_key_status(key_id, KeyStatus.REVOKED)
+        revoked = self.key_store.update_key_status(key_id, KeyStatus.REVOKED)
+        self.invalidate(key_id)
+        return revoked
     
     def get_expiring_keys(self, days_ahead: int = 30) -> List[KeyMetadata]:
         """
@@ -500,6 +652,7 @@ class KeyManager:
                 retired_date = datetime.fromisoformat(key_meta.retired_at.replace('Z', '+00:00'))
                 if retired_date < cutoff_date:
                     if self.key_store.delete_key(key_meta.key_id):
+                        self.invalidate(key_meta.key_id)
                         deleted.append(key_meta.key_id)
         
         return deleted
@@ -537,6 +690,19 @@ def create_default_ciaf_key_manager() -> KeyManager:
     return create_filesystem_key_manager("ciaf_keys", 365)
 
 
+_default_key_manager: Optional[KeyManager] = None
+_default_key_manager_lock = threading.Lock()
+
+
+def _get_default_key_manager() -> KeyManager:
+    """Process-wide default key manager, so its key handle cache is shared."""
+    global _default_key_manager
+    with _default_key_manager_lock:
+        if _default_key_manager is None:
+            _default_key_manager = create_default_ciaf_key_manager()
+        return _default_key_manager
+
+
 # Convenience functions for common operations
 
 def generate_ciaf_signing_key(key_id: str, purpose: str = "ciaf_signing") -> Ed25519Signer:
@@ -550,7 +716,7 @@ def generate_ciaf_signing_key(key_id: str, purpose: str = "ciaf_signing") -> Ed2
     Returns:
         Ed25519Signer instance
     """
-    key_manager = create_default_ciaf_key_manager()
+    key_manager = _get_default_key_manager()
     key_bundle = key_manager.generate_signing_key(key_id, purpose)
     signer = key_bundle.get_signer()
     if not signer:
@@ -569,13 +735,4 @@ def get_ciaf_signer(key_id: Optional[str] = None, purpose: str = "ciaf_signing")
     Returns:
         Ed25519Signer instance or None
     """
-    key_manager = create_default_ciaf_key_manager()
-    
-    if key_id:
-        key_bundle = key_manager.key_store.retrieve_key(key_id)
-    else:
-        key_bundle = key_manager.get_active_signing_key(purpose)
-    
-    if key_bundle:
-        return key_bundle.get_signer()
-    return None
\ No newline at end of file
+    return _get_default_key_manager().get_signer(key_id, purpose)
\ No newline at end of file
@@ -7,34 +7,393 @@ Author: Denzil James Greenwood
 Version: 1.1.0
 """
 
-from typing import List, Tuple
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+from .batch_hashing import DIGEST_SIZE, DigestBatch, hash_pairs
+from .cache import BoundedLRUCache, CacheMetrics
+from .constants import (
+    MERKLE_PROOF_CACHE_BYTES,
+    MERKLE_PROOF_CACHE_SIZE,
+    MERKLE_VERIFICATION_CACHE_SIZE,
+)
 from .crypto import sha256_hash
 from .interfaces import Merkle
 
+# Process-wide accumulators fed by every tree's caches
+_PROOF_CACHE_METRICS = CacheMetrics()
+_VERIFICATION_CACHE_METRICS = CacheMetrics()
+
+
+def _proof_entry_bytes(leaf_hash: str, proof: list[tuple[str, str]]) -> int:
+    """Approximate payload size of a cached proof."""
+    return len(leaf_hash) + sum(len(sibling) + len(pos) for sibling, pos in proof)
+
+
+def get_merkle_cache_metrics() -> dict[str, dict[str, Any]]:
+    """Aggregate proof/verification cache counters across all MerkleTree instances."""
+    return {
+        "proof_cache": _PROOF_CACHE_METRICS.to_dict(),
+        "verification_cache": _VERIFICATION_CACHE_METRICS.to_dict(),
+    }
+
+
+def extend_levels(levels: list[list[str]], hash_pair: Callable[[str, str], str]) -> None:
+    """
+    Propagate a leaf just appended to ``levels[0]`` up the stored levels.
+
+    Level k+1 only holds parents of complete pairs on level k, so an append
+    hashes at most one new parent per level along the rightmost path.
+    """
+    level_index = 0
+    while len(levels[level_index]) % 2 == 0:
+        level = levels[level_index]
+        if level_index + 1 == len(levels):
+            levels.append([])
+        levels[level_index + 1].append(hash_pair(level[-2], level[-1]))
+        level_index += 1
+
+
+def derive_right_edge(
+    levels: list[list[str]], hash_pair: Callable[[str, str], str]
+) -> tuple[list[Optional[str]], str]:
+    """
+    Derive the unpaired right-edge node of every level and the root.
+
+    The tree duplicates the last node of an odd-length level, so the full
+    level k is ``levels[k]`` plus at most one extra node built from the right
+    edge of level k-1. Walking the edge costs O(log n) hashes and yields
+    exactly the root a full rebuild would produce.
+
+    Args:
+        levels: Stored levels (leaves first), as maintained by extend_levels()
+        hash_pair: Parent hash function
+
+    Returns:
+        Tuple of (extra node per level or None, root hash)
+    """
+    right_edge: list[Optional[str]] = []
+    extra: Optional[str] = None
+    level_index = 0
+    while True:
+        level = levels[level_index] if level_index < len(levels) else []
+        right_edge.append(extra)
+        if len(level) + (extra is not None) == 1:
+            return right_edge, level[0] if level else extra
+        if len(level) % 2 == 1:
+            extra = hash_pair(level[-1], extra if extra is not None else level[-1])
+        elif extra is not None:
+            extra = hash_pair(extra, extra)
+        level_index += 1
+
+
+def _level_sizes(leaf_count: int) -> list[int]:
+    """Node count of every level, leaves first and root last."""
+    sizes = [leaf_count]
+    while sizes[-1] > 1:
+        sizes.append((sizes[-1] + 1) // 2)
+    return sizes
+
+
+def build_levels_binary(leaves: list[str]) -> Optional[list[list[str]]]:
+    """
+    Build the stored levels above ``leaves`` in raw-digest form.
+
+    Leaves are decoded from hex once and every level is hashed as contiguous
+    raw digests (see batch_hashing.hash_pairs); nodes are hex-encoded only when
+    a level is stored. Produces exactly the levels repeated _hash_pair() calls
+    would.
+
+    Args:
+        leaves: Hex-encoded leaf hashes
+
+    Returns:
+        Stored levels 1..n as hex lists, or None if a leaf is not valid hex
+    """
+    nodes: Any
+    if all(len(leaf) == 2 * DIGEST_SIZE for leaf in leaves):
+        try:
+            nodes = DigestBatch.from_hex(leaves)
+        except ValueError:
+            return None
+    else:
+        try:
+            nodes = [bytes.fromhex(leaf) for leaf in leaves]
+        except ValueError:
+            return None
+
+    levels: list[list[str]] = []
+    while len(nodes) >= 2:
+        nodes = hash_pairs(nodes)
+        levels.append(nodes.hexdigests())
+    return levels
+
+
+def _strict_hash_pair(left: str, right: str) -> str:
+    """Parent hash for verifiers: inputs must be hex digests."""
+    return sha256_hash(bytes.fromhex(left) + bytes.fromhex(right))
+
+
+def _frontier_root(
+    leaf_count: int, peaks: list[Optional[str]], hash_pair: Callable[[str, str], str]
+) -> str:
+    """Root of a tree of ``leaf_count`` leaves from its peaks (see MerkleFrontier)."""
+    extra: Optional[str] = None
+    level = 0
+    while True:
+        stored = leaf_count >> level
+        if stored + (extra is not None) == 1:
+            return peaks[level] if stored else extra
+        if stored & 1:
+            peak = peaks[level]
+            extra = hash_pair(peak, extra if extra is not None else peak)
+        elif extra is not None:
+            extra = hash_pair(extra, extra)
+        level += 1
+
+
+def build_multiproof(
+    leaf_indices: Iterable[int],
+    leaf_count: int,
+    get_node: Callable[[int, int], str],
+) -> list[str]:
+    """
+    Collect the deduplicated sibling nodes needed to prove several leaves at once.
+
+    Nodes are emitted level by level (leaves first) in ascending index order,
+    which is exactly the order verify_multiproof() consumes them in. Siblings
+    that are themselves proven or derivable from proven nodes are omitted, and
+    an unpaired last node is paired with itself as in the tree construction.
+
+    Args:
+        leaf_indices: Positions of the leaves being proven
+        leaf_count: Total number of leaves in the tree
+        get_node: Callable returning the hash at (level, index)
+
+    Returns:
+        Ordered list of hex-encoded proof nodes
+    """
+    known = sorted(set(leaf_indices))
+    nodes: list[str] = []
+    for level, size in enumerate(_level_sizes(leaf_count)[:-1]):
+        known_set = set(known)
+        parents: list[int] = []
+        for index in known:
+            sibling = index + 1 if index % 2 == 0 else index - 1
+            if sibling < size and sibling not in known_set:
+                nodes.append(get_node(level, sibling))
+            if not parents or parents[-1] != index // 2:
+                parents.append(index // 2)
+        known = parents
+    return nodes
+
+
+def verify_multiproof(multiproof: dict, root: str) -> bool:
+    """
+    Verify a multiproof produced by get_multiproof() in a single bottom-up pass.
+
+    Args:
+        multiproof: Dictionary with leaf_count, indices, leaf_hashes and nodes
+        root: Expected Merkle root
+
+    Returns:
+        True if every listed leaf is included under root
+    """
+    try:
+        leaf_count = int(multiproof["leaf_count"])
+        indices = [int(i) for i in multiproof["indices"]]
+        leaf_hashes = list(multiproof["leaf_hashes"])
+        proof_nodes = iter(multiproof["nodes"])
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    if leaf_count < 1 or not indices or len(indices) != len(leaf_hashes):
+        return False
+    if any(b <= a for a, b in zip(indices, indices[1:])) or indices[0] < 0 or indices[-1] >= leaf_count:
+        return False
+
+    hash_pair = _strict_hash_pair
+    layer = list(zip(indices, leaf_hashes))
+    try:
+        for size in _level_sizes(leaf_count)[:-1]:
+            next_layer: list[tuple[int, str]] = []
+            position = 0
+            while position < len(layer):
+                index, node = layer[position]
+                if index % 2 == 0:
+                    if position + 1 < len(layer) and layer[position + 1][0] == index + 1:
+                        parent = hash_pair(node, layer[position + 1][1])
+                        position += 2
+                    else:
+                        right = next(proof_nodes) if index + 1 < size else node
+                        parent = hash_pair(node, right)
+                        position += 1
+                else:
+                    parent = hash_pair(next(proof_nodes), node)
+                    position += 1
+                next_layer.append((index // 2, parent))
+            layer = next_layer
+    except (StopIteration, ValueError, TypeError):
+        return False
+
+    # Every supplied node must have been consumed
+    if next(proof_nodes, None) is not None:
+        return False
+    return len(layer) == 1 and layer[0][1] == root
+
+
+def build_consistency_proof(
+    old_size: int, new_size: int, get_node: Callable[[int, int], str]
+) -> list[str]:
+    """
+    Collect the nodes proving that the first ``old_size`` leaves are a prefix of the tree.
+
+    This follows RFC 6962 section 2.1.2, adapted to this tree's odd-node
+    duplication. The old root is determined by the old tree's peaks (the
+    complete subtrees given by the set bits of old_size). Those peaks are
+    unchanged nodes of the new tree, so the proof lists them (lowest level
+    first, omitted when old_size is a power of two because the peak is then
+    the old root itself), followed by the right-hand siblings on the path from
+    the lowest peak to the new root. Both parts are O(log n).
+
+    Args:
+        old_size: Leaf count of the earlier tree (1 <= old_size <= new_size)
+        new_size: Leaf count of the current tree
+        get_node: Callable returning the current tree's hash at (level, index)
+
+    Returns:
+        Ordered list of hex-encoded proof nodes
+    """
+    if not 1 <= old_size <= new_size:
+        raise ValueError(f"Invalid consistency range {old_size} -> {new_size}")
+
+    peak_levels = [k for k in range(old_size.bit_length()) if (old_size >> k) & 1]
+    nodes: list[str] = []
+    if len(peak_levels) > 1:
+        nodes.extend(get_node(k, (old_size >> k) - 1) for k in peak_levels)
+
+    sizes = _level_sizes(new_size)
+    for level in range(peak_levels[0], len(sizes) - 1):
+        index = (old_size >> level) - 1 if level == peak_levels[0] else old_size >> level
+        if index % 2 == 0 and index + 1 < sizes[level]:
+            nodes.append(get_node(level, index + 1))
+    return nodes
+
+
+def verify_consistency_proof(proof: dict, old_root: str, new_root: str) -> bool:
+    """
+    Verify that ``new_root`` extends ``old_root`` by appends only, without the tree.
+
+    Args:
+        proof: Dictionary with old_size, new_size and nodes (see build_consistency_proof())
+        old_root: Root previously observed for old_size leaves
+        new_root: Root claimed for new_size leaves
+
+    Returns:
+        True if the old tree is a prefix of the new tree
+    """
+    try:
+        old_size = int(proof["old_size"])
+        new_size = int(proof["new_size"])
+        proof_nodes = list(proof["nodes"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    if not 1 <= old_size <= new_size:
+        return False
+
+    hash_pair = _strict_hash_pair
+    peak_levels = [k for k in range(old_size.bit_length()) if (old_size >> k) & 1]
+    peaks: list[Optional[str]] = [None] * old_size.bit_length()
+    position = 0
+    try:
+        if len(peak_levels) > 1:
+            for k in peak_levels:
+                peaks[k] = proof_nodes[position]
+                position += 1
+            if _frontier_root(old_size, peaks, hash_pair) != old_root:
+                return False
+        else:
+            peaks[peak_levels[0]] = old_root
+
+        sizes = _level_sizes(new_size)
+        node = peaks[peak_levels[0]]
+        for level in range(peak_levels[0], len(sizes) - 1):
+            if level == peak_levels[0]:
+                index = (old_size >> level) - 1
+            else:
+                index = old_size >> level
+            if index % 2 == 1:
+                node = hash_pair(peaks[level], node)
+            elif index + 1 < sizes[level]:
+                node = hash_pair(node, proof_nodes[position])
+                position += 1
+            else:
+                node = hash_pair(node, node)
+    except (IndexError, ValueError, TypeError):
+        return False
+
+    # Every supplied node must have been consumed
+    return position == len(proof_nodes) and node == new_root
+
+
 class MerkleTree:
     """Deterministic Merkle tree with left/right proofs and caches implementing the Merkle protocol."""
 
-    def __init__(self, leaves: list[str] = None):
+    def __init__(
+        self,
+        leaves: list[str] = None,
+        proof_cache_size: int = MERKLE_PROOF_CACHE_SIZE,
+        proof_cache_bytes: Optional[int] = MERKLE_PROOF_CACHE_BYTES,
+        verification_cache_size: int = MERKLE_VERIFICATION_CACHE_SIZE,
+    ):
         leaves = leaves or []
-        if not leaves:
-            # Allow empty trees for add_leaf functionality
-            self.leaves = []
-            self.tree = []
-            self.root = sha256_hash(b"empty_tree")
+        # Level 0 is the leaf list itself; level k+1 holds the parents of every
+        # complete pair on level k. Unpaired right-edge nodes are not stored but
+        # derived on demand (see derive_right_edge), so an append only touches
+        # the O(log n) nodes along the rightmost path.
+        self.leaves = leaves
+        self._levels: list[list[str]] = [self.leaves]
+        self._right_edge: list[str | None] = []
+        self._leaf_index: dict[str, int] = self._build_leaf_index(self.leaves)
+
+        binary_levels = build_levels_binary(self.leaves)
+        if binary_levels is not None:
+            self._levels.extend(binary_levels)
         else:
-            self.leaves = leaves
-            self.tree = self._build_tree(leaves)
-            self.root = self.tree[-1][0] if self.tree else None
+            # Non-hex leaves go through _hash_pair's plain-string fallback
+            level = self.leaves
+            while len(level) >= 2:
+                level = [self._hash_pair(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+                self._levels.append(level)
+
+        self.root = self._compute_right_edge()
+        self._init_caches(proof_cache_size, proof_cache_bytes, verification_cache_size)
 
-        self._proof_cache: dict[str, list[tuple[str, str]]] = {}
-        self._verification_cache: dict[tuple[str, str], bool] = {}
+    def _init_caches(
+        self,
+        proof_cache_size: int,
+        proof_cache_bytes: Optional[int],
+        verification_cache_size: int,
+    ) -> None:
+        self._proof_cache = BoundedLRUCache(
+            proof_cache_size,
+            max_bytes=proof_cache_bytes,
+            sizeof=_proof_entry_bytes,
+            parent_metrics=_PROOF_CACHE_METRICS,
+        )
+        self._verification_cache = BoundedLRUCache(
+            verification_cache_size,
+            parent_metrics=_VERIFICATION_CACHE_METRICS,
+        )
 
-        self._proof_cache_hits = 0
-        self._proof_cache_misses = 0
-        self._verification_cache_hits = 0
-        self._verification_cache_misses = 0
+    @staticmethod
+    def _build_leaf_index(leaves: list[str]) -> dict[str, int]:
+        """Map each leaf hash to its first position (matches ``list.index`` on duplicates)."""
+        index: dict[str, int] = {}
+        for position, leaf in enumerate(leaves):
+            index.setdefault(leaf, position)
+        return index
 
-    def _hash_pair(self, h1: str, h2: str) -> str:
+    @staticmethod
+    def _hash_pair(h1: str, h2: str) -> str:
         # Handle both hex strings and plain strings for flexibility
         # According to Variables Reference: _hash suffix indicates hex-encoded values
         try:
@@ -46,76 +405,157 @@ class MerkleTree:
             h2_hex = sha256_hash(h2.encode('utf-8'))
             return sha256_hash(bytes.fromhex(h1_hex) + bytes.fromhex(h2_hex))
 
-    def _build_tree(self, leaves: list[str]) -> list[list[str]]:
-        tree = [leaves]
-        level = leaves
-        while len(level) > 1:
-            nxt = []
-            for i in range(0, len(level), 2):
-                a = level[i]
-                b = level[i + 1] if i + 1 < len(level) else a
-                nxt.append(self._hash_pair(a, b))
-            tree.append(nxt)
-            level = nxt
-        return tree
+    def _compute_right_edge(self) -> str:
+        """Refresh the derived right-edge nodes and return the root."""
+        if not self.leaves:
+            self._right_edge = []
+            return sha256_hash(b"empty_tree")
+        self._right_edge, root = derive_right_edge(self._levels, self._hash_pair)
+        return root
+
+    @property
+    def tree(self) -> list[list[str]]:
+        """Materialized tree levels (leaves first, root last)."""
+        return [
+            self._levels[k] + ([extra] if extra is not None else [])
+            if k < len(self._levels) else [extra]
+            for k, extra in enumerate(self._right_edge)
+        ]
 
     def add_leaf(self, leaf_hash: str) -> str:
         """Add a new leaf and return the new root hash."""
-        if leaf_hash in self.leaves:
+        if leaf_hash in self._leaf_index:
             raise ValueError(f"Leaf {leaf_hash} already exists (WORM violation)")
         
+        self._leaf_index[leaf_hash] = len(self.leaves)
         self.leaves.append(leaf_hash)
         
         # Clear caches since tree structure changed
         self._proof_cache.clear()
         self._verification_cache.clear()
         
-        # Rebuild tree
-        if len(self.leaves) == 1:
-            self.tree = [self.leaves]
-            self.root = self.leaves[0]
-        else:
-            self.tree = self._build_tree(self.leaves)
-            self.root = self.tree[-1][0] if self.tree else None
-        
+        # Only the rightmost path changes
+        extend_levels(self._levels, self._hash_pair)
+        self.root = self._compute_right_edge()
         return self.root
 
     def get_root(self) -> str:
         return self.root
 
+    def get_frontier(self) -> "MerkleFrontier":
+        """Return the append frontier (peaks) of this tree."""
+        leaf_count = len(self.leaves)
+        peaks = [
+            self._levels[k][-1] if (leaf_count >> k) & 1 else None
+            for k in range(leaf_count.bit_length())
+        ]
+        return MerkleFrontier(leaf_count, peaks)
+
+    def get_leaf_index(self, leaf_hash: str) -> int | None:
+        """Return the position of a leaf in O(1), or None if it is not in the tree."""
+        return self._leaf_index.get(leaf_hash)
+
+    def __contains__(self, leaf_hash: str) -> bool:
+        return leaf_hash in self._leaf_index
+
     def get_proof(self, leaf_hash: str) -> list[tuple[str, str]]:
-        if leaf_hash in self._proof_cache:
-            self._proof_cache_hits += 1
-            return self._proof_cache[leaf_hash]
-        self._proof_cache_misses += 1
+        cached = self._proof_cache.get(leaf_hash)
+        if cached is not None:
+            return cached
 
-        try:
-            idx = self.leaves.index(leaf_hash)
-        except ValueError:
-            self._proof_cache[leaf_hash] = []
+        idx = self._leaf_index.get(leaf_hash)
+        if idx is None:
+            self._proof_cache.put(leaf_hash, [])
             return []
 
         if len(self.leaves) == 1:
-            self._proof_cache[leaf_hash] = []
+            self._proof_cache.put(leaf_hash, [])
             return []
 
         proof: list[tuple[str, str]] = []
         current_index = idx
 
-        for level in self.tree[:-1]:
+        for level_index, extra in enumerate(self._right_edge[:-1]):
+            level = self._levels[level_index] if level_index < len(self._levels) else []
+            level_size = len(level) + (extra is not None)
             is_right = current_index % 2 != 0
             sib_idx = current_index - 1 if is_right else current_index + 1
-            sibling_hash = level[sib_idx] if sib_idx < len(level) else level[current_index]
+            if sib_idx >= level_size:
+                sib_idx = current_index
+            sibling_hash = level[sib_idx] if sib_idx < len(level) else extra
             pos = "left" if is_right else "right"
             proof.append((sibling_hash, pos))
             current_index //= 2
 
-        self._proof_cache[leaf_hash] = proof
+        self._proof_cache.put(leaf_hash, proof)
         return proof
     
     def get_merkle_path(self, leaf_hash: str) -> List[Tuple[str, str]]:
         """Alias for get_proof to maintain backward compatibility."""
         return self.get_proof(leaf_hash)
+
+    def _get_node(self, level_index: int, index: int) -> str:
+        level = self._levels[level_index] if level_index < len(self._levels) else []
+        return level[index] if index < len(level) else self._right_edge[level_index]
+
+    def get_multiproof(self, leaf_hashes: List[str]) -> dict:
+        """
+        Build a compact multiproof for several leaves against the current root.
+
+        Shared upper-level siblings are included once, so proving k leaves is
+        far smaller than k independent proofs.
+
+        Args:
+            leaf_hashes: Leaves to prove (duplicates are ignored)
+
+        Returns:
+            Multiproof dictionary accepted by verify_multiproof()
+
+        Raises:
+            ValueError: If a leaf is not in the tree
+        """
+        positions = {}
+        for leaf_hash in leaf_hashes:
+            index = self._leaf_index.get(leaf_hash)
+            if index is None:
+                raise ValueError(f"Leaf {leaf_hash} not found in tree")
+            positions[index] = leaf_hash
+
+        indices = sorted(positions)
+        return {
+            "leaf_count": len(self.leaves),
+            "indices": indices,
+            "leaf_hashes": [positions[i] for i in indices],
+            "nodes": build_multiproof(indices, len(self.leaves), self._get_node),
+        }
+
+    def verify_multiproof(self, multiproof: dict, root: str | None = None) -> bool:
+        """Verify a multiproof against root (defaults to the current root)."""
+        return verify_multiproof(multiproof, root or self.root)
+
+    def get_consistency_proof(self, old_size: int) -> dict:
+        """
+        Prove that the tree as it was at ``old_size`` leaves is a prefix of the current tree.
+
+        Args:
+            old_size: Earlier leaf count (1 <= old_size <= current leaf count)
+
+        Returns:
+            Consistency proof dictionary accepted by verify_consistency_proof()
+
+        Raises:
+            ValueError: If old_size is out of range
+        """
+        new_size = len(self.leaves)
+        return {
+            "old_size": old_size,
+            "new_size": new_size,
+            "nodes": build_consistency_proof(old_size, new_size, self._get_node),
+        }
+
+    def verify_consistency_proof(self, proof: dict, old_root: str, new_root: str | None = None) -> bool:
+        """Verify a consistency proof against new_root (defaults to the current root)."""
+        return verify_consistency_proof(proof, old_root, new_root or self.root)
     
     def verify_proof(self, leaf_hash: str, proof: List[Tuple[str, str]], root: str) -> bool:
         """Instance method wrapper for static verify_proof."""
@@ -136,30 +576,121 @@ class MerkleTree:
     def verify_proof_cached(self, leaf_hash: str, root_hash: str | None = None) -> bool:
         root = root_hash or self.root
         key = (leaf_hash, root)
-        if key in self._verification_cache:
-            self._verification_cache_hits += 1
-            return self._verification_cache[key]
-        self._verification_cache_misses += 1
+        cached = self._verification_cache.get(key)
+        if cached is not None:
+            return cached
         proof = self.get_proof(leaf_hash)
-        res = self.verify_proof(leaf_hash, root, proof)
-        self._verification_cache[key] = res
+        res = self.verify_proof(leaf_hash, proof, root)
+        self._verification_cache.put(key, res)
         return res
 
+    def to_json(self) -> dict:
+        """
+        Serialize the tree, including its stored levels and position index inputs.
+
+        Returns:
+            Dictionary representation that from_json() restores without rehashing.
+        """
+        return {
+            "leaves": list(self.leaves),
+            "levels": [list(level) for level in self._levels[1:]],
+            "right_edge": list(self._right_edge),
+            "root": self.root,
+        }
+
+    @classmethod
+    def from_json(cls, json_data: dict) -> "MerkleTree":
+        """
+        Reconstruct a MerkleTree from to_json() output.
+
+        Stored nodes are trusted as serialized; only the leaf-position index is
+        rebuilt, so no hashing is performed.
+
+        Args:
+            json_data: Dictionary representation from to_json().
+
+        Returns:
+            Reconstructed MerkleTree instance.
+        """
+        tree = cls.__new__(cls)
+        tree.leaves = list(json_data["leaves"])
+        tree._levels = [tree.leaves] + [list(level) for level in json_data.get("levels", [])]
+        tree._leaf_index = cls._build_leaf_index(tree.leaves)
+        if "right_edge" in json_data and "root" in json_data:
+            tree._right_edge = list(json_data["right_edge"])
+            tree.root = json_data["root"]
+        else:
+            tree.root = tree._compute_right_edge()
+
+        tree._init_caches(
+            MERKLE_PROOF_CACHE_SIZE, MERKLE_PROOF_CACHE_BYTES, MERKLE_VERIFICATION_CACHE_SIZE
+        )
+        return tree
+
     def clear_cache(self) -> None:
         self._proof_cache.clear()
         self._verification_cache.clear()
-        self._proof_cache_hits = 0
-        self._proof_cache_misses = 0
-        self._verification_cache_hits = 0
-        self._verification_cache_misses = 0
+        self._proof_cache.metrics.reset()
+        self._verification_cache.metrics.reset()
 
     def get_cache_stats(self) -> dict[str, int]:
+        proof = self._proof_cache.get_stats()
+        verification = self._verification_cache.get_stats()
         return {
-            "proof_cache_size": len(self._proof_cache),
-            "proof_cache_hits": self._proof_cache_hits,
-            "proof_cache_misses": self._proof_cache_misses,
-            "verification_cache_size": len(self._verification_cache),
-            "verification_cache_hits": self._verification_cache_hits,
-            "verification_cache_misses": self._verification_cache_misses,
+            "proof_cache_size": proof["size"],
+            "proof_cache_bytes": proof["bytes"],
+            "proof_cache_hits": proof["hits"],
+            "proof_cache_misses": proof["misses"],
+            "proof_cache_evictions": proof["evictions"],
+            "verification_cache_size": verification["size"],
+            "verification_cache_hits": verification["hits"],
+            "verification_cache_misses": verification["misses"],
+            "verification_cache_evictions": verification["evictions"],
             "total_leaves": len(self.leaves),
         }
+
+
+class MerkleFrontier:
+    """
+    Constant-size append state of a MerkleTree (Merkle Mountain Range peaks).
+
+    ``peaks[k]`` holds the unpaired last node of stored level k, which exists
+    exactly when bit k of ``leaf_count`` is set. That is enough to keep
+    appending and to derive the same root as the full MerkleTree, without
+    holding any other leaves or nodes in memory.
+    """
+
+    def __init__(self, leaf_count: int = 0, peaks: Optional[List[Optional[str]]] = None):
+        self.leaf_count = leaf_count
+        self.peaks: List[Optional[str]] = list(peaks or [])
+        expected = [k for k in range(leaf_count.bit_length()) if (leaf_count >> k) & 1]
+        actual = [k for k, peak in enumerate(self.peaks) if peak is not None]
+        if expected != actual:
+            raise ValueError(f"Peaks do not match leaf count {leaf_count}")
+
+    def append(self, leaf_hash: str) -> str:
+        """Append a leaf and return the new root."""
+        carry = leaf_hash
+        level = 0
+        while (self.leaf_count >> level) & 1:
+            carry = MerkleTree._hash_pair(self.peaks[level], carry)
+            self.peaks[level] = None
+            level += 1
+        if level == len(self.peaks):
+            self.peaks.append(None)
+        self.peaks[level] = carry
+        self.leaf_count += 1
+        return self.get_root()
+
+    def get_root(self) -> str:
+        """Derive the root exactly as MerkleTree does (odd nodes are duplicated)."""
+        if self.leaf_count == 0:
+            return sha256_hash(b"empty_tree")
+        return _frontier_root(self.leaf_count, self.peaks, MerkleTree._hash_pair)
+
+    def to_json(self) -> dict:
+        return {"leaf_count": self.leaf_count, "peaks": list(self.peaks), "root": self.get_root()}
+
+    @classmethod
+    def from_json(cls, json_data: dict) -> "MerkleFrontier":
+        return cls(json_data["leaf_count"], json_data.get("peaks", []))
@@ -11,14 +11,155 @@ Version: 1.0.0
 
 import base64
 import hashlib
-from typing import Optional, Tuple
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
 from cryptography.exceptions import InvalidSignature
 
+from .constants import SIGNATURE_VERIFY_CHUNK_SIZE, SIGNATURE_VERIFY_PARALLEL_MIN
 from .interfaces import Signer
 
+ED25519_SIGNATURE_LENGTH = 64
+
+
+@dataclass
+class BatchVerificationResult:
+    """Per-item results and summary of a verify_many() call."""
+    results: List[bool]
+    malformed: int = 0
+    workers: int = 1
+    elapsed_seconds: float = 0.0
+    invalid_indices: List[int] = field(default_factory=list)
+    
+    def __post_init__(self):
+        if not self.invalid_indices:
+            self.invalid_indices = [i for i, ok in enumerate(self.results) if not ok]
+    
+    @property
+    def total(self) -> int:
+        return len(self.results)
+    
+    @property
+    def valid(self) -> int:
+        return self.total - len(self.invalid_indices)
+    
+    @property
+    def all_valid(self) -> bool:
+        return not self.invalid_indices
+    
+    def summary(self) -> Dict[str, Any]:
+        """Counts, timing and throughput for reporting."""
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": len(self.invalid_indices),
+            "malformed": self.malformed,
+            "workers": self.workers,
+            "elapsed_seconds": self.elapsed_seconds,
+            "signatures_per_second": self.total / self.elapsed_seconds if self.elapsed_seconds else 0.0,
+        }
+
+
+def _decode_signature(signature: str) -> Optional[bytes]:
+    """Decode a base64 signature as verify() does; None if it cannot be valid."""
+    try:
+        raw = base64.b64decode(signature.encode('ascii'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return raw if len(raw) == ED25519_SIGNATURE_LENGTH else None
+
+
+def _verify_raw(public_key: Ed25519PublicKey, items: List[Tuple[bytes, Optional[bytes]]]) -> List[bool]:
+    results = []
+    for data, signature in items:
+        if signature is None:
+            results.append(False)
+            continue
+        try:
+            public_key.verify(signature, data)
+            results.append(True)
+        except (InvalidSignature, TypeError):
+            results.append(False)
+    return results
+
+
+# Public key loaded once per pool worker
+_worker_public_key: Optional[Ed25519PublicKey] = None
+
+
+def _raw_public_bytes(public_key: Ed25519PublicKey) -> bytes:
+    """Raw 32-byte Ed25519 public key (public_bytes_raw() needs cryptography 40+)."""
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw
+    )
+
+
+def _init_verify_worker(public_key_raw: bytes) -> None:
+    global _worker_public_key
+    _worker_public_key = Ed25519PublicKey.from_public_bytes(public_key_raw)
+
+
+def _verify_chunk(items: List[Tuple[bytes, Optional[bytes]]]) -> List[bool]:
+    return _verify_raw(_worker_public_key, items)
+
+
+def verify_ed25519_many(
+    public_key: Ed25519PublicKey,
+    items: Iterable[Tuple[bytes, str]],
+    workers: Optional[int] = None,
+    chunk_size: int = SIGNATURE_VERIFY_CHUNK_SIZE,
+    parallel_min: int = SIGNATURE_VERIFY_PARALLEL_MIN
+) -> BatchVerificationResult:
+    """
+    Verify many (data, base64 signature) pairs against one public key.
+    
+    Signatures are decoded up front (malformed ones fail without a curve
+    operation). Batches of at least ``parallel_min`` items are split into
+    chunks and verified on a process pool; smaller batches, or ``workers=1``,
+    are verified in-process.
+    
+    Args:
+        public_key: Ed25519 public key
+        items: Iterable of (data, base64 signature) pairs
+        workers: Pool size (defaults to the machine's CPU count)
+        chunk_size: Signatures per worker task
+        parallel_min: Minimum batch size for using the process pool
+        
+    Returns:
+        BatchVerificationResult with results in input order
+    """
+    start = time.perf_counter()
+    decoded = [(data, _decode_signature(signature)) for data, signature in items]
+    malformed = sum(1 for _, signature in decoded if signature is None)
+    
+    workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+    chunk_size = max(1, chunk_size)
+    if workers == 1 or len(decoded) < max(parallel_min, 2 * chunk_size):
+        results = _verify_raw(public_key, decoded)
+        workers = 1
+    else:
+        chunks = [decoded[i:i + chunk_size] for i in range(0, len(decoded), chunk_size)]
+        workers = min(workers, len(chunks))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_verify_worker,
+            initargs=(_raw_public_bytes(public_key),)
+        ) as pool:
+            results = [ok for chunk in pool.map(_verify_chunk, chunks) for ok in chunk]
+    
+    return BatchVerificationResult(
+        results=results,
+        malformed=malformed,
+        workers=workers,
+        elapsed_seconds=time.perf_counter() - start
+    )
+
 
 class Ed25519Signer:
     """Production Ed25519 digital signer implementing the Signer protocol."""
@@ -66,6 +207,15 @@ class Ed25519Signer:
         except (InvalidSignature, ValueError, TypeError):
             return False
     
+    def verify_many(
+        self,
+        items: Iterable[Tuple[bytes, str]],
+        workers: Optional[int] = None,
+        chunk_size: int = SIGNATURE_VERIFY_CHUNK_SIZE
+    ) -> BatchVerificationResult:
+        """Verify many (data, signature) pairs against this key (see Ed25519Verifier.verify_many)."""
+        return verify_ed25519_many(self._public_key, items, workers, chunk_size)
+    
     def get_public_key_pem(self) -> str:
         """
         Get the public key in PEM format.
@@ -100,7 +250,7 @@ class Ed25519Signer:
         Returns:
             Hex-encoded SHA256 hash of the public key
         """
-        public_key_bytes = self._public_key.public_bytes_raw()
+        public_key_bytes = _raw_public_bytes(self._public_key)
         return hashlib.sha256(public_key_bytes).hexdigest()
     
     @classmethod
@@ -174,6 +324,25 @@ class Ed25519Verifier:
         except (InvalidSignature, ValueError, TypeError):
             return False
     
+    def verify_many(
+        self,
+        items: Iterable[Tuple[bytes, str]],
+        workers: Optional[int] = None,
+        chunk_size: int = SIGNATURE_VERIFY_CHUNK_SIZE
+    ) -> BatchVerificationResult:
+        """
+        Verify many (data, base64 signature) pairs, in parallel for large batches.
+        
+        Args:
+            items: Iterable of (data, signature) pairs
+            workers: Process pool size (defaults to the CPU count; 1 disables the pool)
+            chunk_size: Signatures per worker task
+            
+        Returns:
+            BatchVerificationResult with per-item results and a summary
+        """
+        return verify_ed25519_many(self._public_key, items, workers, chunk_size)
+    
     def get_public_key_fingerprint(self) -> str:
         """
         Get a SHA256 fingerprint of the public key.
@@ -181,7 +350,7 @@ class Ed25519Verifier:
         Returns:
             Hex-encoded SHA256 hash of the public key
         """
-        public_key_bytes = self._public_key.public_bytes_raw()
+        public_key_bytes = _raw_public_bytes(self._public_key)
         return hashlib.sha256(public_key_bytes).hexdigest()
 
 
@@ -14,7 +14,18 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Dict, List, Any
 
-from .canonicalization import canonical_json, canonicalize_and_hash, make_anchor, Policy
+from .canonicalization import (
+    ANCHOR_RECORD_SCHEMA,
+    ORJSON_AVAILABLE,
+    AnchorRecord,
+    Policy,
+    Receipt,
+    _orjson_canonical,
+    canonical_json,
+    canonical_json_stdlib,
+    canonicalize_and_hash,
+    make_anchor,
+)
 from .crypto import sha256_hash, compute_hash
 from .determinism import DeterministicClock, canonical_timestamp
 from .enums import HashAlgorithm, RecordType
@@ -22,6 +33,33 @@ from .merkle import MerkleTree
 from .signers import Ed25519Signer
 
 
+CANONICALIZATION_TEST_OBJECTS = [
+    {},
+    {"key": "value"},
+    {"b": 2, "a": 1},  # Test sorting
+    {"nested": {"z": 3, "a": 1}, "top": "level"},
+    {"array": [3, 1, 2], "string": "test"},
+    {"unicode": "🎉", "special": "àáâãäå"},
+    {"number": 42, "float": 3.14159, "bool": True, "null": None},
+]
+
+# Inputs where a fast JSON backend is most likely to diverge from the stdlib
+CANONICAL_ENCODER_EDGE_CASES = [
+    [],
+    "top-level string",
+    12345,
+    {"floats": [0.1, 1e-05, 1e16, 1e22, 1.5e300, -0.0, 100.0, 5e-324]},
+    {"special_floats": [float("nan"), float("inf"), float("-inf")]},
+    {"big_ints": [2 ** 63, -2 ** 63 - 1, 2 ** 64, 10 ** 30]},
+    {"control": "\x00\x01\x1f\x7f\b\f\n\r\t", "quote": '"\\/'},
+    {"separators": "\u2028\u2029", "astral": "\U0001f389"},
+    {"é": 1, "e": 2, "z": 3, "Z": 4, "_": 5, "10": 6, "9": 7},
+    {"tuple": (1, "two", [3]), "deep": {"a": {"b": {"c": {"d": [{}]}}}}},
+    {"looks_like_float": "time:12.5", "hex": "3e8f" * 16, "none": None},
+    {"bool_int": [True, False, 0, 1], "empty": {"list": [], "dict": {}}},
+]
+
+
 @dataclass
 class TestVector:
     """Single test vector with input, expected output, and metadata."""
@@ -96,17 +134,7 @@ class CIAFTestVectors:
         """Generate test vectors for JSON canonicalization."""
         vectors = []
         
-        test_objects = [
-            {},
-            {"key": "value"},
-            {"b": 2, "a": 1},  # Test sorting
-            {"nested": {"z": 3, "a": 1}, "top": "level"},
-            {"array": [3, 1, 2], "string": "test"},
-            {"unicode": "🎉", "special": "àáâãäå"},
-            {"number": 42, "float": 3.14159, "bool": True, "null": None},
-        ]
-        
-        for i, test_obj in enumerate(test_objects):
+        for i, test_obj in enumerate(CANONICALIZATION_TEST_OBJECTS):
             canonical = canonical_json(test_obj)
             hash_result = canonicalize_and_hash(test_obj, HashAlgorithm.SHA256)
             
@@ -318,6 +346,75 @@ class CIAFTestVectors:
         
         return vectors
     
+    def validate_canonical_encoder(self) -> Dict[str, Any]:
+        """
+        Check that the canonical JSON encoder matches the stdlib reference byte for byte.
+        
+        Covers the canonicalization vector inputs and encoder edge cases
+        through canonical_json() and, when installed, the orjson fast path
+        directly, plus the precompiled schemas of AnchorRecord and Receipt.
+        
+        Returns:
+            Conformance report
+        """
+        results = {
+            'backend': 'orjson' if ORJSON_AVAILABLE else 'stdlib',
+            'total_tests': 0,
+            'passed': 0,
+            'failed': 0,
+            'failures': []
+        }
+        
+        def check(name: str, expected: str, actual: str) -> None:
+            results['total_tests'] += 1
+            if expected == actual:
+                results['passed'] += 1
+            else:
+                results['failed'] += 1
+                results['failures'].append({'test': name, 'expected': expected, 'actual': actual})
+        
+        for i, test_obj in enumerate(CANONICALIZATION_TEST_OBJECTS + CANONICAL_ENCODER_EDGE_CASES):
+            expected = canonical_json_stdlib(test_obj)
+            check(f"canonical_json_{i+1}", expected, canonical_json(test_obj))
+            if ORJSON_AVAILABLE:
+                fast = _orjson_canonical(test_obj)
+                if fast is not None:
+                    check(f"orjson_fast_path_{i+1}", expected, fast)
+        
+        anchor = AnchorRecord(
+            root="a" * 64,
+            policy_id="policy_é",
+            schema_version="1.0",
+            timestamp=self.fixed_time.isoformat(),
+            domain_labels=["finance", "audit", "\u2028"],
+            signature="sig",
+            signing_key_id="key_1",
+            external_anchor=None
+        )
+        anchor_data = {
+            "root": anchor.root,
+            "policy_id": anchor.policy_id,
+            "schema_version": anchor.schema_version,
+            "timestamp": anchor.timestamp,
+            "domain_labels": sorted(anchor.domain_labels)
+        }
+        check("anchor_signing_schema", canonical_json_stdlib(anchor_data), anchor.get_anchor_bytes().decode('utf-8'))
+        check("anchor_record_schema", canonical_json_stdlib(asdict(anchor)), ANCHOR_RECORD_SCHEMA.encode_object(anchor))
+        
+        for i, metadata in enumerate(CANONICALIZATION_TEST_OBJECTS + CANONICAL_ENCODER_EDGE_CASES[3:]):
+            receipt = Receipt(metadata=metadata, anchor=anchor, leaf_hash="b" * 64, record_type=RecordType.DATASET)
+            receipt_data = {
+                "metadata": metadata,
+                "anchor": asdict(anchor),
+                "leaf_hash": receipt.leaf_hash,
+                "record_type": receipt.record_type.value
+            }
+            check(f"receipt_schema_{i+1}", sha256_hash(canonical_json_stdlib(receipt_data).encode('utf-8')),
+                  receipt.get_receipt_hash())
+        
+        results['success_rate'] = results['passed'] / results['total_tests'] if results['total_tests'] > 0 else 0
+        return results
+    
     def generate_all_vectors(self) -> TestVectorSuite:
         """Generate complete test vector suite."""
         all_vectors = []
@@ -411,6 +508,12 @@ def export_test_vectors(file_path: str = "ciaf_test_vectors.json") -> str:
     return generator.export_vectors_json(file_path)
 
 
+def validate_canonical_encoder() -> Dict[str, Any]:
+    """Run the canonical JSON encoder conformance checks against the stdlib reference."""
+    generator = CIAFTestVectors()
+    return generator.validate_canonical_encoder()
+
+
 def load_test_vectors(file_path: str) -> TestVectorSuite:
     """Load test vectors from JSON file."""
     with open(file_path, 'r') as f:
@@ -10,13 +10,18 @@ Version: 1.0.0
 """
 
 import json
+import queue
 import sqlite3
+import struct
 import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     import lmdb
@@ -24,11 +29,28 @@ try:
 except ImportError:
     LMDB_AVAILABLE = False
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 from .canonicalization import AnchorRecord
 from .crypto import sha256_hash
 from .enums import RecordType
 from .interfaces import Merkle
-from .merkle import MerkleTree
+from .merkle import MerkleFrontier, MerkleTree, verify_consistency_proof
+
+# Records fetched per round trip when streaming a tree's leaves
+TREE_SCAN_BATCH_SIZE = 1000
+
+# Record encodings: canonical JSON text, or a framed msgpack payload
+RECORD_FORMATS = ("json", "msgpack")
+
+# Binary frame: magic, format version, payload length (big-endian), payload
+_FRAME_MAGIC = b"CWR"
+_FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct(">3sBI")
 
 
 @dataclass
@@ -45,6 +67,167 @@ class WORMRecord:
             self.hash = sha256_hash(json.dumps(self.data, sort_keys=True).encode('utf-8'))
 
 
+def _record_tree_id(record: WORMRecord) -> Optional[str]:
+    """Tree identifier carried by DurableWORMMerkleTree leaf records, if any."""
+    tree_id = record.data.get('tree_id') if isinstance(record.data, dict) else None
+    return tree_id if isinstance(tree_id, str) else None
+
+
+@dataclass
+class RecordPage:
+    """One page of a keyset-paginated record listing."""
+    records: List[WORMRecord]
+    # Pass as after_seq to fetch the next page; None once the listing is exhausted
+    next_after_seq: Optional[int]
+
+
+TimeBound = Union[str, datetime, None]
+
+
+def _time_bound(value: TimeBound) -> Optional[str]:
+    """Normalize a time filter to the ISO-8601 form records are stored with."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _matches(record: WORMRecord, record_type: Optional[RecordType],
+             start_time: Optional[str], end_time: Optional[str]) -> bool:
+    """Client-side equivalent of the stores' record filters."""
+    if record_type is not None and record.record_type != record_type:
+        return False
+    if start_time is not None and record.timestamp < start_time:
+        return False
+    if end_time is not None and record.timestamp >= end_time:
+        return False
+    return True
+
+
+def _check_record_format(record_format: str) -> str:
+    """Validate a record format name and its optional dependency."""
+    if record_format not in RECORD_FORMATS:
+        raise ValueError(f"Unknown record format {record_format!r}; expected one of {RECORD_FORMATS}")
+    if record_format == "msgpack" and not MSGPACK_AVAILABLE:
+        raise ImportError("msgpack is required for the msgpack record format (pip install msgpack)")
+    return record_format
+
+
+def _frame(value: Any) -> Optional[bytes]:
+    """msgpack-encode a value into a versioned, length-prefixed frame (None if not representable)."""
+    try:
+        payload = msgpack.packb(value, use_bin_type=True)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return _FRAME_HEADER.pack(_FRAME_MAGIC, _FRAME_VERSION, len(payload)) + payload
+
+
+def _is_frame(value: Any) -> bool:
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:3]) == _FRAME_MAGIC
+
+
+def _unframe(value: bytes) -> Any:
+    """Decode a frame produced by _frame()."""
+    if not MSGPACK_AVAILABLE:
+        raise ImportError("msgpack is required to read msgpack-encoded WORM records (pip install msgpack)")
+    value = bytes(value)
+    magic, version, length = _FRAME_HEADER.unpack_from(value)
+    if version != _FRAME_VERSION:
+        raise ValueError(f"Unsupported WORM record frame version {version}")
+    payload = value[_FRAME_HEADER.size:]
+    if len(payload) != length:
+        raise ValueError(f"Truncated WORM record frame ({len(payload)} of {length} bytes)")
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+def encode_record_data(data: Dict[str, Any], record_format: str = "json") -> Any:
+    """
+    Encode a record's data payload for storage.
+    
+    The record hash is always computed over canonical JSON, independent of the
+    storage encoding. Payloads msgpack cannot represent losslessly (e.g. integers
+    beyond 64 bits) fall back to JSON, which decode_record_data() detects per value.
+    
+    Args:
+        data: Record data dictionary
+        record_format: "json" (TEXT) or "msgpack" (framed BLOB)
+        
+    Returns:
+        JSON string or framed msgpack bytes
+    """
+    if record_format == "msgpack":
+        framed = _frame(data)
+        if framed is not None:
+            return framed
+    return json.dumps(data, sort_keys=True)
+
+
+def decode_record_data(value: Any) -> Dict[str, Any]:
+    """Decode a payload written by encode_record_data() in either format."""
+    if _is_frame(value):
+        return _unframe(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        value = bytes(value).decode('utf-8')
+    return json.loads(value)
+
+
+def encode_record(record: WORMRecord, record_format: str = "json") -> bytes:
+    """
+    Encode a complete record (LMDB value).
+    
+    The msgpack format is a fixed-order array [id, timestamp, record_type, hash, data]
+    with a lowercase hex SHA-256 hash stored as its raw 32 bytes.
+    
+    Args:
+        record: Record to encode
+        record_format: "json" or "msgpack"
+        
+    Returns:
+        Encoded record bytes
+    """
+    if record_format == "msgpack":
+        digest: Any = record.hash
+        if len(digest) == 64:
+            try:
+                raw = bytes.fromhex(digest)
+            except ValueError:
+                raw = None
+            if raw is not None and raw.hex() == digest:
+                digest = raw
+        framed = _frame([record.id, record.timestamp, record.record_type.value, digest, record.data])
+        if framed is not None:
+            return framed
+    return json.dumps({
+        'id': record.id,
+        'timestamp': record.timestamp,
+        'record_type': record.record_type.value,
+        'data': record.data,
+        'hash': record.hash
+    }, sort_keys=True).encode('utf-8')
+
+
+def decode_record(value: bytes) -> WORMRecord:
+    """Decode a record written by encode_record() in either format."""
+    if _is_frame(value):
+        record_id, timestamp, record_type, digest, data = _unframe(value)
+        return WORMRecord(
+            id=record_id,
+            timestamp=timestamp,
+            record_type=RecordType(record_type),
+            data=data,
+            hash=digest.hex() if isinstance(digest, bytes) else digest
+        )
+    record_dict = json.loads(bytes(value).decode('utf-8'))
+    return WORMRecord(
+        id=record_dict['id'],
+        timestamp=record_dict['timestamp'],
+        record_type=RecordType(record_dict['record_type']),
+        data=record_dict['data'],
+        hash=record_dict['hash']
+    )
+
+
+def _canonical_json(data: Any) -> str:
+    return json.dumps(data, sort_keys=True)
+
+
 class WORMStore(ABC):
     """Abstract base class for WORM storage implementations."""
     
@@ -67,23 +250,166 @@ class WORMStore(ABC):
     def close(self):
         """Close the store and clean up resources."""
         ...
+    
+    def iter_records(
+        self,
+        record_type: Optional[RecordType] = None,
+        start_time: TimeBound = None,
+        end_time: TimeBound = None,
+        after_seq: int = 0,
+        max_seq: Optional[int] = None,
+        batch_size: int = TREE_SCAN_BATCH_SIZE
+    ) -> Iterator[Tuple[int, WORMRecord]]:
+        """
+        Stream (seq, record) pairs in append order.
+        
+        Stores with a sequence index override this to filter server-side and
+        read in bounded batches; the default filters list_records().
+        
+        Args:
+            record_type: Only yield records of this type
+            start_time: Inclusive lower bound on the record timestamp
+            end_time: Exclusive upper bound on the record timestamp
+            after_seq: Only yield records with a sequence number greater than this
+            max_seq: Only yield records with a sequence number up to this (inclusive)
+            batch_size: Records fetched per round trip
+        """
+        start_time, end_time = _time_bound(start_time), _time_bound(end_time)
+        for seq, record in enumerate(self.list_records(), start=1):
+            if max_seq is not None and seq > max_seq:
+                return
+            if seq > after_seq and _matches(record, record_type, start_time, end_time):
+                yield seq, record
+    
+    def list_records_page(
+        self,
+        record_type: Optional[RecordType] = None,
+        start_time: TimeBound = None,
+        end_time: TimeBound = None,
+        after_seq: int = 0,
+        limit: int = TREE_SCAN_BATCH_SIZE
+    ) -> RecordPage:
+        """
+        Return one page of records using keyset pagination on the sequence number.
+        
+        Args:
+            record_type: Only include records of this type
+            start_time: Inclusive lower bound on the record timestamp
+            end_time: Exclusive upper bound on the record timestamp
+            after_seq: Cursor from the previous page's next_after_seq (0 for the first page)
+            limit: Maximum number of records in the page
+            
+        Returns:
+            RecordPage with the records and the cursor for the next page
+        """
+        limit = max(limit, 1)
+        records = []
+        last_seq = after_seq
+        for seq, record in self.iter_records(record_type, start_time, end_time, after_seq, batch_size=limit):
+            records.append(record)
+            last_seq = seq
+            if len(records) == limit:
+                return RecordPage(records, last_seq)
+        return RecordPage(records, None)
+    
+    def iter_tree_records(self, tree_id: str, after_seq: int = 0) -> Iterator[Tuple[int, WORMRecord]]:
+        """
+        Yield (seq, record) for the leaf records of a Merkle tree in append order.
+        
+        Stores with a tree_id index override this; the default filters iter_records().
+        
+        Args:
+            tree_id: Tree identifier stored in the record data
+            after_seq: Only yield records with a sequence number greater than this
+        """
+        for seq, record in self.iter_records(RecordType.DATASET, after_seq=after_seq):
+            if _record_tree_id(record) == tree_id:
+                yield seq, record
+    
+    def save_tree_snapshot(self, tree_id: str, snapshot: Dict[str, Any]) -> bool:
+        """Persist a frontier snapshot for a tree. Returns False if unsupported."""
+        return False
+    
+    def load_tree_snapshot(self, tree_id: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent frontier snapshot for a tree, if any."""
+        return None
 
 
 class SQLiteWORMStore(WORMStore):
-    """SQLite-based WORM store for production deployments."""
+    """
+    SQLite-based WORM store for production deployments.
+    
+    With ``group_commit`` enabled, concurrent ``append_record`` calls are handed
+    to a single writer thread that inserts them in one transaction and commits
+    once. Every caller still returns only after the COMMIT covering its record
+    has completed (``synchronous=FULL``), so durability is unchanged while the
+    fsync cost is shared across the batch.
+    
+    With ``record_format="msgpack"`` the data column holds a framed msgpack
+    BLOB instead of JSON text. Rows of both encodings can coexist; reads
+    detect the encoding per row.
     
-    def __init__(self, db_path: Optional[str] = None):
+    With ``read_only`` the database is opened without write access and no
+    schema migration is run; ``needs_migration`` reports whether the
+    schema predates the seq/tree_id columns.
+    """
+    
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        group_commit: bool = False,
+        commit_window_ms: float = 0.0,
+        max_batch_size: int = 512,
+        record_format: str = "json",
+        read_only: bool = False
+    ):
         """
         Initialize SQLite WORM store.
         
         Args:
             db_path: Path to SQLite database file. If None, creates temporary file.
+            group_commit: Batch concurrent appends into shared transactions
+            commit_window_ms: Extra time the writer waits to fill a batch (0 commits
+                whatever is queued as soon as the previous commit finishes)
+            max_batch_size: Maximum number of records per transaction
+            record_format: Encoding for new record payloads ("json" or "msgpack")
+            read_only: Open an existing database for reading only, without migrating it
         """
-        self.db_path = db_path or tempfile.mktemp(suffix='.db')
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.execute('PRAGMA journal_mode=WAL')  # Better concurrency
-        self.conn.execute('PRAGMA synchronous=FULL')  # Durability
-        self._init_schema()
+        self.record_format = _check_record_format(record_format)
+        self.read_only = read_only
+        self._lock = threading.RLock()
+        if read_only:
+            if not db_path or not Path(db_path).exists():
+                raise FileNotFoundError(f"WORM store not found: {db_path}")
+            self.db_path = db_path
+            self.conn = sqlite3.connect(
+                Path(db_path).resolve().as_uri() + '?mode=ro', uri=True, check_same_thread=False
+            )
+            columns = {row[1] for row in self.conn.execute('PRAGMA table_info(worm_records)')}
+            self.needs_migration = not {'seq', 'tree_id'} <= columns
+            group_commit = False
+        else:
+            self.db_path = db_path or tempfile.mktemp(suffix='.db')
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute('PRAGMA journal_mode=WAL')  # Better concurrency
+            self.conn.execute('PRAGMA synchronous=FULL')  # Durability
+            self._init_schema()
+            self.needs_migration = False
+        
+        self.group_commit = group_commit
+        self.commit_window = max(commit_window_ms, 0.0) / 1000.0
+        self.max_batch_size = max(max_batch_size, 1)
+        self._queue: "queue.Queue[Optional[tuple[WORMRecord, Future]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._submit_lock = threading.Lock()
+        self._closed = False
+        self.batch_stats = {"batches": 0, "records": 0, "max_batch": 0}
+        
+        if group_commit:
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="ciaf-worm-group-commit", daemon=True
+            )
+            self._writer.start()
     
     def _init_schema(self):
         """Initialize database schema."""
@@ -94,10 +420,14 @@ class SQLiteWORMStore(WORMStore):
                 record_type TEXT NOT NULL,
                 data TEXT NOT NULL,
                 hash TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                seq INTEGER,
+                tree_id TEXT
             )
         ''')
         
+        self._migrate_schema()
+        
         self.conn.execute('''
             CREATE INDEX IF NOT EXISTS idx_record_type ON worm_records(record_type)
         ''')
@@ -110,38 +440,147 @@ class SQLiteWORMStore(WORMStore):
             CREATE INDEX IF NOT EXISTS idx_hash ON worm_records(hash)
         ''')
         
+        # Append order and per-tree lookups
+        self.conn.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_seq ON worm_records(seq)
+        ''')
+        
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tree_seq ON worm_records(tree_id, seq)
+        ''')
+        
+        self.conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_type_seq ON worm_records(record_type, seq)
+        ''')
+        
+        # Persisted Merkle frontier snapshots for fast DurableWORMMerkleTree startup
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS tree_snapshots (
+                tree_id TEXT NOT NULL,
+                leaf_count INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                root TEXT NOT NULL,
+                peaks TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (tree_id, leaf_count)
+            )
+        ''')
+        
         self.conn.commit()
     
+    def _migrate_schema(self):
+        """Add and backfill the seq/tree_id columns on databases created before they existed."""
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(worm_records)')}
+        if 'seq' not in columns:
+            self.conn.execute('ALTER TABLE worm_records ADD COLUMN seq INTEGER')
+            # rowid order is insertion order for an append-only table
+            self.conn.execute('UPDATE worm_records SET seq = rowid')
+        if 'tree_id' not in columns:
+            self.conn.execute('ALTER TABLE worm_records ADD COLUMN tree_id TEXT')
+            rows = self.conn.execute('SELECT id, data FROM worm_records').fetchall()
+            for record_id, data in rows:
+                tree_id = decode_record_data(data).get('tree_id') if data else None
+                if isinstance(tree_id, str):
+                    self.conn.execute(
+                        'UPDATE worm_records SET tree_id = ? WHERE id = ?', (tree_id, record_id)
+                    )
+    
+    def _insert(self, record: WORMRecord) -> None:
+        """Insert a record; the PRIMARY KEY constraint enforces WORM uniqueness."""
+        try:
+            self.conn.execute('''
+                INSERT INTO worm_records (id, timestamp, record_type, data, hash, seq, tree_id)
+                VALUES (?, ?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM worm_records), ?)
+            ''', (
+                record.id,
+                record.timestamp,
+                record.record_type.value,
+                encode_record_data(record.data, self.record_format),
+                record.hash,
+                _record_tree_id(record)
+            ))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Record {record.id} already exists (WORM violation)") from None
+    
     def append_record(self, record: WORMRecord) -> str:
         """Append a record to the WORM store."""
-        # Check for duplicate ID (WORM violation)
-        cursor = self.conn.execute('SELECT id FROM worm_records WHERE id = ?', (record.id,))
-        if cursor.fetchone():
-            raise ValueError(f"Record {record.id} already exists (WORM violation)")
-        
-        # Insert record
-        self.conn.execute('''
-            INSERT INTO worm_records (id, timestamp, record_type, data, hash)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (
-            record.id,
-            record.timestamp,
-            record.record_type.value,
-            json.dumps(record.data, sort_keys=True),
-            record.hash
-        ))
+        if self._writer is not None:
+            pending: Future = Future()
+            with self._submit_lock:
+                if self._closed:
+                    raise RuntimeError("WORM store is closed")
+                self._queue.put((record, pending))
+            # Blocks until the transaction containing this record is committed
+            return pending.result()
         
-        self.conn.commit()
+        with self._lock:
+            try:
+                self._insert(record)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
         return record.id
     
+    def _collect_batch(self) -> Optional[List[tuple]]:
+        """Wait for the next append and gather whatever else fits into the batch."""
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.commit_window
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                # Finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+    
+    def _writer_loop(self) -> None:
+        """Group-commit writer: one transaction and one fsync per batch."""
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                return
+            
+            accepted = []
+            with self._lock:
+                try:
+                    for record, pending in batch:
+                        try:
+                            self._insert(record)
+                            accepted.append((record, pending))
+                        except ValueError as exc:
+                            pending.set_exception(exc)
+                    self.conn.commit()
+                except Exception as exc:
+                    self.conn.rollback()
+                    for _, pending in batch:
+                        if not pending.done():
+                            pending.set_exception(exc)
+                    continue
+            
+            for record, pending in accepted:
+                pending.set_result(record.id)
+            
+            self.batch_stats["batches"] += 1
+            self.batch_stats["records"] += len(accepted)
+            self.batch_stats["max_batch"] = max(self.batch_stats["max_batch"], len(batch))
+    
     def get_record(self, record_id: str) -> Optional[WORMRecord]:
         """Retrieve a record by ID."""
-        cursor = self.conn.execute('''
-            SELECT id, timestamp, record_type, data, hash
-            FROM worm_records WHERE id = ?
-        ''', (record_id,))
+        with self._lock:
+            row = self.conn.execute('''
+                SELECT id, timestamp, record_type, data, hash
+                FROM worm_records WHERE id = ?
+            ''', (record_id,)).fetchone()
         
-        row = cursor.fetchone()
         if not row:
             return None
         
@@ -149,54 +588,223 @@ class SQLiteWORMStore(WORMStore):
             id=row[0],
             timestamp=row[1],
             record_type=RecordType(row[2]),
-            data=json.loads(row[3]),
+            data=decode_record_data(row[3]),
             hash=row[4]
         )
     
     def list_records(self, record_type: Optional[RecordType] = None) -> List[WORMRecord]:
-        """List all records, optionally filtered by type."""
-        if record_type:
-            cursor = self.conn.execute('''
-                SELECT id, timestamp, record_type, data, hash
-                FROM worm_records WHERE record_type = ?
-                ORDER BY created_at ASC
-            ''', (record_type.value,))
-        else:
-            cursor = self.conn.execute('''
-                SELECT id, timestamp, record_type, data, hash
-                FROM worm_records ORDER BY created_at ASC
-            ''')
-        
-        return [
-            WORMRecord(
-                id=row[0],
-                timestamp=row[1],
-                record_type=RecordType(row[2]),
-                data=json.loads(row[3]),
-                hash=row[4]
-            )
-            for row in cursor.fetchall()
-        ]
+        """List all records in append order, optionally filtered by type."""
+        return [record for _, record in self.iter_records(record_type)]
+    
+    def iter_records(
+        self,
+        record_type: Optional[RecordType] = None,
+        start_time: TimeBound = None,
+        end_time: TimeBound = None,
+        after_seq: int = 0,
+        max_seq: Optional[int] = None,
+        batch_size: int = TREE_SCAN_BATCH_SIZE
+    ) -> Iterator[Tuple[int, WORMRecord]]:
+        """Stream (seq, record) pairs with filters evaluated in SQL, one bounded query per batch."""
+        conditions = ['seq > ?']
+        params: List[Any] = []
+        if record_type is not None:
+            conditions.append('record_type = ?')
+            params.append(record_type.value)
+        if start_time is not None:
+            conditions.append('timestamp >= ?')
+            params.append(_time_bound(start_time))
+        if end_time is not None:
+            conditions.append('timestamp < ?')
+            params.append(_time_bound(end_time))
+        if max_seq is not None:
+            conditions.append('seq <= ?')
+            params.append(max_seq)
+        query = f'''
+            SELECT seq, id, timestamp, record_type, data, hash
+            FROM worm_records WHERE {' AND '.join(conditions)}
+            ORDER BY seq ASC LIMIT ?
+        '''
+        batch_size = max(batch_size, 1)
+        
+        while True:
+            with self._lock:
+                rows = self.conn.execute(query, (after_seq, *params, batch_size)).fetchall()
+            for row in rows:
+                yield row[0], WORMRecord(
+                    id=row[1],
+                    timestamp=row[2],
+                    record_type=RecordType(row[3]),
+                    data=decode_record_data(row[4]),
+                    hash=row[5]
+                )
+            if len(rows) < batch_size:
+                return
+            after_seq = rows[-1][0]
+    
+    def iter_tree_records(self, tree_id: str, after_seq: int = 0) -> Iterator[Tuple[int, WORMRecord]]:
+        """Yield (seq, record) for a tree via the (tree_id, seq) index, in bounded batches."""
+        while True:
+            with self._lock:
+                rows = self.conn.execute('''
+                    SELECT seq, id, timestamp, record_type, data, hash
+                    FROM worm_records WHERE tree_id = ? AND seq > ?
+                    ORDER BY seq ASC LIMIT ?
+                ''', (tree_id, after_seq, TREE_SCAN_BATCH_SIZE)).fetchall()
+            for row in rows:
+                yield row[0], WORMRecord(
+                    id=row[1],
+                    timestamp=row[2],
+                    record_type=RecordType(row[3]),
+                    data=decode_record_data(row[4]),
+                    hash=row[5]
+                )
+            if len(rows) < TREE_SCAN_BATCH_SIZE:
+                return
+            after_seq = rows[-1][0]
+    
+    def save_tree_snapshot(self, tree_id: str, snapshot: Dict[str, Any]) -> bool:
+        """Persist a frontier snapshot positioned at the tree's latest record."""
+        with self._lock:
+            seq = self.conn.execute(
+                'SELECT MAX(seq) FROM worm_records WHERE tree_id = ?', (tree_id,)
+            ).fetchone()[0]
+            if seq is None:
+                return False
+            self.conn.execute('''
+                INSERT OR IGNORE INTO tree_snapshots (tree_id, leaf_count, seq, root, peaks)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                tree_id,
+                snapshot['leaf_count'],
+                seq,
+                snapshot['root'],
+                json.dumps(snapshot['peaks'])
+            ))
+            self.conn.commit()
+        return True
+    
+    def load_tree_snapshot(self, tree_id: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent frontier snapshot for a tree, if any."""
+        with self._lock:
+            row = self.conn.execute('''
+                SELECT leaf_count, seq, root, peaks FROM tree_snapshots
+                WHERE tree_id = ? ORDER BY leaf_count DESC LIMIT 1
+            ''', (tree_id,)).fetchone()
+        if not row:
+            return None
+        return {
+            'tree_id': tree_id,
+            'leaf_count': row[0],
+            'seq': row[1],
+            'root': row[2],
+            'peaks': json.loads(row[3])
+        }
+    
+    def migrate_record_format(self, target_format: str, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Re-encode stored payloads in place to the target format.
+        
+        Only the storage encoding changes: every rewritten payload is decoded
+        again and must yield the same canonical JSON (and therefore the same
+        record hash) as before, otherwise the batch is rolled back. New appends
+        use the target format afterwards.
+        
+        Args:
+            target_format: "json" or "msgpack"
+            batch_size: Rows re-encoded per transaction
+        
+        Returns:
+            Counts of scanned and converted records
+        """
+        _check_record_format(target_format)
+        stats = {'scanned': 0, 'converted': 0}
+        after_seq = 0
+        while True:
+            with self._lock:
+                rows = self.conn.execute('''
+                    SELECT seq, id, data FROM worm_records
+                    WHERE seq > ? ORDER BY seq ASC LIMIT ?
+                ''', (after_seq, batch_size)).fetchall()
+                try:
+                    for _, record_id, stored in rows:
+                        stats['scanned'] += 1
+                        if _is_frame(stored) == (target_format == "msgpack"):
+                            continue
+                        data = decode_record_data(stored)
+                        encoded = encode_record_data(data, target_format)
+                        if _is_frame(encoded) == _is_frame(stored):
+                            continue  # Not representable in msgpack; stays JSON
+                        if _canonical_json(decode_record_data(encoded)) != _canonical_json(data):
+                            raise ValueError(f"Record {record_id} does not round-trip through {target_format}")
+                        self.conn.execute(
+                            'UPDATE worm_records SET data = ? WHERE id = ?', (encoded, record_id)
+                        )
+                        stats['converted'] += 1
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            if len(rows) < batch_size:
+                break
+            after_seq = rows[-1][0]
+        self.record_format = target_format
+        return stats
     
     def close(self):
-        """Close the database connection."""
+        """Drain pending group-commit writes and close the database connection."""
+        if self._writer is not None:
+            with self._submit_lock:
+                if not self._closed:
+                    self._closed = True
+                    self._queue.put(None)
+            self._writer.join()
         if self.conn:
             self.conn.close()
 
 
 class LMDBWORMStore(WORMStore):
-    """LMDB-based WORM store for high-performance deployments."""
+    """
+    LMDB-based WORM store for high-performance deployments.
+    
+    With ``read_only`` the environment is opened without write access and
+    the sequence backfill is not run; ``needs_migration`` reports whether
+    the store predates the sequence and tree indexes.
+    """
     
-    def __init__(self, db_path: Optional[str] = None, map_size: int = 1024 * 1024 * 1024):
+    # Sub-databases, in the order they are opened
+    _SUB_DBS = (b'records', b'type_index', b'tree_index', b'seq_index', b'tree_snapshots', b'meta')
+    
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        map_size: int = 1024 * 1024 * 1024,
+        record_format: str = "json",
+        read_only: bool = False
+    ):
         """
         Initialize LMDB WORM store.
         
         Args:
             db_path: Path to LMDB database directory. If None, creates temporary directory.
             map_size: Maximum size of LMDB map (default 1GB)
+            record_format: Encoding for new records ("json" or "msgpack"); existing
+                values of either encoding remain readable
+            read_only: Open an existing store for reading only, without backfilling it
         """
         if not LMDB_AVAILABLE:
             raise ImportError("LMDB is required for LMDBWORMStore (pip install lmdb)")
+        self.record_format = _check_record_format(record_format)
+        self.read_only = read_only
+        self.needs_migration = False
+        
+        if read_only:
+            if not db_path or not Path(db_path).is_dir():
+                raise FileNotFoundError(f"WORM store not found: {db_path}")
+            self.db_path = db_path
+            self.env = lmdb.open(db_path, map_size=map_size, max_dbs=8, readonly=True)
+            self._open_read_only()
+            return
         
         self.db_path = db_path or tempfile.mkdtemp()
         Path(self.db_path).mkdir(parents=True, exist_ok=True)
@@ -204,6 +812,7 @@ class LMDBWORMStore(WORMStore):
         self.env = lmdb.open(
             self.db_path,
             map_size=map_size,
+            max_dbs=8,
             sync=True,  # Force synchronous writes for durability
             writemap=False  # Safer for concurrent access
         )
@@ -214,6 +823,77 @@ class LMDBWORMStore(WORMStore):
             self.records_db = self.env.open_db(b'records', txn=txn)
             # Index by record type
             self.type_index_db = self.env.open_db(b'type_index', txn=txn)
+            # Index by tree: tree_id \0 seq -> record id
+            self.tree_index_db = self.env.open_db(b'tree_index', txn=txn)
+            # Append order: big-endian seq -> "record_type:record_id"
+            self.seq_index_db = self.env.open_db(b'seq_index', txn=txn)
+            # Persisted Merkle frontier snapshots: tree_id \0 leaf_count -> snapshot
+            self.snapshots_db = self.env.open_db(b'tree_snapshots', txn=txn)
+            # Store metadata (append sequence counter)
+            self.meta_db = self.env.open_db(b'meta', txn=txn)
+            
+            if txn.get(b'seq', db=self.meta_db) is None or (
+                txn.stat(self.seq_index_db)['entries'] < txn.stat(self.records_db)['entries']
+            ):
+                self._backfill_sequence(txn)
+    
+    def _open_read_only(self) -> None:
+        """Open the sub-databases of an existing store and check whether it needs the backfill."""
+        with self.env.begin() as txn:
+            names = {key for key, _ in txn.cursor()}
+        if not all(name in names for name in self._SUB_DBS):
+            self.needs_migration = True
+            return
+        # Handles opened inside a read transaction would not outlive it
+        (
+            self.records_db, self.type_index_db, self.tree_index_db,
+            self.seq_index_db, self.snapshots_db, self.meta_db,
+        ) = [self.env.open_db(name, create=False) for name in self._SUB_DBS]
+        with self.env.begin() as txn:
+            self.needs_migration = txn.get(b'seq', db=self.meta_db) is None or (
+                txn.stat(self.seq_index_db)['entries'] < txn.stat(self.records_db)['entries']
+            )
+    
+    @staticmethod
+    def _tree_key(tree_id: str, position: int) -> bytes:
+        """Sortable composite key: tree id, NUL, big-endian position."""
+        return tree_id.encode('utf-8') + b'\x00' + struct.pack('>Q', position)
+    
+    def _backfill_sequence(self, txn) -> None:
+        """Assign sequence numbers and index entries to records written before they existed."""
+        # Sequence numbers already fixed by the tree or sequence index are kept
+        assigned = {}
+        for key, record_id in txn.cursor(db=self.tree_index_db):
+            assigned[record_id.decode('utf-8')] = struct.unpack('>Q', key[-8:])[0]
+        for key, type_key in txn.cursor(db=self.seq_index_db):
+            assigned[type_key.decode('utf-8').split(':', 1)[1]] = struct.unpack('>Q', key)[0]
+        
+        existing = []
+        for key, value in txn.cursor(db=self.records_db):
+            record = decode_record(value)
+            if record.id in assigned:
+                seq = assigned[record.id]
+                txn.put(struct.pack('>Q', seq), self._type_key(record), db=self.seq_index_db)
+            else:
+                existing.append((record.timestamp, record.id, record))
+        
+        # Insertion order was not recorded; append timestamps are the best approximation,
+        # filling sequence numbers left free by the indexed records first
+        existing.sort(key=lambda item: (item[0], item[1]))
+        last_seq = int(txn.get(b'seq', default=b'0', db=self.meta_db))
+        used = set(assigned.values())
+        free = (seq for seq in range(1, last_seq + len(existing) + 1) if seq not in used)
+        for seq, (_, record_id, record) in zip(free, existing):
+            txn.put(struct.pack('>Q', seq), self._type_key(record), db=self.seq_index_db)
+            tree_id = _record_tree_id(record)
+            if tree_id is not None:
+                txn.put(self._tree_key(tree_id, seq), record_id.encode('utf-8'), db=self.tree_index_db)
+            last_seq = max(last_seq, seq)
+        txn.put(b'seq', str(last_seq).encode('utf-8'), db=self.meta_db)
+    
+    @staticmethod
+    def _type_key(record: WORMRecord) -> bytes:
+        return f"{record.record_type.value}:{record.id}".encode('utf-8')
     
     def append_record(self, record: WORMRecord) -> str:
         """Append a record to the WORM store."""
@@ -222,23 +902,24 @@ class LMDBWORMStore(WORMStore):
             if txn.get(record.id.encode('utf-8'), db=self.records_db):
                 raise ValueError(f"Record {record.id} already exists (WORM violation)")
             
-            # Serialize record
-            record_data = {
-                'id': record.id,
-                'timestamp': record.timestamp,
-                'record_type': record.record_type.value,
-                'data': record.data,
-                'hash': record.hash
-            }
+            seq = int(txn.get(b'seq', default=b'0', db=self.meta_db)) + 1
+            txn.put(b'seq', str(seq).encode('utf-8'), db=self.meta_db)
             
-            serialized = json.dumps(record_data, sort_keys=True).encode('utf-8')
+            # Serialize record
+            serialized = encode_record(record, self.record_format)
             
             # Store in main records database
             txn.put(record.id.encode('utf-8'), serialized, db=self.records_db)
             
-            # Update type index
-            type_key = f"{record.record_type.value}:{record.id}".encode('utf-8')
+            # Update type and sequence indexes
+            type_key = self._type_key(record)
             txn.put(type_key, record.id.encode('utf-8'), db=self.type_index_db)
+            txn.put(struct.pack('>Q', seq), type_key, db=self.seq_index_db)
+            
+            # Update tree index
+            tree_id = _record_tree_id(record)
+            if tree_id is not None:
+                txn.put(self._tree_key(tree_id, seq), record.id.encode('utf-8'), db=self.tree_index_db)
         
         return record.id
     
@@ -249,55 +930,165 @@ class LMDBWORMStore(WORMStore):
             if not data:
                 return None
             
-            record_dict = json.loads(data.decode('utf-8'))
-            return WORMRecord(
-                id=record_dict['id'],
-                timestamp=record_dict['timestamp'],
-                record_type=RecordType(record_dict['record_type']),
-                data=record_dict['data'],
-                hash=record_dict['hash']
-            )
+            return decode_record(data)
     
     def list_records(self, record_type: Optional[RecordType] = None) -> List[WORMRecord]:
-        """List all records, optionally filtered by type."""
-        records = []
+        """List all records in append order, optionally filtered by type."""
+        return [record for _, record in self.iter_records(record_type)]
+    
+    def iter_records(
+        self,
+        record_type: Optional[RecordType] = None,
+        start_time: TimeBound = None,
+        end_time: TimeBound = None,
+        after_seq: int = 0,
+        max_seq: Optional[int] = None,
+        batch_size: int = TREE_SCAN_BATCH_SIZE
+    ) -> Iterator[Tuple[int, WORMRecord]]:
+        """
+        Stream (seq, record) pairs via the sequence index, one short read transaction per batch.
         
-        with self.env.begin() as txn:
-            if record_type:
-                # Use type index for efficient filtering
-                cursor = txn.cursor(db=self.type_index_db)
-                prefix = f"{record_type.value}:".encode('utf-8')
-                
-                if cursor.set_range(prefix):
-                    for key, value in cursor:
-                        if not key.startswith(prefix):
+        The record type is stored in the index value, so type-filtered scans only
+        fetch and decode matching records.
+        """
+        start_time, end_time = _time_bound(start_time), _time_bound(end_time)
+        type_prefix = f"{record_type.value}:".encode('utf-8') if record_type is not None else b''
+        batch_size = max(batch_size, 1)
+        
+        while True:
+            batch = []
+            last_seq = after_seq
+            exhausted = True
+            with self.env.begin() as txn:
+                cursor = txn.cursor(db=self.seq_index_db)
+                if cursor.set_range(struct.pack('>Q', after_seq + 1)):
+                    for key, type_key in cursor:
+                        last_seq = struct.unpack('>Q', key)[0]
+                        if max_seq is not None and last_seq > max_seq:
+                            break
+                        if len(batch) >= batch_size:
+                            exhausted = False
                             break
-                        
-                        record_id = value.decode('utf-8')
-                        record_data = txn.get(record_id.encode('utf-8'), db=self.records_db)
+                        if not type_key.startswith(type_prefix):
+                            continue
+                        record_data = txn.get(type_key.split(b':', 1)[1], db=self.records_db)
                         if record_data:
-                            record_dict = json.loads(record_data.decode('utf-8'))
-                            records.append(WORMRecord(
-                                id=record_dict['id'],
-                                timestamp=record_dict['timestamp'],
-                                record_type=RecordType(record_dict['record_type']),
-                                data=record_dict['data'],
-                                hash=record_dict['hash']
-                            ))
+                            batch.append((last_seq, record_data))
+            for seq, record_data in batch:
+                record = decode_record(record_data)
+                if _matches(record, None, start_time, end_time):
+                    yield seq, record
+            if exhausted:
+                return
+            after_seq = batch[-1][0]
+    
+    def iter_tree_records(self, tree_id: str, after_seq: int = 0) -> Iterator[Tuple[int, WORMRecord]]:
+        """Yield (seq, record) for a tree via the tree index, one short read transaction per batch."""
+        prefix = tree_id.encode('utf-8') + b'\x00'
+        while True:
+            batch = []
+            with self.env.begin() as txn:
+                cursor = txn.cursor(db=self.tree_index_db)
+                if cursor.set_range(self._tree_key(tree_id, after_seq + 1)):
+                    for key, record_id in cursor:
+                        if not key.startswith(prefix) or len(batch) >= TREE_SCAN_BATCH_SIZE:
+                            break
+                        record_data = txn.get(record_id, db=self.records_db)
+                        if record_data:
+                            batch.append((struct.unpack('>Q', key[len(prefix):])[0], record_data))
+            for seq, record_data in batch:
+                yield seq, decode_record(record_data)
+            if len(batch) < TREE_SCAN_BATCH_SIZE:
+                return
+            after_seq = batch[-1][0]
+    
+    def save_tree_snapshot(self, tree_id: str, snapshot: Dict[str, Any]) -> bool:
+        """Persist a frontier snapshot positioned at the tree's latest record."""
+        prefix = tree_id.encode('utf-8') + b'\x00'
+        with self.env.begin(write=True) as txn:
+            cursor = txn.cursor(db=self.tree_index_db)
+            # Last index entry for this tree: seek past the prefix, then step back
+            if cursor.set_range(self._tree_key(tree_id, 2 ** 64 - 1)):
+                found = cursor.prev()
             else:
-                # Get all records
+                found = cursor.last()
+            if not found or not cursor.key().startswith(prefix):
+                return False
+            seq = struct.unpack('>Q', cursor.key()[len(prefix):])[0]
+            
+            value = json.dumps({
+                'leaf_count': snapshot['leaf_count'],
+                'seq': seq,
+                'root': snapshot['root'],
+                'peaks': snapshot['peaks']
+            }, sort_keys=True).encode('utf-8')
+            txn.put(self._tree_key(tree_id, snapshot['leaf_count']), value,
+                    db=self.snapshots_db, overwrite=False)
+        return True
+    
+    def load_tree_snapshot(self, tree_id: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent frontier snapshot for a tree, if any."""
+        prefix = tree_id.encode('utf-8') + b'\x00'
+        with self.env.begin() as txn:
+            cursor = txn.cursor(db=self.snapshots_db)
+            if cursor.set_range(self._tree_key(tree_id, 2 ** 64 - 1)):
+                found = cursor.prev()
+            else:
+                found = cursor.last()
+            if not found or not cursor.key().startswith(prefix):
+                return None
+            snapshot = json.loads(cursor.value().decode('utf-8'))
+        snapshot['tree_id'] = tree_id
+        return snapshot
+    
+    def migrate_record_format(self, target_format: str, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Re-encode stored records in place to the target format.
+        
+        Each rewritten value must decode to the same record fields and the same
+        canonical JSON payload, so record hashes and Merkle roots are unchanged.
+        A failing batch is aborted without partial writes.
+        
+        Args:
+            target_format: "json" or "msgpack"
+            batch_size: Records re-encoded per write transaction
+            
+        Returns:
+            Counts of scanned and converted records
+        """
+        _check_record_format(target_format)
+        stats = {'scanned': 0, 'converted': 0}
+        start_key = b''
+        while True:
+            batch = []
+            with self.env.begin(write=True) as txn:
                 cursor = txn.cursor(db=self.records_db)
-                for key, value in cursor:
-                    record_dict = json.loads(value.decode('utf-8'))
-                    records.append(WORMRecord(
-                        id=record_dict['id'],
-                        timestamp=record_dict['timestamp'],
-                        record_type=RecordType(record_dict['record_type']),
-                        data=record_dict['data'],
-                        hash=record_dict['hash']
-                    ))
-        
-        return records
+                found = cursor.set_range(start_key)
+                while found and len(batch) < batch_size:
+                    batch.append((cursor.key(), cursor.value()))
+                    found = cursor.next()
+                
+                for key, value in batch:
+                    if _is_frame(value) == (target_format == "msgpack"):
+                        continue
+                    record = decode_record(value)
+                    encoded = encode_record(record, target_format)
+                    if _is_frame(encoded) == _is_frame(value):
+                        continue  # Not representable in msgpack; stays JSON
+                    check = decode_record(encoded)
+                    if (check.id, check.timestamp, check.record_type, check.hash) != (
+                        record.id, record.timestamp, record.record_type, record.hash
+                    ) or _canonical_json(check.data) != _canonical_json(record.data):
+                        raise ValueError(f"Record {record.id} does not round-trip through {target_format}")
+                    txn.put(key, encoded, db=self.records_db)
+                    stats['converted'] += 1
+            stats['scanned'] += len(batch)
+            if not found:
+                break
+            # Keys are unique, so the next batch starts just past the last one
+            start_key = batch[-1][0] + b'\x00'
+        self.record_format = target_format
+        return stats
     
     def close(self):
         """Close the LMDB environment."""
@@ -310,38 +1101,71 @@ class DurableWORMMerkleTree:
     WORM Merkle tree with durable storage backend.
     
     Combines in-memory Merkle tree performance with persistent storage
-    for production audit scenarios.
+    for production audit scenarios. Only the constant-size append frontier is
+    kept hot: startup restores the latest persisted frontier snapshot and
+    replays the records appended after it, while the full tree needed for
+    inclusion proofs is materialized from the tree_id index on first use.
     """
     
-    def __init__(self, store: WORMStore, tree_id: str = "default"):
+    def __init__(self, store: WORMStore, tree_id: str = "default", snapshot_interval: int = 1024):
         """
         Initialize durable WORM Merkle tree.
         
         Args:
             store: WORM storage backend
             tree_id: Identifier for this tree instance
+            snapshot_interval: Persist a frontier snapshot every N appended leaves
         """
         self.store = store
         self.tree_id = tree_id
-        self.merkle_tree = MerkleTree()
+        self.snapshot_interval = max(snapshot_interval, 1)
+        self.frontier = MerkleFrontier()
+        self._merkle_tree: Optional[MerkleTree] = None
+        self._snapshot_leaf_count = 0
         self._load_from_store()
     
     def _load_from_store(self):
-        """Load existing leaves from persistent store."""
-        records = self.store.list_records(RecordType.DATASET)  # Or appropriate type
-        leaves = []
-        
-        for record in records:
-            if record.data.get('tree_id') == self.tree_id:
-                leaves.append(record.data['leaf_hash'])
+        """Restore the frontier from the latest snapshot and replay later leaves."""
+        after_seq = 0
+        snapshot = self.store.load_tree_snapshot(self.tree_id)
+        if snapshot:
+            try:
+                frontier = MerkleFrontier.from_json(snapshot)
+            except (KeyError, ValueError):
+                frontier = None
+            # A snapshot that does not reproduce its own root is ignored (full replay)
+            if frontier is not None and frontier.get_root() == snapshot.get('root'):
+                self.frontier = frontier
+                self._snapshot_leaf_count = frontier.leaf_count
+                after_seq = snapshot['seq']
         
-        if leaves:
-            self.merkle_tree = MerkleTree(leaves)
+        for _, record in self.store.iter_tree_records(self.tree_id, after_seq):
+            self.frontier.append(record.data['leaf_hash'])
+    
+    @property
+    def merkle_tree(self) -> MerkleTree:
+        """Full in-memory tree, loaded from the store on first use."""
+        if self._merkle_tree is None:
+            leaves = [record.data['leaf_hash'] for _, record in self.store.iter_tree_records(self.tree_id)]
+            tree = MerkleTree(leaves)
+            if tree.get_root() != self.frontier.get_root():
+                raise ValueError(f"Stored leaves for tree {self.tree_id} do not match the persisted frontier")
+            self._merkle_tree = tree
+        return self._merkle_tree
+    
+    @merkle_tree.setter
+    def merkle_tree(self, tree: MerkleTree) -> None:
+        self._merkle_tree = tree
+        self.frontier = tree.get_frontier()
     
     def append_leaf(self, leaf_hash: str, metadata: Dict[str, Any]) -> str:
         """Append leaf to both Merkle tree and persistent store."""
-        # Add to Merkle tree
-        new_root = self.merkle_tree.add_leaf(leaf_hash)
+        if self._merkle_tree is not None and leaf_hash in self._merkle_tree:
+            raise ValueError(f"Leaf {leaf_hash} already exists (WORM violation)")
+        
+        # Advance a copy so a rejected store write leaves the tree unchanged
+        frontier = MerkleFrontier(self.frontier.leaf_count, self.frontier.peaks)
+        new_root = frontier.append(leaf_hash)
         
         # Create WORM record
         record_data = {
@@ -359,14 +1183,30 @@ class DurableWORMMerkleTree:
             hash=""  # Will be computed in __post_init__
         )
         
-        # Store persistently
+        # Store persistently (the record id also enforces leaf uniqueness)
         self.store.append_record(record)
         
+        self.frontier = frontier
+        if self._merkle_tree is not None:
+            self._merkle_tree.add_leaf(leaf_hash)
+        
+        if frontier.leaf_count - self._snapshot_leaf_count >= self.snapshot_interval:
+            self.save_snapshot()
+        
         return new_root
     
+    def save_snapshot(self) -> bool:
+        """Persist the current frontier so the next startup can skip replaying it."""
+        if self.frontier.leaf_count == self._snapshot_leaf_count:
+            return False
+        saved = self.store.save_tree_snapshot(self.tree_id, self.frontier.to_json())
+        if saved:
+            self._snapshot_leaf_count = self.frontier.leaf_count
+        return saved
+    
     def get_root(self) -> str:
         """Get current Merkle root."""
-        return self.merkle_tree.get_root()
+        return self.frontier.get_root()
     
     def get_proof(self, leaf_hash: str) -> List[tuple[str, str]]:
         """Get Merkle proof for a leaf."""
@@ -376,16 +1216,37 @@ class DurableWORMMerkleTree:
         """Verify Merkle inclusion proof."""
         return self.merkle_tree.verify_proof(leaf_hash, proof, root)
     
+    def get_consistency_proof(self, old_size: int) -> Dict[str, Any]:
+        """Prove that the tree at ``old_size`` leaves is a prefix of the current tree."""
+        return self.merkle_tree.get_consistency_proof(old_size)
+    
+    def verify_consistency_proof(self, proof: Dict[str, Any], old_root: str, new_root: Optional[str] = None) -> bool:
+        """Verify a consistency proof against new_root (defaults to the current root)."""
+        return verify_consistency_proof(proof, old_root, new_root or self.get_root())
+    
     def close(self):
-        """Close the underlying store."""
+        """Snapshot the frontier and close the underlying store."""
+        self.save_snapshot()
         self.store.close()
 
 
-def create_sqlite_worm_store(db_path: Optional[str] = None) -> SQLiteWORMStore:
+def create_sqlite_worm_store(
+    db_path: Optional[str] = None,
+    group_commit: bool = False,
+    commit_window_ms: float = 0.0,
+    max_batch_size: int = 512,
+    record_format: str = "json",
+    read_only: bool = False
+) -> SQLiteWORMStore:
     """Factory function for SQLite WORM store."""
-    return SQLiteWORMStore(db_path)
+    return SQLiteWORMStore(db_path, group_commit, commit_window_ms, max_batch_size, record_format, read_only)
 
 
-def create_lmdb_worm_store(db_path: Optional[str] = None, map_size: int = 1024 * 1024 * 1024) -> LMDBWORMStore:
+def create_lmdb_worm_store(
+    db_path: Optional[str] = None,
+    map_size: int = 1024 * 1024 * 1024,
+    record_format: str = "json",
+    read_only: bool = False
+) -> LMDBWORMStore:
     """Factory function for LMDB WORM store."""
-    return LMDBWORMStore(db_path, map_size)
\ No newline at end of file
+    return LMDBWORMStore(db_path, map_size, record_format, read_only)
\ No newline at end of file
@@ -6,14 +6,23 @@ and digest algorithm validation as suggested in the security review.
 """
 
 import os
+import math
 import secrets
 import hashlib
 import time
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass
-from collections import defaultdict
+from typing import Callable, Deque, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from collections import defaultdict, deque
 import threading
 
+from .core.constants import (
+    NONCE_BLOOM_ERROR_RATE,
+    NONCE_BLOOM_INITIAL_CAPACITY,
+    NONCE_TRACKER_MAX_SIZE,
+    NONCE_WINDOW_BUCKETS,
+    NONCE_WINDOW_SECONDS,
+)
+
 @dataclass
 class CryptoHealthStatus:
     """Result of cryptographic health check."""
@@ -24,6 +33,7 @@ class CryptoHealthStatus:
     nonce_uniqueness_check: bool
     issues: List[str]
     recommendations: List[str]
+    nonce_tracker_stats: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -34,43 +44,288 @@ class CryptoHealthStatus:
             "digest_algorithms": self.digest_algorithms,
             "nonce_uniqueness_check": self.nonce_uniqueness_check,
             "issues": self.issues,
-            "recommendations": self.recommendations
+            "recommendations": self.recommendations,
+            "nonce_tracker_stats": self.nonce_tracker_stats
         }
 
+def bloom_hash_pair(item: str) -> Tuple[int, int]:
+    """Two 64-bit hashes of an item for double hashing (the second one odd)."""
+    digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter over string items.
+    
+    Bit positions come from double hashing of a 128-bit BLAKE2b digest, so
+    each add/check costs one hash plus ``num_hashes`` bit operations.
+    
+    Args:
+        capacity: Number of items the filter is sized for
+        error_rate: False-positive rate at ``capacity`` items
+    """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def add_hashed(self, h1: int, h2: int) -> None:
+        """Add an item given its hash pair from bloom_hash_pair()."""
+        bits, num_bits = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def contains_hashed(self, h1: int, h2: int) -> bool:
+        """Check an item given its hash pair, stopping at the first unset bit."""
+        bits, num_bits = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def add(self, item: str) -> None:
+        self.add_hashed(*bloom_hash_pair(item))
+    
+    def __contains__(self, item: str) -> bool:
+        return self.contains_hashed(*bloom_hash_pair(item))
+    
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+    
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows by stacking filters of increasing capacity.
+    
+    Each new filter has ``growth`` times the capacity and ``tightening`` times
+    the error rate of the previous one, so the compound false-positive rate
+    stays below ``error_rate`` however many items are added.
+    
+    Args:
+        initial_capacity: Capacity of the first filter
+        error_rate: Target compound false-positive rate
+        growth: Capacity multiplier for each new filter
+        tightening: Error rate multiplier for each new filter
+    """
+    
+    def __init__(self, initial_capacity: int = NONCE_BLOOM_INITIAL_CAPACITY,
+                 error_rate: float = NONCE_BLOOM_ERROR_RATE, growth: int = 2, tightening: float = 0.5):
+        if not 0.0 < tightening < 1.0:
+            raise ValueError("tightening must be between 0 and 1")
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = max(1, growth)
+        self.tightening = tightening
+        self._filters: List[BloomFilter] = [BloomFilter(initial_capacity, error_rate * (1 - tightening))]
+    
+    def add_hashed(self, h1: int, h2: int) -> None:
+        """Add an item given its hash pair from bloom_hash_pair()."""
+        current = self._filters[-1]
+        if current.is_full:
+            current = BloomFilter(current.capacity * self.growth, current.error_rate * self.tightening)
+            self._filters.append(current)
+        current.add_hashed(h1, h2)
+    
+    def contains_hashed(self, h1: int, h2: int) -> bool:
+        """Check an item given its hash pair, newest filter first."""
+        return any(bloom.contains_hashed(h1, h2) for bloom in reversed(self._filters))
+    
+    def add(self, item: str) -> None:
+        self.add_hashed(*bloom_hash_pair(item))
+    
+    def __contains__(self, item: str) -> bool:
+        return self.contains_hashed(*bloom_hash_pair(item))
+    
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self._filters)
+    
+    @property
+    def memory_bytes(self) -> int:
+        return sum(bloom.memory_bytes for bloom in self._filters)
+    
+    @property
+    def filter_count(self) -> int:
+        return len(self._filters)
+
+
 class NonceTracker:
-    """Thread-safe nonce uniqueness tracker."""
+    """
+    Thread-safe, time-windowed nonce replay detector.
+    
+    Recent nonces are kept exactly in a ring of ``buckets`` hash tables, each
+    covering ``window_seconds / buckets``. Expiring a bucket drops a whole
+    table, so insert and check are O(1) amortized and memory is bounded by
+    ``max_size`` exact entries (when the cap is reached, the oldest entries
+    are evicted one at a time; the current bucket is never cleared).
+    
+    With ``bloom_horizon_seconds`` set, every nonce is also added to a
+    scalable Bloom filter covering that longer horizon (in two rotating
+    generations), catching replays long after they leave the exact window at
+    a false-positive rate of at most ``bloom_error_rate``.
     
-    def __init__(self, max_size: int = 10000):
-        self._nonces: Set[str] = set()
+    Args:
+        max_size: Maximum exact entries held in the window
+        window_seconds: Exact replay detection horizon
+        buckets: Number of rotating hash tables in the window
+        bloom_horizon_seconds: Bloom filter horizon (None disables the filter)
+        bloom_error_rate: Target false-positive rate of the Bloom filter
+        bloom_initial_capacity: Capacity of the first filter of each generation
+        clock: Monotonic time source
+    """
+    
+    def __init__(self, max_size: int = NONCE_TRACKER_MAX_SIZE,
+                 window_seconds: float = NONCE_WINDOW_SECONDS,
+                 buckets: int = NONCE_WINDOW_BUCKETS,
+                 bloom_horizon_seconds: Optional[float] = None,
+                 bloom_error_rate: float = NONCE_BLOOM_ERROR_RATE,
+                 bloom_initial_capacity: int = NONCE_BLOOM_INITIAL_CAPACITY,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        if bloom_horizon_seconds is not None and bloom_horizon_seconds <= 0:
+            raise ValueError("bloom_horizon_seconds must be positive")
         self._lock = threading.Lock()
+        self._clock = clock
         self._max_size = max_size
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        # Insertion-ordered, so the oldest entries can be evicted first
+        self._buckets: Deque[Dict[str, None]] = deque([{}], maxlen=buckets)
+        self._bucket_started = clock()
+        self._size = 0
         self._collision_count = 0
+        self._bloom_rejections = 0
+        
+        self.bloom_horizon_seconds = bloom_horizon_seconds
+        self.bloom_error_rate = bloom_error_rate
+        self.bloom_initial_capacity = bloom_initial_capacity
+        self._blooms: Deque[ScalableBloomFilter] = deque(maxlen=2)
+        self._bloom_started = self._bucket_started
+        if bloom_horizon_seconds is not None:
+            self._blooms.append(self._new_bloom())
+    
+    def _new_bloom(self) -> ScalableBloomFilter:
+        # Two generations are probed per check, so each gets half the error budget
+        return ScalableBloomFilter(self.bloom_initial_capacity, self.bloom_error_rate / 2)
+    
+    def _push_bucket(self) -> None:
+        if len(self._buckets) == self._buckets.maxlen:
+            self._size -= len(self._buckets[0])
+        self._buckets.append({})
+    
+    def _advance_locked(self, now: float) -> None:
+        elapsed = int((now - self._bucket_started) // self.bucket_seconds)
+        if elapsed > 0:
+            for _ in range(min(elapsed, self._buckets.maxlen)):
+                self._push_bucket()
+            self._bucket_started += elapsed * self.bucket_seconds
+        
+        if self._blooms:
+            # A generation is kept for one extra horizon after it stops receiving nonces
+            generations = int((now - self._bloom_started) // self.bloom_horizon_seconds)
+            if generations > 0:
+                for _ in range(min(generations, 2)):
+                    self._blooms.append(self._new_bloom())
+                self._bloom_started += generations * self.bloom_horizon_seconds
     
     def register_nonce(self, nonce: str) -> bool:
         """Register a nonce and return True if unique, False if collision."""
         with self._lock:
-            if nonce in self._nonces:
-                self._collision_count += 1
-                return False
+            self._advance_locked(self._clock())
+            for bucket in self._buckets:
+                if nonce in bucket:
+                    self._collision_count += 1
+                    return False
+            
+            if self._blooms:
+                hash_pair = bloom_hash_pair(nonce)
+                if any(bloom.contains_hashed(*hash_pair) for bloom in self._blooms):
+                    # Probable replay from beyond the exact window (or a false positive)
+                    self._collision_count += 1
+                    self._bloom_rejections += 1
+                    return False
+                self._blooms[-1].add_hashed(*hash_pair)
             
-            self._nonces.add(nonce)
+            self._buckets[-1][nonce] = None
+            self._size += 1
             
-            # Prevent unlimited growth
-            if len(self._nonces) > self._max_size:
-                # Remove oldest half (simple strategy)
-                self._nonces = set(list(self._nonces)[self._max_size//2:])
+            # Bound memory: evict the oldest entries early rather than grow
+            while self._size > self._max_size:
+                oldest = next(bucket for bucket in self._buckets if bucket)
+                del oldest[next(iter(oldest))]
+                self._size -= 1
             
             return True
     
+    def seen(self, nonce: str) -> bool:
+        """Check whether a nonce was seen in the window (or probably seen within the Bloom horizon)."""
+        with self._lock:
+            self._advance_locked(self._clock())
+            if any(nonce in bucket for bucket in self._buckets):
+                return True
+            return any(nonce in bloom for bloom in self._blooms)
+    
     def get_collision_count(self) -> int:
         """Get total number of nonce collisions detected."""
         return self._collision_count
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Window occupancy, collision counters and Bloom filter memory use."""
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "exact_entries": self._size,
+                "max_size": self._max_size,
+                "buckets": self._buckets.maxlen,
+                "active_buckets": len(self._buckets),
+                "window_seconds": self.window_seconds,
+                "collisions": self._collision_count,
+                "bloom_rejections": self._bloom_rejections,
+                "bloom_enabled": bool(self._blooms),
+            }
+            if self._blooms:
+                stats.update({
+                    "bloom_horizon_seconds": self.bloom_horizon_seconds,
+                    "bloom_error_rate": self.bloom_error_rate,
+                    "bloom_entries": sum(len(bloom) for bloom in self._blooms),
+                    "bloom_filters": sum(bloom.filter_count for bloom in self._blooms),
+                    "bloom_memory_bytes": sum(bloom.memory_bytes for bloom in self._blooms),
+                })
+            return stats
+    
     def clear(self):
         """Clear all tracked nonces."""
         with self._lock:
-            self._nonces.clear()
+            self._buckets.clear()
+            self._buckets.append({})
+            self._bucket_started = self._clock()
+            self._size = 0
             self._collision_count = 0
+            self._bloom_rejections = 0
+            if self._blooms:
+                self._blooms.clear()
+                self._blooms.append(self._new_bloom())
+                self._bloom_started = self._bucket_started
 
 # Global nonce tracker
 _nonce_tracker = NonceTracker()
@@ -79,12 +334,43 @@ def get_nonce_tracker() -> NonceTracker:
     """Get the global nonce tracker."""
     return _nonce_tracker
 
+def configure_nonce_tracker(**kwargs: Any) -> NonceTracker:
+    """
+    Replace the global nonce tracker with one built from NonceTracker arguments.
+    
+    Args:
+        **kwargs: NonceTracker constructor arguments (e.g. window_seconds, bloom_horizon_seconds)
+        
+    Returns:
+        The new global nonce tracker
+    """
+    global _nonce_tracker
+    _nonce_tracker = NonceTracker(**kwargs)
+    return _nonce_tracker
+
 class CryptoHealthChecker:
     """Performs comprehensive cryptographic health checks."""
     
-    def __init__(self):
+    def __init__(self, nonce_tracker: Optional[NonceTracker] = None):
         self.issues = []
         self.recommendations = []
+        self._nonce_tracker = nonce_tracker
+    
+    @property
+    def nonce_tracker(self) -> NonceTracker:
+        """Replay detector used by this checker (the global tracker unless one was given)."""
+        return self._nonce_tracker if self._nonce_tracker is not None else _nonce_tracker
+    
+    def check_nonce_replay(self, nonce: str) -> bool:
+        """Register a received nonce; returns False if it is a (probable) replay."""
+        return self.nonce_tracker.register_nonce(nonce)
+    
+    def check_nonce_tracker(self) -> Dict[str, Any]:
+        """Report replay detector statistics and flag any detected collisions."""
+        stats = self.nonce_tracker.get_stats()
+        if stats["collisions"]:
+            self.issues.append(f"Nonce replay detected ({stats['collisions']} collisions)")
+        return stats
     
     def check_prng_source(self) -> str:
         """Check the PRNG source being used."""
@@ -240,6 +526,7 @@ class CryptoHealthChecker:
         
         # Test nonce uniqueness
         nonce_uniqueness = self.test_nonce_uniqueness(100)  # Smaller test for speed
+        nonce_tracker_stats = self.check_nonce_tracker()
         
         # Test key derivation
         key_derivation_ok = self.check_key_derivation()
@@ -275,7 +562,8 @@ class CryptoHealthChecker:
             digest_algorithms=digest_algorithms,
             nonce_uniqueness_check=nonce_uniqueness,
             issues=self.issues.copy(),
-            recommendations=self.recommendations.copy()
+            recommendations=self.recommendations.copy(),
+            nonce_tracker_stats=nonce_tracker_stats
         )
 
 def crypto_health_check() -> CryptoHealthStatus:
@@ -295,11 +583,12 @@ def generate_unique_nonce() -> str:
     nonce = f"{int(time.time() * 1000000)}-{secrets.token_hex(16)}"
     
     # Register with global tracker
-    is_unique = _nonce_tracker.register_nonce(nonce)
+    tracker = get_nonce_tracker()
+    is_unique = tracker.register_nonce(nonce)
     if not is_unique:
         # If collision detected, generate a new one with extra randomness
         nonce = f"{int(time.time() * 1000000)}-{secrets.token_hex(32)}"
-        _nonce_tracker.register_nonce(nonce)
+        tracker.register_nonce(nonce)
     
     return nonce
 
@@ -26,6 +26,9 @@ import pickle
 import os
 from pathlib import Path
 
+from .core.batch_hashing import hash_many
+from .core.canonicalization import CanonicalSchema
+
 @dataclass
 class LightweightReceipt:
     """Minimal receipt stored during fast inference"""
@@ -47,11 +50,17 @@ class LightweightReceipt:
         """Convert to dictionary for serialization"""
         return asdict(self)
 
+    def to_canonical_json(self) -> str:
+        """Canonical JSON of to_dict() using the precompiled receipt schema"""
+        return _LIGHTWEIGHT_RECEIPT_SCHEMA.encode_object(self)
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'LightweightReceipt':
         """Create from dictionary"""
         return cls(**data)
 
+_LIGHTWEIGHT_RECEIPT_SCHEMA = CanonicalSchema.for_dataclass(LightweightReceipt)
+
 class ReceiptQueue:
     """Persistent queue for lightweight receipts"""
     
@@ -313,6 +322,12 @@ class ReceiptHasher:
         data_str = str(data) if not isinstance(data, str) else data
         return hashlib.sha256(data_str.encode()).hexdigest()
         
+    @staticmethod
+    def hash_data_many(items: List[Any]) -> List[str]:
+        """Create SHA256 hashes of many data items in one batch (same results as hash_data)"""
+        buffers = [(str(data) if not isinstance(data, str) else data).encode() for data in items]
+        return hash_many(buffers).hexdigests()
+        
     @staticmethod
     def create_commitment(data: Any, salt: Optional[str] = None) -> str:
         """Create salted commitment for data"""
@@ -11,6 +11,7 @@ Version: 1.1.0
 """
 
 from .policy import LCMPolicy, CommitmentType, DomainType, MerklePolicy, get_default_policy, create_commitment, canonical_json, canonical_hash
+from .commitments import CommitmentEngine, CommitmentBatch, create_commitments
 from .protocol_implementations import (
     DefaultRNG, DefaultMerkle, DefaultAnchorDeriver, InMemoryAnchorStore, DefaultSigner,
     create_default_protocols
@@ -31,6 +32,9 @@ __all__ = [
     "MerklePolicy",
     "get_default_policy",
     "create_commitment",
+    "CommitmentEngine",
+    "CommitmentBatch",
+    "create_commitments",
     "canonical_json",
     "canonical_hash",
     # Protocol implementations
@@ -0,0 +1,234 @@
+"""
+CIAF LCM Deterministic Commitment Engine
+
+Creates full-length privacy commitments for batches of values from a single
+per-batch seed. Per-item salts are derived with HKDF (RFC 5869): the seed is
+extracted once into a pseudorandom key, and each 64-byte HKDF-SHA512 Expand
+block, for an info string carrying a block counter, yields the salts of four
+consecutive items (``i // 4`` selects the block, ``i % 4`` the quarter). Keyed
+(HMAC-SHA256) commitments use one HMAC key expanded from the same seed, or
+the caller's anchor. A batch therefore costs one random draw instead of one
+per item, and an auditor holding the seed can reproduce every commitment.
+
+The seed opens every commitment of its batch and must be protected like
+the salts it replaces.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+from ..core import secure_random_bytes
+from .policy import CommitmentType
+
+if TYPE_CHECKING:
+    from ..core.interfaces import RNG
+
+COMMITMENT_SEED_LENGTH = 32
+COMMITMENT_SALT_LENGTH = 16
+
+# HKDF-SHA512: each 64-byte expand block holds four salts
+_HKDF_HASH = "sha512"
+_SALTS_PER_BLOCK = 4
+
+# HKDF extract salt and expand info labels (domain separation)
+_HKDF_EXTRACT_SALT = b"CIAF|commitments|v1"
+_SALT_INFO = b"CIAF|commitment|salt|"
+_HMAC_KEY_INFO = b"CIAF|commitment|hmac-key"
+
+
+def _hmac_digest(keyed: "hmac.HMAC", message: bytes) -> bytes:
+    """HMAC of a message from a keyed HMAC object, copied so its padded key state is hashed once."""
+    mac = keyed.copy()
+    mac.update(message)
+    return mac.digest()
+
+
+def _hkdf_extract(seed: bytes) -> bytes:
+    return hmac.digest(_HKDF_EXTRACT_SALT, seed, _HKDF_HASH)
+
+
+def _hkdf_expand_block(prk: "hmac.HMAC", info: bytes) -> bytes:
+    # Outputs of at most one hash block: T(1) = HMAC(PRK, info || 0x01)
+    return _hmac_digest(prk, info + b"\x01")
+
+
+def commitment_bytes(data: Any) -> bytes:
+    """Byte encoding of a value for commitment (strings as-is, others as sorted-key JSON)."""
+    data_str = data if isinstance(data, str) else json.dumps(data, sort_keys=True)
+    return data_str.encode("utf-8")
+
+
+@dataclass
+class CommitmentBatch:
+    """Commitments created for a contiguous run of engine counter values."""
+    commitment_type: CommitmentType
+    start_index: int
+    commitments: List[str]
+
+    def __len__(self) -> int:
+        return len(self.commitments)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form (the seed is deliberately not included)."""
+        return {
+            "commitment_type": self.commitment_type.value,
+            "start_index": self.start_index,
+            "commitments": list(self.commitments),
+        }
+
+
+class CommitmentEngine:
+    """
+    Deterministic commitment engine driven by one per-batch seed.
+
+    SALTED commitments are ``sha256(salt_i || data)`` and HMAC_SHA256
+    commitments are ``HMAC-SHA256(key, salt_i || data)``; both are full
+    64-character hex digests. The per-counter salt keeps equal values from
+    getting equal commitments. Each commit() consumes the next counter value, so the
+    sequence of commitments is reproducible from the seed and the items.
+
+    Args:
+        commitment_type: Commitment type to produce
+        seed: Batch seed (at least 16 bytes); drawn from ``rng`` or the system CSPRNG if omitted
+        anchor: HMAC key for HMAC_SHA256 commitments (defaults to a key derived from the seed)
+        rng: Optional RNG implementation used to draw the seed
+    """
+
+    def __init__(
+        self,
+        commitment_type: CommitmentType = CommitmentType.SALTED,
+        seed: Optional[bytes] = None,
+        anchor: Optional[bytes] = None,
+        rng: Optional["RNG"] = None,
+    ):
+        if seed is None:
+            seed = rng.random_bytes(COMMITMENT_SEED_LENGTH) if rng is not None else secure_random_bytes(COMMITMENT_SEED_LENGTH)
+        if len(seed) < 16:
+            raise ValueError("Commitment seed must be at least 16 bytes")
+        self.commitment_type = commitment_type
+        self.seed = bytes(seed)
+        self._prk = hmac.new(_hkdf_extract(self.seed), digestmod=_HKDF_HASH)
+        hmac_key = anchor if anchor is not None else _hkdf_expand_block(self._prk, _HMAC_KEY_INFO)[:32]
+        self._data_hmac = hmac.new(hmac_key, digestmod=hashlib.sha256)
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    @property
+    def next_index(self) -> int:
+        """Counter value the next commitment will use."""
+        return self._next_index
+
+    def salt(self, index: int) -> bytes:
+        """
+        Derive the salt of a commitment.
+
+        Args:
+            index: Commitment counter value
+
+        Returns:
+            16-byte salt (a quarter of the HKDF-Expand block for counter ``index // 4``)
+        """
+        if index < 0:
+            raise ValueError("Commitment index must be non-negative")
+        block = _hkdf_expand_block(self._prk, _SALT_INFO + (index // _SALTS_PER_BLOCK).to_bytes(8, "big"))
+        offset = (index % _SALTS_PER_BLOCK) * COMMITMENT_SALT_LENGTH
+        return block[offset:offset + COMMITMENT_SALT_LENGTH]
+
+    def _salts(self, start: int, count: int) -> List[bytes]:
+        """Salts for counter values start .. start + count - 1, four per expand block."""
+        prk, size = self._prk, COMMITMENT_SALT_LENGTH
+        first_block = start // _SALTS_PER_BLOCK
+        last_block = (start + count + _SALTS_PER_BLOCK - 1) // _SALTS_PER_BLOCK
+        stream = b"".join([
+            _hmac_digest(prk, _SALT_INFO + block.to_bytes(8, "big") + b"\x01")
+            for block in range(first_block, last_block)
+        ])
+        skip = (start % _SALTS_PER_BLOCK) * size
+        return [stream[skip + i * size:skip + (i + 1) * size] for i in range(count)]
+
+    def _commit_at(self, index: int, data: bytes) -> str:
+        if self.commitment_type == CommitmentType.SALTED:
+            return hashlib.sha256(self.salt(index) + data).hexdigest()
+        if self.commitment_type == CommitmentType.HMAC_SHA256:
+            return _hmac_digest(self._data_hmac, self.salt(index) + data).hex()
+        if self.commitment_type == CommitmentType.PLAINTEXT:
+            return data.decode("utf-8")
+        raise ValueError(f"Unknown commitment type: {self.commitment_type}")
+
+    def _reserve(self, count: int) -> int:
+        with self._lock:
+            start = self._next_index
+            self._next_index += count
+        return start
+
+    def commit(self, data: Any) -> str:
+        """Create the commitment for one value using the next counter value."""
+        return self._commit_at(self._reserve(1), commitment_bytes(data))
+
+    def commit_many(self, items: Sequence[Any]) -> CommitmentBatch:
+        """
+        Create commitments for many values using consecutive counter values.
+
+        Args:
+            items: Values to commit to
+
+        Returns:
+            CommitmentBatch with one commitment per item, in input order
+        """
+        encoded = [commitment_bytes(item) for item in items]
+        start = self._reserve(len(encoded))
+        if self.commitment_type == CommitmentType.SALTED:
+            salts = self._salts(start, len(encoded))
+            sha256 = hashlib.sha256
+            commitments = [sha256(salt + data).hexdigest() for salt, data in zip(salts, encoded)]
+        elif self.commitment_type == CommitmentType.HMAC_SHA256:
+            salts = self._salts(start, len(encoded))
+            keyed = self._data_hmac
+            commitments = [_hmac_digest(keyed, salt + data).hex() for salt, data in zip(salts, encoded)]
+        else:
+            commitments = [self._commit_at(start + offset, data) for offset, data in enumerate(encoded)]
+        return CommitmentBatch(self.commitment_type, start, commitments)
+
+    def verify(self, data: Any, commitment: str, index: int) -> bool:
+        """Check a commitment against a value and its counter value."""
+        return hmac.compare_digest(self._commit_at(index, commitment_bytes(data)), commitment)
+
+    def verify_many(self, items: Sequence[Any], commitments: Sequence[str], start_index: int = 0) -> bool:
+        """Check a batch of commitments created from consecutive counter values."""
+        if len(items) != len(commitments):
+            return False
+        return all(
+            self.verify(item, commitment, start_index + offset)
+            for offset, (item, commitment) in enumerate(zip(items, commitments))
+        )
+
+
+def create_commitments(
+    items: Sequence[Any],
+    commitment_type: CommitmentType,
+    anchor: Optional[bytes] = None,
+    seed: Optional[bytes] = None,
+    rng: Optional["RNG"] = None,
+) -> CommitmentBatch:
+    """
+    Create commitments for a batch of values from one seed.
+
+    Args:
+        items: Values to commit to
+        commitment_type: Type of commitments to create
+        anchor: Optional HMAC key for HMAC_SHA256 commitments
+        seed: Optional batch seed (fresh random seed if omitted)
+        rng: Optional RNG implementation used to draw the seed
+
+    Returns:
+        CommitmentBatch starting at counter value 0
+    """
+    return CommitmentEngine(commitment_type, seed=seed, anchor=anchor, rng=rng).commit_many(items)
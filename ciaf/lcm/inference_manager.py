@@ -15,9 +15,10 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
-from ..core import sha256_hash, MerkleTree, secure_random_bytes
+from ..core import sha256_hash, MerkleTree
 from ..inference import InferenceReceipt
 from .policy import LCMPolicy, get_default_policy, CommitmentType, DomainType
+from .commitments import CommitmentEngine
 
 if TYPE_CHECKING:
     from .model_manager import LCMModelAnchor
@@ -138,12 +139,21 @@ class LCMInferenceReceipt:
 class LCMInferenceConnections:
     """Enhanced inference connections for LCM."""
     
-    def __init__(self, connections_id: str, policy: LCMPolicy = None):
-        """Initialize inference connections."""
+    def __init__(self, connections_id: str, policy: LCMPolicy = None, commitment_seed: Optional[bytes] = None):
+        """
+        Initialize inference connections.
+        
+        Args:
+            connections_id: Connections identifier
+            policy: LCM policy (defaults to the global policy)
+            commitment_seed: Seed for the commitment engine (random if omitted); all
+                input/output commitments of these connections are reproducible from it
+        """
         self.connections_id = connections_id
         self.policy = policy or get_default_policy()
         self.receipts: List[LCMInferenceReceipt] = []
         self.current_connections_digest = "genesis"
+        self.commitment_engine = CommitmentEngine(self.policy.commitments, seed=commitment_seed)
     
     def add_receipt(
         self,
@@ -157,9 +167,47 @@ class LCMInferenceConnections:
     ) -> LCMInferenceReceipt:
         """Add receipt to the connections."""
         # Create input and output commitments
-        input_commitment = self._create_commitment(query)
-        output_commitment = self._create_commitment(ai_output)
+        input_commitment, output_commitment = self._create_commitments([query, ai_output])
+        return self._append_receipt(
+            receipt_id, model_anchor_ref, deployment_anchor_ref, request_id,
+            query, ai_output, input_commitment, output_commitment, explanation_digests
+        )
+    
+    def add_receipts(self, entries: List[Dict[str, Any]]) -> List[LCMInferenceReceipt]:
+        """
+        Add many receipts, creating all of their commitments in one batch.
         
+        Args:
+            entries: Dicts of add_receipt() keyword arguments
+            
+        Returns:
+            Receipts in input order
+        """
+        values = []
+        for entry in entries:
+            values.extend((entry["query"], entry["ai_output"]))
+        commitments = self._create_commitments(values)
+        return [
+            self._append_receipt(
+                entry["receipt_id"], entry["model_anchor_ref"], entry["deployment_anchor_ref"],
+                entry["request_id"], entry["query"], entry["ai_output"],
+                commitments[2 * i], commitments[2 * i + 1], entry.get("explanation_digests")
+            )
+            for i, entry in enumerate(entries)
+        ]
+    
+    def _append_receipt(
+        self,
+        receipt_id: str,
+        model_anchor_ref: str,
+        deployment_anchor_ref: str,
+        request_id: str,
+        query: str,
+        ai_output: str,
+        input_commitment: LCMInferenceCommitment,
+        output_commitment: LCMInferenceCommitment,
+        explanation_digests: List[str] = None
+    ) -> LCMInferenceReceipt:
         # Determine previous connections digest
         prev_connections_digest = self.current_connections_digest if self.current_connections_digest != "genesis" else None
         
@@ -184,32 +232,27 @@ class LCMInferenceConnections:
         
         return receipt
     
+    def _create_commitments(self, values: List[str]) -> List[LCMInferenceCommitment]:
+        """Create commitments for values according to policy, in one engine batch."""
+        commitment_type = self.policy.commitments
+        batch = self.commitment_engine.commit_many(values)
+        metadata_flag = {
+            CommitmentType.SALTED: "salted",
+            CommitmentType.HMAC_SHA256: "hmac",
+        }.get(commitment_type)
+        return [
+            LCMInferenceCommitment(
+                commitment_type=commitment_type,
+                commitment_value=value,
+                metadata={metadata_flag: True, "commitment_index": batch.start_index + offset}
+                if metadata_flag else None
+            )
+            for offset, value in enumerate(batch.commitments)
+        ]
+    
     def _create_commitment(self, data: str) -> LCMInferenceCommitment:
         """Create commitment for data according to policy."""
-        if self.policy.commitments == CommitmentType.PLAINTEXT:
-            return LCMInferenceCommitment(
-                commitment_type=CommitmentType.PLAINTEXT,
-                commitment_value=data
-            )
-        elif self.policy.commitments == CommitmentType.SALTED:
-            # Simple salt-based commitment
-            salt = secure_random_bytes(16)
-            commitment_value = sha256_hash(salt + data.encode('utf-8'))[:16] + "..."
-            return LCMInferenceCommitment(
-                commitment_type=CommitmentType.SALTED,
-                commitment_value=commitment_value,
-                metadata={"salted": True}
-            )
-        elif self.policy.commitments == CommitmentType.HMAC_SHA256:
-            # HMAC-based commitment (simplified for demo)
-            import hmac
-            key = secure_random_bytes(32)
-            commitment_value = hmac.new(key, data.encode('utf-8'), 'sha256').hexdigest()[:16] + "..."
-            return LCMInferenceCommitment(
-                commitment_type=CommitmentType.HMAC_SHA256,
-                commitment_value=commitment_value,
-                metadata={"hmac": True}
-            )
+        return self._create_commitments([data])[0]
     
     def get_final_connections_digest(self) -> str:
         """Get final connections digest."""
@@ -17,6 +17,7 @@ from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
 from ..core import secure_random_bytes, sha256_hash
+from ..core.canonicalization import canonical_json as _core_canonical_json
 
 if TYPE_CHECKING:
     from ..core.interfaces import Signer, RNG, Merkle, AnchorDeriver, AnchorStore
@@ -182,7 +183,10 @@ def create_commitment(
         rng: Optional RNG implementation (uses default if None)
         
     Returns:
-        Commitment string
+        Commitment string (full-length hex digest for SALTED and HMAC_SHA256)
+    
+    For batches, ``ciaf.lcm.commitments.create_commitments`` derives all salts
+    from one seed instead of drawing one per value.
     """
     if commitment_type == CommitmentType.PLAINTEXT:
         return str(data)
@@ -193,14 +197,14 @@ def create_commitment(
         else:
             salt = secure_random_bytes(16)
         data_str = json.dumps(data, sort_keys=True) if not isinstance(data, str) else data
-        return sha256_hash((salt + data_str.encode('utf-8')))[:16] + "..."
+        return sha256_hash((salt + data_str.encode('utf-8')))
     elif commitment_type == CommitmentType.HMAC_SHA256:
         # HMAC-based commitment using provided anchor
         if anchor is None:
             raise ValueError("HMAC commitment requires anchor bytes")
         import hmac
         data_str = json.dumps(data, sort_keys=True) if not isinstance(data, str) else data
-        return hmac.new(anchor, data_str.encode('utf-8'), 'sha256').hexdigest()[:16] + "..."
+        return hmac.new(anchor, data_str.encode('utf-8'), 'sha256').hexdigest()
     else:
         raise ValueError(f"Unknown commitment type: {commitment_type}")
 
@@ -215,7 +219,7 @@ def canonical_json(data: Any) -> str:
     Returns:
         Canonical JSON string with consistent formatting
     """
-    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return _core_canonical_json(data)
 
 
 def canonical_hash(data: Any) -> str:
@@ -20,7 +20,7 @@ class MetadataConfig:
     # Default configuration
     DEFAULT_CONFIG = {
         # Storage settings
-        "storage_backend": "json",  # Options: "json", "sqlite", "pickle"
+        "storage_backend": "json",  # Options: "json", "sqlite", "pickle", "segment"
         "storage_path": "ciaf_metadata",
         "enable_compression": False,
         "max_file_size_mb": 100,
@@ -58,6 +58,12 @@ class MetadataConfig:
         "db_journal_mode": "WAL",
         "db_cache_size": 10000,
         "db_connection_pool_size": 5,  # Connection pooling
+        # Segment log settings (for segment backend)
+        "segment_max_bytes": 64 * 1024 * 1024,  # Seal and roll segments at this size
+        "segment_compaction_ratio": 0.5,  # Compact sealed segments with this share of dead bytes
+        "segment_compaction_interval": 60.0,  # Seconds between background compaction passes
+        "segment_retention_days": None,  # Expire records older than this (None keeps them)
+        "segment_fsync": False,  # Fsync every append (seals and compactions always fsync)
         # Retention settings
         "metadata_retention_days": 365,
         "compliance_retention_days": 2555,  # 7 years for compliance
@@ -179,10 +185,20 @@ class MetadataConfig:
         errors = {}
 
         # Validate storage backend
-        valid_backends = ["json", "sqlite", "pickle"]
+        valid_backends = ["json", "sqlite", "pickle", "segment"]
         if self.config["storage_backend"] not in valid_backends:
             errors["storage_backend"] = f"Must be one of: {valid_backends}"
 
+        # Validate segment log settings
+        if self.config["segment_max_bytes"] < 1:
+            errors["segment_max_bytes"] = "Must be at least 1"
+
+        if not (0.0 < self.config["segment_compaction_ratio"] <= 1.0):
+            errors["segment_compaction_ratio"] = "Must be greater than 0.0 and at most 1.0"
+
+        if self.config["segment_compaction_interval"] < 0:
+            errors["segment_compaction_interval"] = "Must be non-negative (0 disables compaction)"
+
         # Validate retention days
         if self.config["metadata_retention_days"] < 1:
             errors["metadata_retention_days"] = "Must be at least 1 day"
@@ -241,6 +257,30 @@ class MetadataConfig:
         """Get resolved storage path."""
         return Path(self.config["storage_path"]).resolve()
 
+    def get_segment_options(self) -> Dict[str, Any]:
+        """Get SegmentLogStore keyword arguments for the segment backend."""
+        return {
+            "max_segment_bytes": self.config["segment_max_bytes"],
+            "compaction_ratio": self.config["segment_compaction_ratio"],
+            "compaction_interval": self.config["segment_compaction_interval"],
+            "retention_days": self.config["segment_retention_days"],
+            "fsync": self.config["segment_fsync"],
+        }
+
+    def create_storage(self):
+        """Create a MetadataStorage for the configured backend, path and options."""
+        # Import here to avoid circular imports
+        from .metadata_storage import MetadataStorage
+
+        backend = self.config["storage_backend"]
+        return MetadataStorage(
+            storage_path=self.config["storage_path"],
+            backend=backend,
+            use_compression=self.config["enable_compression"],
+            pool_size=self.config["db_connection_pool_size"],
+            segment_options=self.get_segment_options() if backend == "segment" else None,
+        )
+
     def is_compliance_framework_enabled(self, framework: str) -> bool:
         """Check if a compliance framework is enabled."""
         return framework in self.config["compliance_frameworks"]
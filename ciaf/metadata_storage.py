@@ -10,15 +10,385 @@ Author: Denzil James Greenwood
 Version: 1.0.0
 """
 
+import bisect
 import hashlib
 import json
 import os
 import pickle
+import queue
 import sqlite3
+import threading
 import uuid
-from datetime import datetime, timezone
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .core.constants import (
+    METADATA_INDEX_FILENAME,
+    METADATA_SCHEMA_VERSION,
+    METADATA_SQLITE_POOL_SIZE,
+    METADATA_SQLITE_TIMEOUT_SECONDS,
+)
+
+_METADATA_COLUMNS = (
+    "id, model_name, model_version, stage, event_type, timestamp, "
+    "metadata_hash, details, metadata_json"
+)
+
+# Indexes serving get_model_metadata (model_name [+ stage], newest first)
+# and the timestamp cutoffs of cleanup_old_metadata
+_METADATA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_metadata_model_timestamp "
+    "ON metadata (model_name, timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_metadata_model_stage_timestamp "
+    "ON metadata (model_name, stage, timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_metadata_timestamp ON metadata (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_compliance_events_timestamp "
+    "ON compliance_events (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_compliance_events_metadata_id "
+    "ON compliance_events (metadata_id)",
+)
+
+# Backends storing one file per record, indexed by MetadataFileIndex
+_FILE_BACKENDS = ("json", "pickle")
+_RECORD_SUFFIXES = (".json", ".pkl")
+
+# Segment backend directory (see metadata_storage_segment)
+_SEGMENT_DIR = "segments"
+
+# Storage subdirectories that do not hold model records
+_NON_MODEL_DIRS = ("compliance_events", "exports", _SEGMENT_DIR)
+
+
+class SQLiteConnectionPool:
+    """
+    Thread-safe pool of SQLite connections to one database file.
+
+    Connections are opened lazily up to ``size``, configured for WAL
+    journaling, and handed out one thread at a time; callers wait up to
+    ``timeout`` seconds when all of them are in use.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        size: int = METADATA_SQLITE_POOL_SIZE,
+        timeout: float = METADATA_SQLITE_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize connection pool.
+
+        Args:
+            db_path: SQLite database file
+            size: Maximum number of open connections
+            timeout: Busy timeout and maximum wait for a free connection (seconds)
+        """
+        if size < 1:
+            raise ValueError("Connection pool size must be at least 1")
+        self.db_path = str(db_path)
+        self.size = size
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # durable in WAL mode, no fsync per commit
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._all) < self.size:
+                conn = self._connect()
+                self._all.append(conn)
+                return conn
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No SQLite connection available within {self.timeout}s") from None
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out a connection; commits on success and rolls back on error."""
+        conn = self._acquire()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed on return."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Open and idle connection counts."""
+        return {"size": self.size, "open": len(self._all), "idle": self._idle.qsize()}
+
+
+class ModelTimeline:
+    """Metadata IDs per model and per (model, stage), kept sorted by timestamp."""
+
+    def __init__(self):
+        self._by_model: Dict[str, List[Tuple[str, str]]] = {}
+        self._by_stage: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+
+    def add(self, model_name: str, stage: str, timestamp: str, metadata_id: str):
+        key = (timestamp, metadata_id)
+        # Timestamps mostly arrive in order, so this is usually an append
+        bisect.insort(self._by_model.setdefault(model_name, []), key)
+        bisect.insort(self._by_stage.setdefault((model_name, stage), []), key)
+
+    def remove(self, model_name: str, stage: str, timestamp: str, metadata_id: str):
+        key = (timestamp, metadata_id)
+        for index, bucket in ((self._by_model, model_name), (self._by_stage, (model_name, stage))):
+            keys = index[bucket]
+            del keys[bisect.bisect_left(keys, key)]
+            if not keys:
+                del index[bucket]
+
+    def page(self, model_name: str, stage: Optional[str] = None, limit: int = 100, offset: int = 0) -> List[str]:
+        """IDs of a model (optionally one stage), newest first, skipping ``offset``."""
+        keys = self._by_stage.get((model_name, stage)) if stage else self._by_model.get(model_name)
+        if not keys or limit <= 0:
+            return []
+        stop = max(len(keys) - max(offset, 0), 0)
+        return [metadata_id for _, metadata_id in reversed(keys[max(stop - limit, 0):stop])]
+
+    def model_names(self) -> List[str]:
+        return list(self._by_model)
+
+
+class MetadataFileIndex:
+    """
+    Persistent, append-only index of the record files of the json and pickle backends.
+
+    Each line of the index file is a JSON entry ``{"id", "model_name",
+    "stage", "timestamp", "path"}`` (path relative to the storage directory)
+    or a tombstone ``{"id", "deleted": true}``. Lines are appended with a
+    single ``O_APPEND`` write after the record file is in place, so the index
+    never names a file that was not fully written; a torn trailing line is
+    dropped on load. In memory the index maps ID to entry and keeps every
+    model's IDs (and every model/stage pair's) sorted by timestamp, which
+    makes lookups by ID O(1) and a page of k model records O(k).
+
+    The identity (device and inode) of the loaded file is remembered; when
+    rewrite() in any process replaces the file, refresh() notices the new
+    identity and reloads it instead of reading from a stale offset.
+    """
+
+    def __init__(self, storage_path: Union[str, Path], filename: str = METADATA_INDEX_FILENAME):
+        """
+        Initialize index.
+
+        Args:
+            storage_path: Storage directory holding the record files
+            filename: Index file name inside the storage directory
+        """
+        self.storage_path = Path(storage_path)
+        self.index_path = self.storage_path / filename
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._paths: Dict[str, str] = {}
+        self._timeline = ModelTimeline()
+        self._offset = 0
+        self._file_id: Optional[Tuple[int, int]] = None
+        self.tombstones = 0
+
+    @staticmethod
+    def entry_for(record: Dict[str, Any], path: str) -> Dict[str, Any]:
+        """Index entry of a record stored at ``path`` (relative to the storage directory)."""
+        return {
+            "id": record["id"],
+            "model_name": record["model_name"],
+            "stage": record["stage"],
+            "timestamp": record["timestamp"],
+            "path": path,
+        }
+
+    def exists(self) -> bool:
+        return self.index_path.exists()
+
+    @staticmethod
+    def _identity(stat_result: os.stat_result) -> Tuple[int, int]:
+        return (stat_result.st_dev, stat_result.st_ino)
+
+    def load(self):
+        """Load the index file, trimming a torn trailing line left by an interrupted append."""
+        with self._lock:
+            self._load_locked()
+
+    def _load_locked(self):
+        self._reset()
+        try:
+            f = open(self.index_path, "r+b")
+        except FileNotFoundError:
+            return
+        with f:
+            self._file_id = self._identity(os.fstat(f.fileno()))
+            data = f.read()
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                f.truncate(complete)
+        self._apply_lines(data[:complete])
+        self._offset = complete
+
+    def refresh(self):
+        """Apply lines appended to the index file by other writers since the last read."""
+        with self._lock:
+            try:
+                stat_result = self.index_path.stat()
+            except FileNotFoundError:
+                return
+            if self._identity(stat_result) != self._file_id:
+                # Replaced by a rewrite (or created) since it was loaded
+                self._load_locked()
+                return
+            size = stat_result.st_size
+            if size <= self._offset:
+                return
+            with open(self.index_path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(size - self._offset)
+            # An append still in progress is picked up by the next refresh
+            complete = data.rfind(b"\n") + 1
+            self._apply_lines(data[:complete])
+            self._offset += complete
+
+    def _apply_lines(self, data: bytes):
+        for line in data.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("deleted"):
+                if self._remove(entry["id"]):
+                    self.tombstones += 1
+            else:
+                self._insert(entry)
+
+    def _insert(self, entry: Dict[str, Any]):
+        if entry["id"] in self._entries:
+            self._remove(entry["id"])
+        self._entries[entry["id"]] = entry
+        self._paths[entry["path"]] = entry["id"]
+        self._timeline.add(entry["model_name"], entry["stage"], entry["timestamp"], entry["id"])
+
+    def _remove(self, metadata_id: str) -> bool:
+        entry = self._entries.pop(metadata_id, None)
+        if entry is None:
+            return False
+        self._paths.pop(entry["path"], None)
+        self._timeline.remove(entry["model_name"], entry["stage"], entry["timestamp"], metadata_id)
+        return True
+
+    def _append(self, lines: List[Dict[str, Any]]):
+        data = "".join(json.dumps(line) + "\n" for line in lines).encode("utf-8")
+        fd = os.open(self.index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            end = os.lseek(fd, 0, os.SEEK_CUR)
+            file_id = self._identity(os.fstat(fd))
+        finally:
+            os.close(fd)
+        if self._file_id is None and end == len(data):
+            # This append created the file
+            self._file_id = file_id
+        # Skip our own lines on refresh unless another writer appended before them
+        if file_id == self._file_id and end - len(data) == self._offset:
+            self._offset = end
+
+    def add(self, entries: List[Dict[str, Any]]):
+        """Append entries for saved record files (one write for the whole batch)."""
+        if not entries:
+            return
+        with self._lock:
+            self._append(entries)
+            for entry in entries:
+                self._insert(entry)
+
+    def remove_paths(self, paths: List[str]) -> int:
+        """Append tombstones for deleted record files; returns the number of entries removed."""
+        with self._lock:
+            ids = [self._paths[path] for path in paths if path in self._paths]
+            if not ids:
+                return 0
+            self._append([{"id": metadata_id, "deleted": True} for metadata_id in ids])
+            for metadata_id in ids:
+                self._remove(metadata_id)
+            self.tombstones += len(ids)
+        return len(ids)
+
+    def get(self, metadata_id: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(metadata_id)
+
+    def model_entries(
+        self, model_name: str, stage: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Entries of a model (optionally one stage), newest first, skipping ``offset``."""
+        with self._lock:
+            return [self._entries[metadata_id] for metadata_id in self._timeline.page(model_name, stage, limit, offset)]
+
+    def model_names(self) -> List[str]:
+        return self._timeline.model_names()
+
+    def rewrite(self, entries: List[Dict[str, Any]]):
+        """Replace the index file with the given entries (written to a temporary file, then renamed)."""
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.index_path)
+            self._load_locked()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "records": len(self._entries),
+            "models": len(self._timeline.model_names()),
+            "tombstones": self.tombstones,
+            "index_bytes": self._offset,
+        }
+
+
+def _row_to_record(row: tuple) -> Dict[str, Any]:
+    return {
+        "id": row[0],
+        "model_name": row[1],
+        "model_version": row[2],
+        "stage": row[3],
+        "event_type": row[4],
+        "timestamp": row[5],
+        "metadata_hash": row[6],
+        "details": row[7],
+        "metadata": json.loads(row[8]),
+    }
 
 
 class MetadataStorage:
@@ -29,6 +399,7 @@ class MetadataStorage:
     - JSON files (default)
     - SQLite database
     - Pickle files
+    - Segment log (append-only segment files, see metadata_storage_segment)
     """
 
     def __init__(
@@ -36,15 +407,22 @@ class MetadataStorage:
         storage_path: str = "ciaf_metadata",
         backend: str = "json",
         use_compression: bool = False,
+        pool_size: int = METADATA_SQLITE_POOL_SIZE,
+        segment_options: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize metadata storage.
 
         Args:
             storage_path: Base path for metadata storage
-            backend: Storage backend ('json', 'sqlite', 'pickle')
+            backend: Storage backend ('json', 'sqlite', 'pickle', 'segment'); the
+                file backends keep a persistent ID/model index (MetadataFileIndex)
             use_compression: Use compressed storage (creates CompressedMetadataStorage instance)
+            pool_size: Connection pool size for the sqlite backend
+            segment_options: Keyword arguments for SegmentLogStore (segment backend)
         """
+        # Statistics of the index built on open when a file backend directory had none
+        self.index_rebuild_stats: Optional[Dict[str, Any]] = None
         if use_compression:
             # Import here to avoid circular imports
             from .metadata_storage_compressed import CompressedMetadataStorage
@@ -62,12 +440,38 @@ class MetadataStorage:
 
             # Initialize backend-specific storage
             if self.backend == "sqlite":
-                self._init_sqlite()
+                self._init_sqlite(pool_size)
+            elif self.backend in _FILE_BACKENDS:
+                self._init_file_index()
+            elif self.backend == "segment":
+                self._init_segment_log(segment_options or {})
 
-    def _init_sqlite(self):
+    def _init_sqlite(self, pool_size: int = METADATA_SQLITE_POOL_SIZE):
         """Initialize SQLite database for metadata storage."""
         self.db_path = self.storage_path / "ciaf_metadata.db"
-        conn = sqlite3.connect(self.db_path)
+        self._pool = SQLiteConnectionPool(self.db_path, size=pool_size)
+        with self._pool.connection() as conn:
+            self._create_schema(conn)
+            self._migrate_schema(conn)
+
+    def _init_file_index(self):
+        """Load the record file index, building it from existing files on first use."""
+        self._index = MetadataFileIndex(self.storage_path)
+        if self._index.exists():
+            self._index.load()
+        else:
+            self.index_rebuild_stats = self.rebuild_index()
+
+    def _init_segment_log(self, segment_options: Dict[str, Any]):
+        """Open the append-only segment log."""
+        # Import here to avoid circular imports
+        from .metadata_storage_segment import SegmentLogStore
+
+        self._segments = SegmentLogStore(self.storage_path / _SEGMENT_DIR, **segment_options)
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection):
+        """Create the metadata tables if they do not exist."""
         cursor = conn.cursor()
 
         # Create metadata table
@@ -118,8 +522,29 @@ class MetadataStorage:
         """
         )
 
-        conn.commit()
-        conn.close()
+    @staticmethod
+    def _migrate_schema(conn: sqlite3.Connection):
+        """
+        Bring an existing database up to METADATA_SCHEMA_VERSION.
+
+        Version 1 adds the query indexes. Steps are idempotent, so a database
+        created before versioning (user_version 0) is migrated in place.
+        """
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= METADATA_SCHEMA_VERSION:
+            return
+        if version < 1:
+            for statement in _METADATA_INDEXES:
+                conn.execute(statement)
+            conn.execute("ANALYZE")
+        conn.execute(f"PRAGMA user_version = {METADATA_SCHEMA_VERSION}")
+
+    def close(self):
+        """Close pooled database connections or the segment log."""
+        if hasattr(self, "_pool"):
+            self._pool.close()
+        if hasattr(self, "_segments"):
+            self._segments.close()
 
     def save_metadata(
         self,
@@ -150,6 +575,37 @@ class MetadataStorage:
                 model_name, stage, event_type, metadata, model_version, details
             )
 
+        record = self.build_record(
+            model_name, stage, event_type, metadata, model_version, details
+        )
+
+        # Save using selected backend
+        if self.backend == "json":
+            self._save_json(record)
+        elif self.backend == "sqlite":
+            self._save_sqlite(record)
+        elif self.backend == "pickle":
+            self._save_pickle(record)
+        elif self.backend == "segment":
+            self._segments.append([record])
+
+        return record["id"]
+
+    @staticmethod
+    def build_record(
+        model_name: str,
+        stage: str,
+        event_type: str,
+        metadata: Dict[str, Any],
+        model_version: Optional[str] = None,
+        details: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a metadata record (new ID, timestamp and integrity hash) without saving it.
+
+        Returns:
+            Metadata record as stored by save_metadata
+        """
         # Generate unique ID and timestamp
         metadata_id = str(uuid.uuid4())
         timestamp = datetime.now(timezone.utc).isoformat()
@@ -158,8 +614,7 @@ class MetadataStorage:
         metadata_str = json.dumps(metadata, sort_keys=True)
         metadata_hash = hashlib.sha256(metadata_str.encode()).hexdigest()
 
-        # Prepare metadata record
-        record = {
+        return {
             "id": metadata_id,
             "model_name": model_name,
             "model_version": model_version or "1.0.0",
@@ -171,18 +626,88 @@ class MetadataStorage:
             "metadata": metadata,
         }
 
-        # Save using selected backend
-        if self.backend == "json":
-            self._save_json(record)
-        elif self.backend == "sqlite":
-            self._save_sqlite(record)
-        elif self.backend == "pickle":
-            self._save_pickle(record)
+    def save_records(
+        self,
+        records: List[Dict[str, Any]],
+        metadata_json: Optional[List[str]] = None,
+    ):
+        """
+        Save prepared records (from build_record); on sqlite in a single transaction,
+        on the segment log in a single append.
+
+        Args:
+            records: Metadata records
+            metadata_json: Optional serialized metadata per record, used instead of
+                serializing ``record["metadata"]`` now (sqlite backend)
+        """
+        if self._use_compressed:
+            raise ValueError("save_records is not supported with compressed storage")
 
-        return metadata_id
+        if self.backend == "sqlite":
+            if metadata_json is None:
+                metadata_json = [json.dumps(record["metadata"]) for record in records]
+            with self._pool.connection() as conn:
+                conn.executemany(
+                    f"""
+                    INSERT INTO metadata ({_METADATA_COLUMNS})
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    [
+                        (
+                            record["id"],
+                            record["model_name"],
+                            record["model_version"],
+                            record["stage"],
+                            record["event_type"],
+                            record["timestamp"],
+                            record["metadata_hash"],
+                            record["details"],
+                            serialized,
+                        )
+                        for record, serialized in zip(records, metadata_json)
+                    ],
+                )
+        elif self.backend == "segment":
+            self._segments.append(records)
+        else:
+            self._save_files(records)
+
+    def _save_files(self, records: List[Dict[str, Any]]):
+        """Write record files, then index them with one append."""
+        write = self._write_json if self.backend == "json" else self._write_pickle
+        self._index.add([MetadataFileIndex.entry_for(record, write(record)) for record in records])
+
+    def _write_record_file(self, file_path: Path, record: Dict[str, Any]) -> str:
+        """Write a record file atomically; returns its path relative to the storage directory."""
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        if file_path.suffix == ".pkl":
+            with open(tmp_path, "wb") as f:
+                pickle.dump(record, f)
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(record, f, indent=2, default=str)
+        os.replace(tmp_path, file_path)
+        return file_path.relative_to(self.storage_path).as_posix()
+
+    @staticmethod
+    def _read_record_file(file_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a record file; None if it is missing or unreadable."""
+        try:
+            if file_path.suffix == ".json":
+                with open(file_path, "r") as f:
+                    return json.load(f)
+            if file_path.suffix == ".pkl":
+                with open(file_path, "rb") as f:
+                    return pickle.load(f)
+        except Exception:
+            return None
+        return None
 
     def _save_json(self, record: Dict[str, Any]):
         """Save metadata as JSON file."""
+        self._save_files([record])
+
+    def _write_json(self, record: Dict[str, Any]) -> str:
         # Organize by model and date
         model_dir = self.storage_path / record["model_name"]
         model_dir.mkdir(exist_ok=True)
@@ -191,46 +716,22 @@ class MetadataStorage:
             record["timestamp"].replace("Z", "+00:00")
         ).strftime("%Y-%m-%d")
         file_path = model_dir / f"{date_str}_{record['stage']}_{record['id'][:8]}.json"
-
-        with open(file_path, "w") as f:
-            json.dump(record, f, indent=2, default=str)
+        return self._write_record_file(file_path, record)
 
     def _save_sqlite(self, record: Dict[str, Any]):
         """Save metadata to SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO metadata 
-            (id, model_name, model_version, stage, event_type, timestamp, metadata_hash, details, metadata_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                record["id"],
-                record["model_name"],
-                record["model_version"],
-                record["stage"],
-                record["event_type"],
-                record["timestamp"],
-                record["metadata_hash"],
-                record["details"],
-                json.dumps(record["metadata"]),
-            ),
-        )
-
-        conn.commit()
-        conn.close()
+        self.save_records([record])
 
     def _save_pickle(self, record: Dict[str, Any]):
         """Save metadata as pickle file."""
+        self._save_files([record])
+
+    def _write_pickle(self, record: Dict[str, Any]) -> str:
         model_dir = self.storage_path / record["model_name"]
         model_dir.mkdir(exist_ok=True)
 
         file_path = model_dir / f"{record['stage']}_{record['id'][:8]}.pkl"
-
-        with open(file_path, "wb") as f:
-            pickle.dump(record, f)
+        return self._write_record_file(file_path, record)
 
     def get_metadata(self, metadata_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -248,60 +749,34 @@ class MetadataStorage:
 
         if self.backend == "sqlite":
             return self._get_sqlite(metadata_id)
+        elif self.backend == "segment":
+            return self._segments.get(metadata_id)
         else:
             return self._search_files(metadata_id)
 
     def _get_sqlite(self, metadata_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata from SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT id, model_name, model_version, stage, event_type, timestamp, 
-                   metadata_hash, details, metadata_json
-            FROM metadata WHERE id = ?
-        """,
-            (metadata_id,),
-        )
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                f"SELECT {_METADATA_COLUMNS} FROM metadata WHERE id = ?",
+                (metadata_id,),
+            ).fetchone()
 
-        row = cursor.fetchone()
-        conn.close()
-
-        if row:
-            return {
-                "id": row[0],
-                "model_name": row[1],
-                "model_version": row[2],
-                "stage": row[3],
-                "event_type": row[4],
-                "timestamp": row[5],
-                "metadata_hash": row[6],
-                "details": row[7],
-                "metadata": json.loads(row[8]),
-            }
-        return None
+        return _row_to_record(row) if row else None
 
     def _search_files(self, metadata_id: str) -> Optional[Dict[str, Any]]:
-        """Search for metadata in file system."""
-        for model_dir in self.storage_path.iterdir():
-            if model_dir.is_dir():
-                for file_path in model_dir.iterdir():
-                    if metadata_id[:8] in file_path.name:
-                        if file_path.suffix == ".json":
-                            with open(file_path, "r") as f:
-                                record = json.load(f)
-                                if record["id"] == metadata_id:
-                                    return record
-                        elif file_path.suffix == ".pkl":
-                            with open(file_path, "rb") as f:
-                                record = pickle.load(f)
-                                if record["id"] == metadata_id:
-                                    return record
-        return None
+        """Look up a record file through the index."""
+        entry = self._index.get(metadata_id)
+        if entry is None:
+            # Possibly saved by another writer since the index was read
+            self._index.refresh()
+            entry = self._index.get(metadata_id)
+        if entry is None:
+            return None
+        return self._read_record_file(self.storage_path / entry["path"])
 
     def get_model_metadata(
-        self, model_name: str, stage: Optional[str] = None, limit: int = 100
+        self, model_name: str, stage: Optional[str] = None, limit: int = 100, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Get all metadata for a specific model.
@@ -310,93 +785,103 @@ class MetadataStorage:
             model_name: Name of the model
             stage: Optional stage filter
             limit: Maximum number of records to return
+            offset: Number of newest records to skip (for pagination)
 
         Returns:
-            List of metadata records
+            List of metadata records, newest first
         """
         if self.backend == "sqlite":
-            return self._get_model_sqlite(model_name, stage, limit)
+            return self._get_model_sqlite(model_name, stage, limit, offset)
+        elif self.backend == "segment":
+            return self._segments.model_records(model_name, stage, limit, offset)
         else:
-            return self._get_model_files(model_name, stage, limit)
+            return self._get_model_files(model_name, stage, limit, offset)
 
     def _get_model_sqlite(
-        self, model_name: str, stage: Optional[str], limit: int
+        self, model_name: str, stage: Optional[str], limit: int, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Get model metadata from SQLite."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if stage:
-            cursor.execute(
-                """
-                SELECT id, model_name, model_version, stage, event_type, timestamp, 
-                       metadata_hash, details, metadata_json
-                FROM metadata 
-                WHERE model_name = ? AND stage = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """,
-                (model_name, stage, limit),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT id, model_name, model_version, stage, event_type, timestamp, 
-                       metadata_hash, details, metadata_json
-                FROM metadata 
-                WHERE model_name = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """,
-                (model_name, limit),
-            )
-
-        rows = cursor.fetchall()
-        conn.close()
-
-        return [
-            {
-                "id": row[0],
-                "model_name": row[1],
-                "model_version": row[2],
-                "stage": row[3],
-                "event_type": row[4],
-                "timestamp": row[5],
-                "metadata_hash": row[6],
-                "details": row[7],
-                "metadata": json.loads(row[8]),
-            }
-            for row in rows
-        ]
+        with self._pool.connection() as conn:
+            if stage:
+                rows = conn.execute(
+                    f"""
+                    SELECT {_METADATA_COLUMNS}
+                    FROM metadata 
+                    WHERE model_name = ? AND stage = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ? OFFSET ?
+                """,
+                    (model_name, stage, limit, offset),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"""
+                    SELECT {_METADATA_COLUMNS}
+                    FROM metadata 
+                    WHERE model_name = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ? OFFSET ?
+                """,
+                    (model_name, limit, offset),
+                ).fetchall()
+
+        return [_row_to_record(row) for row in rows]
+
+    def _list_model_names(self) -> List[str]:
+        """Model names with stored metadata."""
+        if self.backend == "sqlite":
+            with self._pool.connection() as conn:
+                rows = conn.execute("SELECT DISTINCT model_name FROM metadata").fetchall()
+            return [row[0] for row in rows]
+        if self.backend == "segment":
+            return self._segments.model_names()
+        self._index.refresh()
+        return self._index.model_names()
 
     def _get_model_files(
-        self, model_name: str, stage: Optional[str], limit: int
+        self, model_name: str, stage: Optional[str], limit: int, offset: int = 0
     ) -> List[Dict[str, Any]]:
-        """Get model metadata from files."""
-        model_dir = self.storage_path / model_name
-        if not model_dir.exists():
-            return []
-
+        """Get model metadata from files (one page of the index, newest first)."""
+        self._index.refresh()
         records = []
-        for file_path in model_dir.iterdir():
-            if stage and stage not in file_path.name:
-                continue
+        for entry in self._index.model_entries(model_name, stage, limit, offset):
+            record = self._read_record_file(self.storage_path / entry["path"])
+            if record is not None:
+                records.append(record)
+        return records
 
-            try:
-                if file_path.suffix == ".json":
-                    with open(file_path, "r") as f:
-                        record = json.load(f)
-                        records.append(record)
-                elif file_path.suffix == ".pkl":
-                    with open(file_path, "rb") as f:
-                        record = pickle.load(f)
-                        records.append(record)
-            except Exception:
-                continue
+    def rebuild_index(self) -> Dict[str, Any]:
+        """
+        Rebuild the file index from the record files on disk.
 
-        # Sort by timestamp and limit
-        records.sort(key=lambda x: x["timestamp"], reverse=True)
-        return records[:limit]
+        Repairs an index that is missing, damaged or out of date (for example
+        after files were copied in or removed by hand). The new index is
+        written to a temporary file and renamed over the old one.
+
+        Returns:
+            Index statistics, including the number of unreadable files skipped
+        """
+        if self._use_compressed or self.backend not in _FILE_BACKENDS:
+            raise ValueError(f"The {'compressed' if self._use_compressed else self.backend} backend has no file index")
+
+        entries = []
+        skipped = 0
+        for model_dir in self.storage_path.iterdir():
+            if not model_dir.is_dir() or model_dir.name in _NON_MODEL_DIRS:
+                continue
+            for file_path in model_dir.iterdir():
+                if file_path.suffix not in _RECORD_SUFFIXES:
+                    continue
+                record = self._read_record_file(file_path)
+                try:
+                    entries.append(MetadataFileIndex.entry_for(
+                        record, file_path.relative_to(self.storage_path).as_posix()
+                    ))
+                except (KeyError, TypeError):
+                    skipped += 1
+        entries.sort(key=lambda entry: (entry["timestamp"], entry["id"]))
+        self._index.rewrite(entries)
+        return dict(self._index.get_stats(), skipped=skipped)
 
     def get_pipeline_trace(self, model_name: str) -> Dict[str, Any]:
         """
@@ -459,28 +944,23 @@ class MetadataStorage:
         timestamp = datetime.now(timezone.utc).isoformat()
 
         if self.backend == "sqlite":
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                INSERT INTO compliance_events 
-                (id, metadata_id, framework, compliance_score, validation_status, timestamp, details)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    event_id,
-                    metadata_id,
-                    framework,
-                    compliance_score,
-                    validation_status,
-                    timestamp,
-                    details,
-                ),
-            )
-
-            conn.commit()
-            conn.close()
+            with self._pool.connection() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO compliance_events 
+                    (id, metadata_id, framework, compliance_score, validation_status, timestamp, details)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        event_id,
+                        metadata_id,
+                        framework,
+                        compliance_score,
+                        validation_status,
+                        timestamp,
+                        details,
+                    ),
+                )
         else:
             # Save as separate file for file-based backends
             compliance_record = {
@@ -523,11 +1003,8 @@ class MetadataStorage:
         else:
             # Export all metadata
             metadata_records = []
-            for model_dir in self.storage_path.iterdir():
-                if model_dir.is_dir() and model_dir.name != "compliance_events":
-                    metadata_records.extend(
-                        self.get_model_metadata(model_dir.name, limit=1000)
-                    )
+            for name in self._list_model_names():
+                metadata_records.extend(self.get_model_metadata(name, limit=1000))
             filename = f"all_metadata_{timestamp}.{format}"
 
         export_path = self.storage_path / "exports"
@@ -603,32 +1080,35 @@ class MetadataStorage:
         cutoff_iso = cutoff_date.isoformat()
 
         if self.backend == "sqlite":
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                DELETE FROM metadata WHERE timestamp < ?
-            """,
-                (cutoff_iso,),
-            )
-
-            cursor.execute(
-                """
-                DELETE FROM compliance_events WHERE timestamp < ?
-            """,
-                (cutoff_iso,),
-            )
-
-            conn.commit()
-            conn.close()
+            with self._pool.connection() as conn:
+                conn.execute(
+                    """
+                    DELETE FROM metadata WHERE timestamp < ?
+                """,
+                    (cutoff_iso,),
+                )
+
+                conn.execute(
+                    """
+                    DELETE FROM compliance_events WHERE timestamp < ?
+                """,
+                    (cutoff_iso,),
+                )
         else:
+            if self.backend == "segment":
+                # Tombstones now; the space is reclaimed by compaction
+                self._segments.delete_before(cutoff_iso)
+
             # Clean up files
+            removed = []
             for model_dir in self.storage_path.iterdir():
-                if model_dir.is_dir():
+                if model_dir.is_dir() and model_dir.name != _SEGMENT_DIR:
                     for file_path in model_dir.iterdir():
                         if file_path.stat().st_mtime < cutoff_date.timestamp():
                             file_path.unlink()
+                            removed.append(file_path.relative_to(self.storage_path).as_posix())
+            if hasattr(self, "_index"):
+                self._index.remove_paths(removed)
 
     def _list_json_files(self) -> List[Path]:
         """List all JSON metadata files in the storage directory."""
@@ -645,6 +1125,8 @@ class MetadataStorage:
             "storage_path": str(self.storage_path),
             "backend": self.backend,
             "db_path": str(self.db_path) if hasattr(self, "db_path") else None,
+            "index_path": str(self._index.index_path) if hasattr(self, "_index") else None,
+            "segment_path": str(self._segments.directory) if hasattr(self, "_segments") else None,
         }
 
 
@@ -680,8 +1162,6 @@ def get_pipeline_trace(model_name: str) -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Example usage
-    from datetime import timedelta
-
     # Initialize storage
     storage = MetadataStorage("example_metadata", "sqlite")
 
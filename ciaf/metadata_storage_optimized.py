@@ -9,31 +9,63 @@ Author: CIAF Development Team
 Version: 1.0.0
 """
 
+import copy
+import json
+import queue
+import threading
 import time
-from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
 
+from .core.cache import BoundedLRUCache
+from .core.constants import (
+    METADATA_WRITE_FLUSH_INTERVAL_SECONDS,
+    METADATA_WRITE_RETRY_ATTEMPTS,
+    METADATA_WRITE_RETRY_BACKOFF_SECONDS,
+)
 from .metadata_storage import MetadataStorage
 
 
+class _PendingWrite:
+    """A saved record waiting in the write-behind queue."""
+
+    __slots__ = ("record", "metadata_json", "done", "error")
+
+    def __init__(self, record: Dict[str, Any], metadata_json: str, durable: bool):
+        self.record = record
+        # Serialized at save time, so later changes by the caller are not persisted
+        self.metadata_json = metadata_json
+        self.done = threading.Event() if durable else None
+        self.error: Optional[BaseException] = None
+
+
+_STOP = object()
+
+
 class HighPerformanceMetadataStorage:
     """
     High-performance metadata storage with optimizations for training and inference.
-    
+
     Uses composition to wrap MetadataStorage with performance optimizations:
-    - In-memory buffering with configurable flush intervals
-    - Batch processing for bulk operations
-    - Lazy materialization - defer expensive operations
+    - Write-behind buffering: saves are queued in a bounded in-memory buffer
+      and a background flusher writes them in batches, one transaction per batch
+    - Flush on batch size, on flush interval and on shutdown
+    - Read-your-writes: queued records are visible to get_metadata and
+      get_model_metadata before they are flushed
+    - Durable mode: save_metadata returns only after its batch is committed
+      (concurrent saves share one commit)
+    - Failed batch writes are retried with exponential backoff; a batch that
+      still fails is evicted from the cache and reported by raising from the
+      next flush() or shutdown() (or from save_metadata in durable mode)
     - Connection pooling for database operations
-    - Async I/O for non-blocking writes
-    - Memory caching with LRU eviction
+    - Bounded LRU read cache keyed by metadata ID (``cache_size`` entries),
+      with a model name index for invalidation
     """
-    
+
     def __init__(self, config_or_template: Union[str, Dict[str, Any]] = "high_performance"):
         """
         Initialize high-performance metadata storage.
-        
+
         Args:
             config_or_template: Configuration template name or config dict
         """
@@ -46,104 +78,365 @@ class HighPerformanceMetadataStorage:
                 "db_connection_pool_size": 5,
                 "enable_async_writes": True,
                 "batch_write_size": 50,
+                "flush_interval_seconds": METADATA_WRITE_FLUSH_INTERVAL_SECONDS,
+                "durable_writes": False,
+                "cache_size": 10000,
                 "storage_path": "ciaf_metadata_optimized"
             }
         else:
             # config_or_template is a config dict
             self.perf_config = config_or_template.copy()
-        
+
         # Initialize the underlying storage
         storage_path = self.perf_config.get('storage_path', 'ciaf_metadata_optimized')
+        use_compression = self.perf_config.get('use_compression', False)
+        self.use_compression = use_compression
         self._storage = MetadataStorage(
             storage_path=storage_path,
             backend="sqlite",
-            use_compression=self.perf_config.get('use_compression', False)
+            use_compression=use_compression,
+            pool_size=self.perf_config.get('db_connection_pool_size', 5)
+        )
+
+        # Write-behind settings (metadata_config keys are accepted as fallbacks);
+        # compressed storage assigns its own IDs, so it is written through
+        self.async_writes = self.perf_config.get(
+            'enable_async_writes', self.perf_config.get('async_writes', True)
+        ) and not use_compression
+        self.durable_writes = self.perf_config.get('durable_writes', False)
+        self.batch_size = max(1, self.perf_config.get(
+            'batch_write_size', self.perf_config.get('batch_size', 50)
+        ))
+        self.flush_interval = self.perf_config.get(
+            'flush_interval_seconds', METADATA_WRITE_FLUSH_INTERVAL_SECONDS
         )
-        
+
         # Initialize performance components
-        self.memory_buffer = deque(maxlen=self.perf_config.get('memory_buffer_size', 1000))
-        self.cache = {}  # Simple dict cache for demo
-        self.cache_hits = 0
-        self.cache_misses = 0
+        self.memory_buffer: "queue.Queue[Any]" = queue.Queue(
+            maxsize=self.perf_config.get('memory_buffer_size', 1000)
+        )
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._cache_lock = threading.RLock()
+        self._model_index: Dict[str, Set[str]] = {}
+        self.cache = BoundedLRUCache(
+            max(0, self.perf_config.get('cache_size', 10000)), on_evict=self._unindex
+        )
         self.total_saves = 0
         self.total_save_time = 0.0
         self.buffer_flushes = 0
-        self.batch_size = self.perf_config.get('batch_write_size', 50)
-        
+        self.records_flushed = 0
+        self.write_errors = 0
+        self.write_retries = 0
+        self.last_write_error: Optional[str] = None
+        self.retry_attempts = max(1, self.perf_config.get('write_retry_attempts', METADATA_WRITE_RETRY_ATTEMPTS))
+        self.retry_backoff = self.perf_config.get('write_retry_backoff_seconds', METADATA_WRITE_RETRY_BACKOFF_SECONDS)
+        # Failed write-behind records not yet reported by flush()/shutdown()
+        self._failed_ids: List[str] = []
+        self._failure: Optional[BaseException] = None
+        self.total_flush_time = 0.0
+        self.max_flush_time = 0.0
+        self._closed = False
+
+        self._flusher: Optional[threading.Thread] = None
+        if self.async_writes:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="ciaf-metadata-flusher", daemon=True
+            )
+            self._flusher.start()
+
         # Performance monitoring
         self.start_time = time.time()
-    
-    def save_metadata(self, model_name: str, stage: str, event_type: str, 
+
+    def save_metadata(self, model_name: str, stage: str, event_type: str,
                      metadata: Dict[str, Any], model_version: Optional[str] = None,
                      details: Optional[str] = None) -> str:
-        """Save metadata with performance optimizations."""
+        """
+        Save metadata with performance optimizations.
+
+        With async writes the record is queued and written by the background
+        flusher; the call blocks only while the buffer is full. In durable mode
+        it returns once the record is committed, and raises if the write fails.
+        """
         start_time = time.perf_counter()
-        
-        # Use underlying storage for actual save
-        metadata_id = self._storage.save_metadata(
-            model_name=model_name,
-            stage=stage, 
-            event_type=event_type,
-            metadata=metadata,
-            model_version=model_version,
-            details=details
+
+        if self.use_compression:
+            # Compressed storage assigns its own IDs and has no batch API
+            metadata_id = self._storage.save_metadata(
+                model_name, stage, event_type, metadata, model_version, details
+            )
+            record = self._storage.get_metadata(metadata_id)
+            self._record_save(start_time)
+            if record is not None:
+                self._cache_put(record)
+            return metadata_id
+
+        record = self._storage.build_record(
+            model_name, stage, event_type, metadata, model_version, details
         )
-        
-        # Update performance stats
-        save_time = time.perf_counter() - start_time
-        self.total_saves += 1
-        self.total_save_time += save_time
-        
-        # Cache the metadata for quick access
-        cache_key = f"{model_name}:{stage}:{metadata_id}"
-        self.cache[cache_key] = {
-            'metadata_id': metadata_id,
-            'model_name': model_name,
-            'stage': stage,
-            'event_type': event_type,
-            'metadata': metadata,
-            'model_version': model_version,
-            'details': details,
-            'timestamp': time.time()
-        }
-        
+        metadata_id = record["id"]
+        if self.async_writes:
+            metadata_json = json.dumps(metadata)
+            # Queued reads see the saved snapshot, not later changes by the caller
+            record["metadata"] = json.loads(metadata_json)
+            write = _PendingWrite(record, metadata_json, self.durable_writes)
+            with self._submit_lock:
+                if self._closed:
+                    raise RuntimeError("HighPerformanceMetadataStorage is shut down")
+                with self._pending_lock:
+                    self._pending[metadata_id] = record
+                # Cached before it is queued, so a failed batch can evict it
+                self._cache_put(record)
+                self.memory_buffer.put(write)
+            if write.done is not None:
+                write.done.wait()
+                if write.error is not None:
+                    raise write.error
+            self._record_save(start_time)
+            return metadata_id
+
+        # Use underlying storage for actual save
+        self._storage.save_records([record])
+        self._record_save(start_time)
+
+        # Cache the record for quick access
+        self._cache_put(record)
+
         return metadata_id
-    
+
+    def _record_save(self, start_time: float):
+        """Update save performance stats."""
+        self.total_saves += 1
+        self.total_save_time += time.perf_counter() - start_time
+
+    def _cache_put(self, record: Dict[str, Any]):
+        """Cache a private copy of a record, so callers cannot change cached data."""
+        metadata_id = record["id"]
+        record = copy.deepcopy(record)
+        with self._cache_lock:
+            self.cache.put(metadata_id, record)
+            if metadata_id in self.cache:
+                self._model_index.setdefault(record["model_name"], set()).add(metadata_id)
+
+    def _unindex(self, metadata_id: Hashable, record: Dict[str, Any]):
+        """Eviction callback: drop an evicted record from the model name index."""
+        with self._cache_lock:
+            ids = self._model_index.get(record["model_name"])
+            if ids is not None:
+                ids.discard(metadata_id)
+                if not ids:
+                    del self._model_index[record["model_name"]]
+
+    def invalidate_model(self, model_name: str) -> int:
+        """
+        Drop all cached records of a model.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            Number of records removed from the cache
+        """
+        with self._cache_lock:
+            ids = self._model_index.pop(model_name, set())
+            for metadata_id in ids:
+                self.cache.pop(metadata_id)
+        return len(ids)
+
+    def _next_batch(self) -> Tuple[List[_PendingWrite], bool]:
+        """Wait for queued writes; return a batch once it is full or the interval has passed."""
+        item = self.memory_buffer.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        # Durable writers are waiting on the commit, so do not linger for more
+        deadline = time.monotonic() + (0.0 if self.durable_writes else self.flush_interval)
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self.memory_buffer.get(timeout=timeout) if timeout > 0 else self.memory_buffer.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _flush_loop(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._write_batch(batch)
+            # Account for every item taken off the queue, including the stop marker
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                self.memory_buffer.task_done()
+
+    def _write_batch(self, batch: List[_PendingWrite]):
+        records = [write.record for write in batch]
+        metadata_json = [write.metadata_json for write in batch]
+        error: Optional[BaseException] = None
+        for attempt in range(self.retry_attempts):
+            if attempt:
+                # Transient errors such as "database is locked" usually clear quickly
+                self.write_retries += 1
+                time.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            start = time.perf_counter()
+            try:
+                self._storage.save_records(records, metadata_json=metadata_json)
+            except Exception as e:
+                error = e
+            else:
+                error = None
+                break
+        elapsed = time.perf_counter() - start
+
+        with self._pending_lock:
+            for write in batch:
+                self._pending.pop(write.record["id"], None)
+        if error is None:
+            self.buffer_flushes += 1
+            self.records_flushed += len(batch)
+            self.total_flush_time += elapsed
+            self.max_flush_time = max(self.max_flush_time, elapsed)
+        else:
+            self.write_errors += len(batch)
+            self.last_write_error = f"{type(error).__name__}: {error}"
+            # Reads must not keep serving records that never reached storage
+            with self._cache_lock:
+                for write in batch:
+                    cached = self.cache.pop(write.record["id"])
+                    if cached is not None:
+                        self._unindex(write.record["id"], cached)
+            if not self.durable_writes:
+                with self._pending_lock:
+                    self._failed_ids.extend(write.record["id"] for write in batch)
+                    self._failure = error
+        for write in batch:
+            if write.done is not None:
+                write.error = error
+                write.done.set()
+
+    def flush(self):
+        """
+        Block until every queued record has been written.
+
+        Raises:
+            RuntimeError: If queued records could not be written since the last
+                flush() or shutdown(); the records are not in storage or the cache
+        """
+        if self.async_writes and self._flusher is not None and self._flusher.is_alive():
+            self.memory_buffer.join()
+        self._raise_write_failures()
+
+    def _raise_write_failures(self):
+        with self._pending_lock:
+            failed_ids, self._failed_ids = self._failed_ids, []
+            failure, self._failure = self._failure, None
+        if failed_ids:
+            raise RuntimeError(
+                f"{len(failed_ids)} queued metadata records were not written "
+                f"(first: {failed_ids[0]}): {type(failure).__name__}: {failure}"
+            ) from failure
+
+    def _get_pending(self, metadata_id: str) -> Optional[Dict[str, Any]]:
+        with self._pending_lock:
+            return self._pending.get(metadata_id)
+
     def get_metadata(self, metadata_id: str) -> Optional[Dict[str, Any]]:
-        """Get metadata with caching."""
-        # Check cache first
-        for cache_key, cached_item in self.cache.items():
-            if cached_item['metadata_id'] == metadata_id:
-                self.cache_hits += 1
-                return cached_item
-        
-        # Cache miss - delegate to underlying storage
-        self.cache_misses += 1
-        return self._storage.get_metadata(metadata_id)
-    
-    def get_model_metadata(self, model_name: str, stage: Optional[str] = None, 
+        """
+        Get metadata through the LRU cache (including records not yet flushed).
+
+        Returns a copy; changing it does not affect cached or stored data.
+        """
+        record = self.cache.get(metadata_id)
+        if record is not None:
+            return copy.deepcopy(record)
+
+        # Evicted from the cache before its batch was flushed
+        record = self._get_pending(metadata_id)
+        if record is None:
+            record = self._storage.get_metadata(metadata_id)
+        if record is not None:
+            self._cache_put(record)
+            record = copy.deepcopy(record)
+        return record
+
+    def get_model_metadata(self, model_name: str, stage: Optional[str] = None,
                           limit: int = 100) -> List[Dict[str, Any]]:
-        """Get model metadata with optimizations."""
-        return self._storage.get_model_metadata(model_name, stage, limit)
-    
+        """Get model metadata with optimizations (including records not yet flushed)."""
+        with self._pending_lock:
+            pending = [
+                copy.deepcopy(record) for record in self._pending.values()
+                if record["model_name"] == model_name and (not stage or record["stage"] == stage)
+            ]
+        records = self._storage.get_model_metadata(model_name, stage, limit)
+        if not pending:
+            return records
+
+        # A record may have been flushed between the two reads
+        seen = {record["id"] for record in records}
+        records.extend(record for record in pending if record["id"] not in seen)
+        records.sort(key=lambda record: record["timestamp"], reverse=True)
+        return records[:limit]
+
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
-        total_cache_requests = self.cache_hits + self.cache_misses
-        hit_rate = self.cache_hits / total_cache_requests if total_cache_requests > 0 else 0.0
+        cache_stats = self.cache.get_stats()
         avg_save_time = self.total_save_time / self.total_saves if self.total_saves > 0 else 0.0
-        
+        avg_flush_time = self.total_flush_time / self.buffer_flushes if self.buffer_flushes > 0 else 0.0
+
         return {
-            'cache_hit_rate': hit_rate,
-            'cache_hits': self.cache_hits,
-            'cache_misses': self.cache_misses,
+            'cache_hit_rate': cache_stats['hit_ratio'],
+            'cache_hits': cache_stats['hits'],
+            'cache_misses': cache_stats['misses'],
+            'cache_evictions': cache_stats['evictions'],
             'total_saves': self.total_saves,
             'avg_save_time': avg_save_time,
             'buffer_flushes': self.buffer_flushes,
-            'cached_items': len(self.cache),
+            'records_flushed': self.records_flushed,
+            'avg_flush_batch_size': self.records_flushed / self.buffer_flushes if self.buffer_flushes > 0 else 0.0,
+            'avg_flush_latency_ms': avg_flush_time * 1000,
+            'max_flush_latency_ms': self.max_flush_time * 1000,
+            'queue_depth': self.memory_buffer.qsize(),
+            'pending_writes': len(self._pending),
+            'write_errors': self.write_errors,
+            'write_retries': self.write_retries,
+            'last_write_error': self.last_write_error,
+            'async_writes': self.async_writes,
+            'durable_writes': self.durable_writes,
+            'cached_items': cache_stats['size'],
+            'cache_max_items': cache_stats['max_entries'],
+            'cached_models': len(self._model_index),
             'uptime': time.time() - self.start_time
         }
-    
+
+    def get_performance_metrics(self) -> Dict[str, Any]:
+        """Performance statistics with the read cache metrics grouped under "cache"."""
+        metrics = self.get_performance_stats()
+        metrics["cache"] = dict(self.cache.get_stats(), models=metrics["cached_models"])
+        return metrics
+
     def shutdown(self):
-        """Cleanup resources."""
-        self.cache.clear()
-        self.memory_buffer.clear()
\ No newline at end of file
+        """
+        Flush queued writes, stop the flusher and release resources.
+
+        Raises:
+            RuntimeError: If queued records could not be written (see flush())
+        """
+        with self._submit_lock:
+            if self._closed:
+                stopped = False
+            else:
+                self._closed = stopped = True
+                if self._flusher is not None:
+                    self.memory_buffer.put(_STOP)
+        if stopped:
+            if self._flusher is not None:
+                self._flusher.join()
+            self._storage.close()
+        with self._cache_lock:
+            self.cache.clear()
+            self._model_index.clear()
+        self._raise_write_failures()
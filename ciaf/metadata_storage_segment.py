@@ -0,0 +1,699 @@
+"""
+CIAF Segment Log Metadata Storage
+
+Append-only storage backend for metadata records. Records are appended to
+rolling segment files as length-prefixed, CRC32-checksummed frames instead
+of one file per record. Every segment has an offset index file listing the
+key fields and frame offset of each record, so reopening a store reads the
+small index files rather than every record; the in-memory index maps IDs to
+``(segment, offset)`` and keeps per-model timelines for paginated listings.
+
+Deletions append tombstone frames. A background compactor rewrites sealed
+segments whose share of deleted or expired bytes reaches a threshold, and
+drops tombstones once no deleted copy of their record is left on disk.
+
+Crash recovery: a segment without a valid index is scanned frame by frame
+and truncated at the first torn or corrupt frame; a compaction that was
+interrupted before its source segment was removed is completed on open.
+
+A store directory is owned by one SegmentLogStore at a time: opening takes
+an exclusive flock on a lock file in the directory (where fcntl is
+available), so a second process cannot run recovery or appends against
+segments that are being written.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import json
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+# Optional POSIX file locking
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+from .core.constants import (
+    METADATA_SEGMENT_COMPACTION_INTERVAL_SECONDS,
+    METADATA_SEGMENT_COMPACTION_RATIO,
+    METADATA_SEGMENT_MAX_BYTES,
+)
+from .metadata_storage import ModelTimeline
+
+# Frame header: kind, payload length, CRC32 of kind byte + payload
+_FRAME_HEADER = struct.Struct(">BII")
+_RECORD = 1
+_TOMBSTONE = 2
+
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_SUFFIX = ".idx"
+_LOCK_FILE = "store.lock"
+
+
+class _Entry:
+    """Location and key fields of a live record."""
+
+    __slots__ = ("seq", "offset", "length", "model_name", "stage", "timestamp")
+
+    def __init__(self, seq: int, offset: int, length: int, model_name: str, stage: str, timestamp: str):
+        self.seq = seq
+        self.offset = offset
+        self.length = length
+        self.model_name = model_name
+        self.stage = stage
+        self.timestamp = timestamp
+
+
+class _Segment:
+    """Bookkeeping for one segment file."""
+
+    def __init__(self, seq: int, path: Path, size: int = 0):
+        self.seq = seq
+        self.path = path
+        self.size = size
+        self.dead_bytes = 0
+        self.live: Set[str] = set()
+        # IDs whose deleted record frame is still in this file
+        self.dead_ids: Set[str] = set()
+        self.tombstones: Set[str] = set()
+        self.min_timestamp: Optional[str] = None
+        self.max_timestamp: Optional[str] = None
+        # Index rows of every frame, kept only while the segment is written to
+        self.frames: Optional[List[list]] = None
+        self.fd: Optional[int] = None
+
+    def note_timestamp(self, timestamp: str):
+        if self.min_timestamp is None or timestamp < self.min_timestamp:
+            self.min_timestamp = timestamp
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self.fd is None:
+            self.fd = os.open(self.path, os.O_RDONLY)
+        return os.pread(self.fd, length, offset)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def encode_frame(kind: int, payload: bytes) -> bytes:
+    """Length-prefixed, checksummed frame for a payload."""
+    return _FRAME_HEADER.pack(kind, len(payload), zlib.crc32(payload, zlib.crc32(bytes((kind,))))) + payload
+
+
+def decode_frame(frame: bytes) -> Tuple[int, bytes]:
+    """
+    Check and unpack one frame.
+
+    Returns:
+        (kind, payload)
+
+    Raises:
+        ValueError: If the frame is truncated or its checksum does not match
+    """
+    if len(frame) < _FRAME_HEADER.size:
+        raise ValueError("Truncated segment frame")
+    kind, length, checksum = _FRAME_HEADER.unpack_from(frame)
+    payload = frame[_FRAME_HEADER.size:_FRAME_HEADER.size + length]
+    if len(payload) != length:
+        raise ValueError("Truncated segment frame")
+    if zlib.crc32(payload, zlib.crc32(bytes((kind,)))) != checksum:
+        raise ValueError("Segment frame checksum mismatch")
+    return kind, payload
+
+
+def _scan_frames(data: bytes) -> Iterator[Tuple[int, int, int, bytes]]:
+    """Yield (offset, frame length, kind, payload) up to the first torn or corrupt frame."""
+    offset = 0
+    while offset + _FRAME_HEADER.size <= len(data):
+        _, length, _ = _FRAME_HEADER.unpack_from(data, offset)
+        end = offset + _FRAME_HEADER.size + length
+        if end > len(data):
+            return
+        try:
+            kind, payload = decode_frame(data[offset:end])
+        except ValueError:
+            return
+        if kind not in (_RECORD, _TOMBSTONE):
+            return
+        yield offset, end - offset, kind, payload
+        offset = end
+
+
+class SegmentLogStore:
+    """
+    Append-only segment log of metadata records.
+
+    Args:
+        directory: Directory holding the segment and index files
+        max_segment_bytes: Size at which the active segment is sealed and a new one started
+        compaction_ratio: Share of dead bytes at which a sealed segment is compacted
+        compaction_interval: Seconds between background compaction passes (0 disables the compactor)
+        retention_days: Records older than this are expired and compacted away (None keeps them)
+        fsync: Fsync the active segment after every append (seals and compactions are always fsynced)
+
+    Raises:
+        RuntimeError: If another store already holds the directory lock
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_segment_bytes: int = METADATA_SEGMENT_MAX_BYTES,
+        compaction_ratio: float = METADATA_SEGMENT_COMPACTION_RATIO,
+        compaction_interval: float = METADATA_SEGMENT_COMPACTION_INTERVAL_SECONDS,
+        retention_days: Optional[float] = None,
+        fsync: bool = False,
+    ):
+        if max_segment_bytes < 1:
+            raise ValueError("max_segment_bytes must be at least 1")
+        if not 0.0 < compaction_ratio <= 1.0:
+            raise ValueError("compaction_ratio must be in (0, 1]")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.compaction_ratio = compaction_ratio
+        self.retention_days = retention_days
+        self.fsync = fsync
+
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._segments: Dict[int, _Segment] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._timeline = ModelTimeline()
+        # ID -> segment holding the tombstone that must outlive the deleted record frame
+        self._tombstone_seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._active: Optional[_Segment] = None
+        self._writer = None
+        self.stats = {"recovered_bytes": 0, "compactions": 0, "reclaimed_bytes": 0}
+        self.last_compaction_error: Optional[str] = None
+
+        self._lock_fd = self._acquire_directory_lock()
+        try:
+            self._recover()
+        except BaseException:
+            self._release_directory_lock()
+            raise
+
+        self._stop = threading.Event()
+        self._compactor: Optional[threading.Thread] = None
+        if compaction_interval > 0:
+            self._compactor = threading.Thread(
+                target=self._compact_loop, args=(compaction_interval,),
+                name="ciaf-segment-compactor", daemon=True,
+            )
+            self._compactor.start()
+
+    # ------------------------------------------------------------------
+    # Files
+
+    def _acquire_directory_lock(self) -> Optional[int]:
+        """Take an exclusive lock on the store directory, failing if another store holds it."""
+        if not FCNTL_AVAILABLE:
+            return None
+        fd = os.open(self.directory / _LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            raise RuntimeError(
+                f"Segment store {self.directory} is already open in another process or store instance"
+            ) from None
+        return fd
+
+    def _release_directory_lock(self):
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:010d}{_SEGMENT_SUFFIX}"
+
+    def _index_path(self, seq: int) -> Path:
+        return self.directory / f"{seq:010d}{_INDEX_SUFFIX}"
+
+    def _write_index(self, segment: _Segment, frames: List[list], sealed: bool,
+                     compacted_from: Optional[int] = None):
+        """Write a segment's offset index atomically (temporary file, fsync, rename)."""
+        path = self._index_path(segment.seq)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"size": segment.size, "sealed": sealed, "compacted_from": compacted_from,
+                       "frames": frames}, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read_index(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _scan_segment(self, path: Path) -> Tuple[List[list], int]:
+        """Index rows of a segment read frame by frame, and the end of its last valid frame."""
+        with open(path, "rb") as f:
+            data = f.read()
+        frames = []
+        end = 0
+        for offset, length, kind, payload in _scan_frames(data):
+            if kind == _RECORD:
+                try:
+                    record = json.loads(payload)
+                    frames.append([_RECORD, offset, length, record["id"], record["model_name"],
+                                   record["stage"], record["timestamp"]])
+                except (ValueError, KeyError, TypeError):
+                    break
+            else:
+                frames.append([_TOMBSTONE, offset, length, payload.decode("utf-8")])
+            end = offset + length
+        return frames, end
+
+    # ------------------------------------------------------------------
+    # Recovery
+
+    def _recover(self):
+        """Load segment indexes, finish interrupted compactions and trim torn tails."""
+        for stale in self.directory.glob("*.tmp"):
+            stale.unlink()
+
+        seqs = sorted(int(path.stem) for path in self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+        for path in self.directory.glob(f"*{_INDEX_SUFFIX}"):
+            if int(path.stem) not in seqs:
+                path.unlink()
+
+        indexes = {seq: self._read_index(self._index_path(seq)) for seq in seqs}
+        # A finished compaction output supersedes its source segment
+        for seq in list(seqs):
+            index = indexes.get(seq)
+            source = index.get("compacted_from") if index else None
+            if source is None:
+                continue
+            if source in indexes:
+                self._segment_path(source).unlink()
+                self._index_path(source).unlink(missing_ok=True)
+                seqs.remove(source)
+                del indexes[source]
+            # Forget the source so a later segment reusing its number is not removed
+            index["compacted_from"] = None
+            with open(self._index_path(seq), "w") as f:
+                json.dump(index, f, separators=(",", ":"))
+
+        tombstones: Dict[str, int] = {}
+        unsealed = []
+        for seq in seqs:
+            path = self._segment_path(seq)
+            size = path.stat().st_size
+            index = indexes[seq]
+            if index is not None and index.get("size") == size:
+                frames = index["frames"]
+            else:
+                frames, end = self._scan_segment(path)
+                if end < size:
+                    with open(path, "r+b") as f:
+                        f.truncate(end)
+                    self.stats["recovered_bytes"] += size - end
+                    size = end
+                index = None
+            segment = _Segment(seq, path, size)
+            self._segments[seq] = segment
+            for frame in frames:
+                if frame[0] == _RECORD:
+                    _, offset, length, metadata_id, model_name, stage, timestamp = frame
+                    previous = self._entries.get(metadata_id)
+                    if previous is not None:
+                        self._segments[previous.seq].dead_bytes += previous.length
+                        self._segments[previous.seq].live.discard(metadata_id)
+                    self._entries[metadata_id] = _Entry(seq, offset, length, model_name, stage, timestamp)
+                    segment.live.add(metadata_id)
+                    segment.note_timestamp(timestamp)
+                else:
+                    tombstones[frame[3]] = seq
+                    segment.tombstones.add(frame[3])
+            if index is None or not index.get("sealed"):
+                segment.frames = [list(frame) for frame in frames]
+                unsealed.append(segment)
+        self._next_seq = (seqs[-1] + 1) if seqs else 0
+
+        # Tombstones apply regardless of segment order: IDs are never reused
+        for metadata_id, seq in tombstones.items():
+            entry = self._entries.pop(metadata_id, None)
+            if entry is None:
+                self._segments[seq].dead_bytes += _FRAME_HEADER.size + len(metadata_id.encode("utf-8"))
+                continue
+            holder = self._segments[entry.seq]
+            holder.live.discard(metadata_id)
+            holder.dead_ids.add(metadata_id)
+            holder.dead_bytes += entry.length
+            self._tombstone_seq[metadata_id] = seq
+        for metadata_id, entry in self._entries.items():
+            self._timeline.add(entry.model_name, entry.stage, entry.timestamp, metadata_id)
+
+        # Keep appending to the newest unsealed segment; seal any others
+        active = unsealed.pop() if unsealed else None
+        for segment in unsealed:
+            self._seal(segment)
+        if active is not None and active.size < self.max_segment_bytes:
+            self._index_path(active.seq).unlink(missing_ok=True)
+            self._open_active(active)
+        else:
+            if active is not None:
+                self._seal(active)
+            self._open_active(None)
+
+    # ------------------------------------------------------------------
+    # Writing
+
+    def _open_active(self, segment: Optional[_Segment]):
+        if segment is None:
+            segment = _Segment(self._next_seq, self._segment_path(self._next_seq))
+            segment.frames = []
+            self._segments[segment.seq] = segment
+            self._next_seq += 1
+        self._active = segment
+        self._writer = open(segment.path, "ab")
+
+    def _seal(self, segment: _Segment):
+        """Write the final offset index of a segment; it is never appended to again."""
+        with open(segment.path, "rb") as f:
+            os.fsync(f.fileno())
+        self._write_index(segment, segment.frames or [], sealed=True)
+        segment.frames = None
+
+    def _roll(self):
+        self._writer.close()
+        self._writer = None
+        self._seal(self._active)
+        self._open_active(None)
+
+    def _append_frames(self, frames: List[Tuple[int, bytes, list]]) -> List[Tuple[_Segment, int, int]]:
+        """
+        Append frames to the active segment, rolling it when full.
+
+        Args:
+            frames: (kind, payload, index row fields after kind/offset/length) per frame
+
+        Returns:
+            (segment, offset, length) per frame
+        """
+        if self._writer is None:
+            raise RuntimeError("SegmentLogStore is closed")
+        locations = []
+        pending: List[bytes] = []
+        for kind, payload, row in frames:
+            if self._active.size >= self.max_segment_bytes:
+                self._flush(pending)
+                pending = []
+                self._roll()
+            frame = encode_frame(kind, payload)
+            locations.append((self._active, self._active.size, len(frame)))
+            self._active.frames.append([kind, self._active.size, len(frame)] + row)
+            self._active.size += len(frame)
+            pending.append(frame)
+        self._flush(pending)
+        return locations
+
+    def _flush(self, pending: List[bytes]):
+        if not pending:
+            return
+        self._writer.write(b"".join(pending))
+        self._writer.flush()
+        if self.fsync:
+            os.fsync(self._writer.fileno())
+
+    def append(self, records: List[Dict[str, Any]]):
+        """
+        Append records (as built by MetadataStorage.build_record).
+
+        Args:
+            records: Metadata records with unique IDs
+        """
+        payloads = [
+            (_RECORD, json.dumps(record, separators=(",", ":"), default=str).encode("utf-8"),
+             [record["id"], record["model_name"], record["stage"], record["timestamp"]])
+            for record in records
+        ]
+        with self._lock:
+            for record, (segment, offset, length) in zip(records, self._append_frames(payloads)):
+                metadata_id = record["id"]
+                previous = self._entries.get(metadata_id)
+                if previous is not None:
+                    self._discard(metadata_id, previous)
+                entry = _Entry(segment.seq, offset, length, record["model_name"], record["stage"], record["timestamp"])
+                self._entries[metadata_id] = entry
+                self._timeline.add(entry.model_name, entry.stage, entry.timestamp, metadata_id)
+                segment.live.add(metadata_id)
+                segment.note_timestamp(entry.timestamp)
+
+    def _discard(self, metadata_id: str, entry: _Entry) -> _Segment:
+        """Drop a live record from memory and count its frame as dead."""
+        del self._entries[metadata_id]
+        self._timeline.remove(entry.model_name, entry.stage, entry.timestamp, metadata_id)
+        holder = self._segments[entry.seq]
+        holder.live.discard(metadata_id)
+        holder.dead_bytes += entry.length
+        return holder
+
+    def delete(self, metadata_ids: Iterable[str]) -> int:
+        """
+        Delete records by appending tombstones.
+
+        Args:
+            metadata_ids: IDs to delete (unknown IDs are ignored)
+
+        Returns:
+            Number of records deleted
+        """
+        with self._lock:
+            ids = [metadata_id for metadata_id in dict.fromkeys(metadata_ids) if metadata_id in self._entries]
+            if not ids:
+                return 0
+            locations = self._append_frames([
+                (_TOMBSTONE, metadata_id.encode("utf-8"), [metadata_id]) for metadata_id in ids
+            ])
+            for metadata_id, (segment, offset, length) in zip(ids, locations):
+                holder = self._discard(metadata_id, self._entries[metadata_id])
+                holder.dead_ids.add(metadata_id)
+                self._tombstone_seq[metadata_id] = segment.seq
+                segment.tombstones.add(metadata_id)
+        return len(ids)
+
+    def delete_before(self, cutoff: str) -> int:
+        """Delete records with a timestamp before ``cutoff`` (ISO 8601); returns the number deleted."""
+        with self._lock:
+            return self.delete([
+                metadata_id for metadata_id, entry in self._entries.items() if entry.timestamp < cutoff
+            ])
+
+    # ------------------------------------------------------------------
+    # Reading
+
+    def _expiry_cutoff(self) -> Optional[str]:
+        if self.retention_days is None:
+            return None
+        return (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).isoformat()
+
+    def _read_entry(self, metadata_id: str, entry: _Entry) -> Dict[str, Any]:
+        kind, payload = decode_frame(self._segments[entry.seq].read(entry.offset, entry.length))
+        if kind != _RECORD:
+            raise ValueError(f"Segment frame of {metadata_id} is not a record")
+        return json.loads(payload)
+
+    def get(self, metadata_id: str) -> Optional[Dict[str, Any]]:
+        """Read a record by ID; None if it is unknown, deleted or expired."""
+        cutoff = self._expiry_cutoff()
+        with self._lock:
+            entry = self._entries.get(metadata_id)
+            if entry is None or (cutoff is not None and entry.timestamp < cutoff):
+                return None
+            return self._read_entry(metadata_id, entry)
+
+    def model_records(
+        self, model_name: str, stage: Optional[str] = None, limit: int = 100, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """Records of a model (optionally one stage), newest first, skipping ``offset``."""
+        cutoff = self._expiry_cutoff()
+        with self._lock:
+            records = []
+            for metadata_id in self._timeline.page(model_name, stage, limit, offset):
+                entry = self._entries[metadata_id]
+                if cutoff is None or entry.timestamp >= cutoff:
+                    records.append(self._read_entry(metadata_id, entry))
+            return records
+
+    def model_names(self) -> List[str]:
+        with self._lock:
+            return self._timeline.model_names()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Compaction
+
+    def _expire(self):
+        """Drop records older than the retention period from memory; their frames become dead bytes."""
+        cutoff = self._expiry_cutoff()
+        if cutoff is None:
+            return
+        for segment in list(self._segments.values()):
+            if segment.min_timestamp is None or segment.min_timestamp >= cutoff:
+                continue
+            for metadata_id in [i for i in segment.live if self._entries[i].timestamp < cutoff]:
+                self._discard(metadata_id, self._entries[metadata_id])
+
+    def _needs_compaction(self, segment: _Segment) -> bool:
+        return segment is not self._active and segment.size > 0 and (
+            segment.dead_bytes >= segment.size * self.compaction_ratio
+        )
+
+    def compact(self) -> Dict[str, Any]:
+        """
+        Compact sealed segments whose share of deleted or expired bytes reaches the ratio.
+
+        Returns:
+            Number of segments compacted and bytes reclaimed in this pass
+        """
+        with self._compaction_lock:
+            with self._lock:
+                self._expire()
+                candidates = [seq for seq, segment in sorted(self._segments.items()) if self._needs_compaction(segment)]
+            compacted, reclaimed = 0, 0
+            for seq in candidates:
+                reclaimed += self._compact_segment(seq)
+                compacted += 1
+        return {"segments_compacted": compacted, "bytes_reclaimed": reclaimed}
+
+    def _compact_segment(self, seq: int) -> int:
+        with self._lock:
+            source = self._segments.get(seq)
+            if source is None or not self._needs_compaction(source):
+                return 0
+            moved = sorted(((metadata_id, self._entries[metadata_id]) for metadata_id in source.live),
+                           key=lambda item: item[1].offset)
+            locations = [(entry.offset, entry.length) for _, entry in moved]
+            # A tombstone is kept while a deleted copy of its record remains in another segment
+            kept_tombstones = [metadata_id for metadata_id in source.tombstones
+                               if self._tombstone_seq.get(metadata_id) == seq
+                               and metadata_id not in source.dead_ids]
+            target = _Segment(self._next_seq, self._segment_path(self._next_seq))
+            self._next_seq += 1
+
+        # Copy outside the lock: only compaction removes the source, and passes are serialized
+        frames: List[list] = []
+        tmp_path = target.path.with_name(target.path.name + ".tmp")
+        if moved or kept_tombstones:
+            with open(tmp_path, "wb") as f:
+                for (metadata_id, _), (offset, length) in zip(moved, locations):
+                    frame = source.read(offset, length)
+                    decode_frame(frame)
+                    f.write(frame)
+                    frames.append([_RECORD, target.size, length, metadata_id])
+                    target.size += length
+                for metadata_id in kept_tombstones:
+                    frame = encode_frame(_TOMBSTONE, metadata_id.encode("utf-8"))
+                    f.write(frame)
+                    frames.append([_TOMBSTONE, target.size, len(frame), metadata_id])
+                    target.size += len(frame)
+                f.flush()
+                os.fsync(f.fileno())
+
+        with self._lock:
+            index_frames = []
+            for (metadata_id, old), frame in zip(moved, frames):
+                _, offset, length, _ = frame
+                index_frames.append([_RECORD, offset, length, metadata_id, old.model_name, old.stage, old.timestamp])
+                target.note_timestamp(old.timestamp)
+                if self._entries.get(metadata_id) is old:
+                    old.seq, old.offset = target.seq, offset
+                    target.live.add(metadata_id)
+                else:
+                    # Deleted or replaced during the copy
+                    target.dead_bytes += length
+                    if metadata_id in self._tombstone_seq:
+                        target.dead_ids.add(metadata_id)
+            for frame in frames[len(moved):]:
+                index_frames.append(frame)
+                target.tombstones.add(frame[3])
+                self._tombstone_seq[frame[3]] = target.seq
+
+            # Deleted copies in the source are gone, so their tombstones become dead bytes
+            for metadata_id in source.dead_ids - target.dead_ids:
+                tombstone_seq = self._tombstone_seq.pop(metadata_id, None)
+                if tombstone_seq is not None and tombstone_seq != seq and tombstone_seq in self._segments:
+                    self._segments[tombstone_seq].dead_bytes += _FRAME_HEADER.size + len(metadata_id.encode("utf-8"))
+
+            if frames:
+                self._write_index(target, index_frames, sealed=True, compacted_from=seq)
+                os.replace(tmp_path, target.path)
+                self._segments[target.seq] = target
+            del self._segments[seq]
+            source.close()
+            source.path.unlink()
+            self._index_path(seq).unlink(missing_ok=True)
+            if frames:
+                # The source is gone, so the output no longer needs to name it
+                self._write_index(target, index_frames, sealed=True)
+
+            reclaimed = source.size - target.size
+            self.stats["compactions"] += 1
+            self.stats["reclaimed_bytes"] += reclaimed
+        return reclaimed
+
+    def _compact_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.compact()
+            except Exception as e:
+                self.last_compaction_error = f"{type(e).__name__}: {e}"
+
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Segment counts, sizes, dead bytes and compaction statistics."""
+        with self._lock:
+            total = sum(segment.size for segment in self._segments.values())
+            dead = sum(segment.dead_bytes for segment in self._segments.values())
+            return dict(
+                self.stats,
+                records=len(self._entries),
+                segments=len(self._segments),
+                active_segment=self._active.seq if self._active is not None else None,
+                total_bytes=total,
+                dead_bytes=dead,
+                last_compaction_error=self.last_compaction_error,
+            )
+
+    def close(self):
+        """Stop the compactor and write the active segment's offset index for a fast reopen."""
+        if self._compactor is not None:
+            self._stop.set()
+            self._compactor.join()
+            self._compactor = None
+        with self._lock:
+            if self._writer is None:
+                return
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._writer.close()
+            self._writer = None
+            self._write_index(self._active, self._active.frames, sealed=False)
+            for segment in self._segments.values():
+                segment.close()
+            self._release_directory_lock()
@@ -8,6 +8,14 @@ Version: 1.1.0
 """
 
 from .capsules import ProvenanceCapsule
+from .capsule_factory import CapsuleBatch, ProvenanceCapsuleFactory, read_capsule_container
 from .snapshots import ModelAggregationAnchor, TrainingSnapshot
 
-__all__ = ["ProvenanceCapsule", "TrainingSnapshot", "ModelAggregationAnchor"]
+__all__ = [
+    "ProvenanceCapsule",
+    "ProvenanceCapsuleFactory",
+    "CapsuleBatch",
+    "read_capsule_container",
+    "TrainingSnapshot",
+    "ModelAggregationAnchor",
+]
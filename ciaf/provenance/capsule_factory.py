@@ -0,0 +1,226 @@
+"""
+Bulk Provenance Capsule construction for CIAF.
+
+Builds ProvenanceCapsules for a whole dataset in chunks on a process pool.
+Per-capsule key derivation (PBKDF2) dominates construction cost, so workers
+derive keys, encrypt payloads and compute hash proofs, and the caller
+assembles the capsules in input order. Batches serialize to a compact binary
+container instead of per-capsule base64 JSON.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import json
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..core import SALT_LENGTH, encrypt_aes_gcm, secure_random_bytes, sha256_hash
+from ..core.constants import CAPSULE_FACTORY_CHUNK_SIZE, CAPSULE_FACTORY_PARALLEL_MIN
+from ..core.crypto import AES_GCM_NONCE_LENGTH, AES_GCM_TAG_LENGTH
+from .capsules import ProvenanceCapsule, _capsule_data_bytes, derive_key
+
+# Binary container: magic, version, capsule count; then per capsule the
+# metadata and ciphertext lengths followed by metadata JSON, salt, nonce, tag
+# and ciphertext.
+CAPSULE_CONTAINER_MAGIC = b"CPC"
+CAPSULE_CONTAINER_VERSION = 1
+_CONTAINER_HEADER = struct.Struct(">3sBI")
+_CAPSULE_HEADER = struct.Struct(">II")
+
+# (original_data, metadata, data_secret)
+CapsuleItem = Tuple[Any, Dict[str, Any], str]
+
+
+def _seal_chunk(items: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes, bytes, bytes, bytes, str]]:
+    """Derive, encrypt and hash (data_bytes, secret_bytes) items in a worker."""
+    results = []
+    for data_bytes, secret_bytes in items:
+        salt = secure_random_bytes(SALT_LENGTH)
+        key = derive_key(salt, secret_bytes, 32)
+        ciphertext, nonce, tag = encrypt_aes_gcm(key, data_bytes)
+        results.append((salt, key, ciphertext, nonce, tag, sha256_hash(data_bytes)))
+    return results
+
+
+def _derive_chunk(items: List[Tuple[bytes, bytes]]) -> List[bytes]:
+    """Re-derive capsule keys for (salt, secret_bytes) items in a worker."""
+    return [derive_key(salt, secret_bytes, 32) for salt, secret_bytes in items]
+
+
+@dataclass
+class CapsuleBatch:
+    """Capsules built or loaded by ProvenanceCapsuleFactory, in input order."""
+    capsules: List[ProvenanceCapsule]
+    workers: int = 1
+    elapsed_seconds: float = 0.0
+
+    @property
+    def hash_proofs(self) -> List[str]:
+        return [capsule.hash_proof for capsule in self.capsules]
+
+    def __len__(self) -> int:
+        return len(self.capsules)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the batch to the binary capsule container."""
+        parts = [_CONTAINER_HEADER.pack(CAPSULE_CONTAINER_MAGIC, CAPSULE_CONTAINER_VERSION, len(self.capsules))]
+        for capsule in self.capsules:
+            metadata = json.dumps(capsule.metadata, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            parts.append(_CAPSULE_HEADER.pack(len(metadata), len(capsule.encrypted_data)))
+            parts.extend((metadata, capsule.salt, capsule.nonce, capsule.tag, capsule.encrypted_data))
+        return b"".join(parts)
+
+    def write(self, path: str) -> int:
+        """Write the binary container to a file; returns the number of bytes written."""
+        data = self.to_bytes()
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+
+def read_capsule_container(data: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse a binary capsule container without deriving any keys.
+
+    Args:
+        data: Bytes produced by CapsuleBatch.to_bytes()
+
+    Returns:
+        List of dicts with metadata, salt, nonce, tag and encrypted_data
+
+    Raises:
+        ValueError: If the container is malformed or of an unsupported version
+    """
+    if len(data) < _CONTAINER_HEADER.size:
+        raise ValueError("Truncated capsule container")
+    magic, version, count = _CONTAINER_HEADER.unpack_from(data)
+    if magic != CAPSULE_CONTAINER_MAGIC:
+        raise ValueError("Not a CIAF capsule container")
+    if version != CAPSULE_CONTAINER_VERSION:
+        raise ValueError(f"Unsupported capsule container version: {version}")
+
+    fixed = SALT_LENGTH + AES_GCM_NONCE_LENGTH + AES_GCM_TAG_LENGTH
+    entries = []
+    offset = _CONTAINER_HEADER.size
+    for _ in range(count):
+        if offset + _CAPSULE_HEADER.size > len(data):
+            raise ValueError("Truncated capsule container")
+        metadata_len, ciphertext_len = _CAPSULE_HEADER.unpack_from(data, offset)
+        offset += _CAPSULE_HEADER.size
+        end = offset + metadata_len + fixed + ciphertext_len
+        if end > len(data):
+            raise ValueError("Truncated capsule container")
+
+        metadata = json.loads(data[offset:offset + metadata_len])
+        offset += metadata_len
+        salt = data[offset:offset + SALT_LENGTH]
+        offset += SALT_LENGTH
+        nonce = data[offset:offset + AES_GCM_NONCE_LENGTH]
+        offset += AES_GCM_NONCE_LENGTH
+        tag = data[offset:offset + AES_GCM_TAG_LENGTH]
+        offset += AES_GCM_TAG_LENGTH
+        entries.append({
+            "metadata": metadata,
+            "salt": salt,
+            "nonce": nonce,
+            "tag": tag,
+            "encrypted_data": data[offset:end],
+        })
+        offset = end
+    if offset != len(data):
+        raise ValueError("Trailing bytes after capsule container")
+    return entries
+
+
+class ProvenanceCapsuleFactory:
+    """
+    Builds ProvenanceCapsules for entire datasets on a process pool.
+
+    Capsules are interchangeable with ones built one at a time with
+    ProvenanceCapsule(...): same key derivation, encryption and hash proof,
+    and their metadata gains ``hash_proof`` and ``creation_timestamp``.
+
+    Args:
+        workers: Pool size (defaults to the machine's CPU count; 1 builds in-process)
+        chunk_size: Capsules per worker task
+        parallel_min: Minimum batch size for using the process pool
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = CAPSULE_FACTORY_CHUNK_SIZE,
+        parallel_min: int = CAPSULE_FACTORY_PARALLEL_MIN,
+    ):
+        self.workers = max(1, workers if workers is not None else (os.cpu_count() or 1))
+        self.chunk_size = max(1, chunk_size)
+        self.parallel_min = parallel_min
+
+    def _map(self, worker: Callable[[List[Any]], List[Any]], items: List[Any]) -> Tuple[List[Any], int]:
+        if self.workers == 1 or len(items) < max(self.parallel_min, 2 * self.chunk_size):
+            return worker(items), 1
+        chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        workers = min(self.workers, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return [result for chunk in pool.map(worker, chunks) for result in chunk], workers
+
+    def build(self, items: Iterable[CapsuleItem]) -> CapsuleBatch:
+        """
+        Build capsules for (original_data, metadata, data_secret) items.
+
+        Args:
+            items: Iterable of (original_data, metadata, data_secret) tuples
+
+        Returns:
+            CapsuleBatch with capsules (and hash proofs) in input order
+        """
+        start = time.perf_counter()
+        items = list(items)
+        work = [(_capsule_data_bytes(data), secret.encode("utf-8")) for data, _, secret in items]
+        sealed, workers = self._map(_seal_chunk, work)
+
+        capsules = []
+        for (original_data, metadata, secret), (data_bytes, _), parts in zip(items, work, sealed):
+            salt, key, ciphertext, nonce, tag, hash_proof = parts
+            metadata["hash_proof"] = hash_proof
+            metadata["creation_timestamp"] = datetime.now().isoformat()
+            capsule = ProvenanceCapsule.from_parts(metadata, salt, key, ciphertext, nonce, tag, secret)
+            capsule.original_data = original_data
+            capsule.original_data_bytes = data_bytes
+            capsules.append(capsule)
+
+        return CapsuleBatch(capsules, workers, time.perf_counter() - start)
+
+    def load(self, data: bytes, data_secrets: Sequence[str]) -> CapsuleBatch:
+        """
+        Load capsules from a binary container, re-deriving their keys on the pool.
+
+        Args:
+            data: Bytes produced by CapsuleBatch.to_bytes()
+            data_secrets: Data secret of each capsule, in container order
+
+        Returns:
+            CapsuleBatch of decryptable capsules
+        """
+        start = time.perf_counter()
+        entries = read_capsule_container(data)
+        if len(data_secrets) != len(entries):
+            raise ValueError(f"Expected {len(entries)} data secrets, got {len(data_secrets)}")
+        keys, workers = self._map(
+            _derive_chunk,
+            [(entry["salt"], secret.encode("utf-8")) for entry, secret in zip(entries, data_secrets)],
+        )
+        capsules = [
+            ProvenanceCapsule.from_parts(
+                entry["metadata"], entry["salt"], key, entry["encrypted_data"], entry["nonce"], entry["tag"], secret
+            )
+            for entry, key, secret in zip(entries, keys, data_secrets)
+        ]
+        return CapsuleBatch(capsules, workers, time.perf_counter() - start)
@@ -21,12 +21,38 @@ from cryptography.exceptions import InvalidTag
 from ..core import (
     SALT_LENGTH,
     decrypt_aes_gcm,
+    derive_master_anchor,
     encrypt_aes_gcm,
     secure_random_bytes,
     sha256_hash,
 )
 
 
+def derive_key(salt: bytes, data_secret_bytes: bytes, length: int = 32) -> bytes:
+    """
+    Derive a capsule encryption key from its data secret and salt (PBKDF2-HMAC-SHA256).
+
+    Uses the same derivation as master anchors; every capsule has a fresh salt,
+    so the process-wide master anchor cache is bypassed.
+    """
+    key = derive_master_anchor(data_secret_bytes.decode("utf-8"), salt, use_cache=False)
+    if length != len(key):
+        raise ValueError(f"Unsupported capsule key length: {length}")
+    return key
+
+
+def _capsule_data_bytes(original_data) -> bytes:
+    """Convert capsule payload data (str, UTF-8 bytes or any other value) to bytes."""
+    if isinstance(original_data, str):
+        data_str = original_data
+    elif isinstance(original_data, bytes):
+        data_str = original_data.decode("utf-8")
+    else:
+        # Convert numerical or other data to string representation
+        data_str = str(original_data)
+    return data_str.encode("utf-8")
+
+
 class ProvenanceCapsule:
     """
     Represents a Provenance Capsule for a piece of training data.
@@ -47,18 +73,7 @@ class ProvenanceCapsule:
         """
         self.original_data = original_data  # Store original data for testing
 
-        # Handle different data types - convert to string representation first
-        if isinstance(original_data, (str, bytes)):
-            data_str = (
-                original_data
-                if isinstance(original_data, str)
-                else original_data.decode("utf-8")
-            )
-        else:
-            # Convert numerical or other data to string representation
-            data_str = str(original_data)
-
-        self.original_data_bytes = data_str.encode("utf-8")
+        self.original_data_bytes = _capsule_data_bytes(original_data)
         self.metadata = metadata
         self.data_secret_bytes = data_secret.encode("utf-8")
         self.salt = secure_random_bytes(SALT_LENGTH)
@@ -108,6 +123,37 @@ class ProvenanceCapsule:
         capsule.hash_proof = capsule.metadata["hash_proof"]
         return capsule
 
+    @classmethod
+    def from_parts(
+        cls,
+        metadata: dict,
+        salt: bytes,
+        derived_key: bytes,
+        encrypted_data: bytes,
+        nonce: bytes,
+        tag: bytes,
+        data_secret: str,
+    ):
+        """
+        Assembles a ProvenanceCapsule from already derived and encrypted parts.
+
+        Used by ProvenanceCapsuleFactory, whose workers perform key derivation
+        and encryption. ``metadata`` must already contain ``hash_proof``.
+
+        Returns:
+            ProvenanceCapsule instance.
+        """
+        capsule = cls.__new__(cls)
+        capsule.metadata = metadata
+        capsule.encrypted_data = encrypted_data
+        capsule.nonce = nonce
+        capsule.tag = tag
+        capsule.salt = salt
+        capsule.data_secret_bytes = data_secret.encode("utf-8")
+        capsule.derived_key = derived_key
+        capsule.hash_proof = metadata["hash_proof"]
+        return capsule
+
     def decrypt_data(self) -> str:
         """
         Decrypts and returns the original data.
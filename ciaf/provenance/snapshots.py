@@ -38,8 +38,9 @@ class ModelAggregationAnchor:
         self.key_id = key_id
         self.salt = secure_random_bytes(SALT_LENGTH)
         
-        # Use proper anchor derivation instead of legacy derive_key
-        self.derived_anchor = derive_master_anchor(secret_material, self.salt)
+        # Use proper anchor derivation instead of legacy derive_key; the salt is
+        # fresh, so the process-wide master anchor cache could never hit
+        self.derived_anchor = derive_master_anchor(secret_material, self.salt, use_cache=False)
         
         print(f"MAA '{self.key_id}' initialized with anchor-based cryptography.")
 
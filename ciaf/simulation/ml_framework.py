@@ -7,7 +7,7 @@ Author: Denzil James Greenwood
 Version: 1.0.0
 """
 
-from ..provenance import ModelAggregationAnchor, ProvenanceCapsule, TrainingSnapshot
+from ..provenance import ModelAggregationAnchor, ProvenanceCapsule, ProvenanceCapsuleFactory, TrainingSnapshot
 from .mock_llm import MockLLM
 import hashlib
 from ..core import derive_model_anchor, to_hex
@@ -29,27 +29,27 @@ class MLFrameworkSimulator:
         self.model_name = model_name
         self.llm = MockLLM()
 
-    def prepare_data(self, raw_data_list: list) -> list[ProvenanceCapsule]:
+    def prepare_data(self, raw_data_list: list, workers: int = 1) -> list[ProvenanceCapsule]:
         """
         Simulates preparing data by creating Provenance Capsules.
 
         Args:
             raw_data_list: List of dictionaries, each representing a raw data item.
+            workers: Process pool size for building capsules (1 builds in-process).
 
         Returns:
             List of ProvenanceCapsule objects.
         """
-        provenance_capsules = []
+        items = []
+        data_ids = []
         for i, data_item in enumerate(raw_data_list):
             data_id = data_item.get("id", f"data_{i}")
             data_secret = f"secret_for_{data_id}"
-            
-            capsule = ProvenanceCapsule(
-                original_data=data_item["content"],
-                metadata=data_item["metadata"],
-                data_secret=data_secret,
-            )
-            provenance_capsules.append(capsule)
+            items.append((data_item["content"], data_item["metadata"], data_secret))
+            data_ids.append(data_id)
+
+        provenance_capsules = ProvenanceCapsuleFactory(workers=workers).build(items).capsules
+        for data_id in data_ids:
             print(f"  Created Provenance Capsule for data ID: {data_id}")
         return provenance_capsules
 
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+CIAF WORM Record Format Migration
+=================================
+
+Re-encodes the records of an existing SQLite or LMDB WORM store between the
+JSON and msgpack record formats. Record hashes are computed over canonical
+JSON and are verified to be unchanged for every rewritten record, so existing
+Merkle roots and inclusion proofs remain valid.
+
+Usage:
+    python scripts/migrate_worm_format.py audit.db --to msgpack
+    python scripts/migrate_worm_format.py ledger_lmdb/ --backend lmdb --to json
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add CIAF to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from ciaf.core.worm_store import (
+    RECORD_FORMATS,
+    create_lmdb_worm_store,
+    create_sqlite_worm_store,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate a CIAF WORM store to another record format")
+    parser.add_argument("path", help="SQLite database file or LMDB directory")
+    parser.add_argument("--to", dest="target", choices=RECORD_FORMATS, required=True,
+                        help="Target record format")
+    parser.add_argument("--backend", choices=["sqlite", "lmdb"],
+                        help="Store backend (default: lmdb for directories, sqlite otherwise)")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Records re-encoded per transaction (default: 1000)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        print(f"Store not found: {args.path}", file=sys.stderr)
+        return 1
+
+    backend = args.backend or ("lmdb" if os.path.isdir(args.path) else "sqlite")
+    if backend == "lmdb":
+        store = create_lmdb_worm_store(args.path)
+    else:
+        store = create_sqlite_worm_store(args.path)
+
+    start = time.perf_counter()
+    try:
+        stats = store.migrate_record_format(args.target, batch_size=max(args.batch_size, 1))
+    except (ImportError, ValueError) as e:
+        print(f"Migration failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"Migrated {backend} store {args.path} to {args.target}")
+    print(f"  Records scanned:   {stats['scanned']}")
+    print(f"  Records converted: {stats['converted']}")
+    print(f"  Elapsed:           {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
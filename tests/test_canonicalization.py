@@ -0,0 +1,91 @@
+"""
+Canonical JSON conformance tests.
+
+Runs the canonicalization vectors and encoder edge cases through
+canonical_json(), the orjson fast path and the stdlib reference encoder,
+which must agree byte for byte.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import enum
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+from ciaf.core.canonicalization import (
+    ORJSON_AVAILABLE,
+    _orjson_canonical,
+    canonical_json,
+    canonical_json_stdlib,
+)
+from ciaf.core.test_vectors import (
+    CANONICAL_ENCODER_EDGE_CASES,
+    CANONICALIZATION_TEST_OBJECTS,
+    validate_canonical_encoder,
+)
+
+VECTORS = CANONICALIZATION_TEST_OBJECTS + CANONICAL_ENCODER_EDGE_CASES
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+@dataclass
+class Point:
+    x: int
+
+
+NON_JSON_VALUES = [
+    uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    Color.RED,
+    datetime(2026, 1, 1, tzinfo=timezone.utc),
+    Point(1),
+    b"bytes",
+    {1, 2},
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("data", VECTORS)
+def test_canonical_json_matches_stdlib(data):
+    assert canonical_json(data) == canonical_json_stdlib(data)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+@pytest.mark.parametrize("data", VECTORS)
+def test_orjson_fast_path_matches_stdlib(data):
+    fast = _orjson_canonical(data)
+    if fast is not None:
+        assert fast == canonical_json_stdlib(data)
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+def test_orjson_fast_path_covers_plain_documents():
+    data = {"model_id": "m1", "params": {"layers": [1, 2, 3], "name": "x"}, "ok": True, "none": None}
+    assert _orjson_canonical(data) == canonical_json_stdlib(data)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value", NON_JSON_VALUES, ids=lambda value: type(value).__name__)
+def test_non_json_values_rejected_on_both_paths(value):
+    with pytest.raises(TypeError):
+        canonical_json_stdlib({"value": value})
+    with pytest.raises(TypeError):
+        canonical_json({"value": value})
+    if ORJSON_AVAILABLE:
+        assert _orjson_canonical({"value": value}) is None
+
+
+@pytest.mark.unit
+def test_validate_canonical_encoder_report():
+    report = validate_canonical_encoder()
+    assert report["failed"] == 0, report["failures"]
+    assert report["passed"] == report["total_tests"] > 0
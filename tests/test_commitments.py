@@ -0,0 +1,56 @@
+"""
+Commitment engine tests.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import pytest
+
+from ciaf.lcm.commitments import CommitmentEngine
+from ciaf.lcm.policy import CommitmentType
+
+SEED = b"s" * 32
+SALTED_TYPES = [CommitmentType.SALTED, CommitmentType.HMAC_SHA256]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("commitment_type", SALTED_TYPES, ids=lambda t: t.name)
+def test_equal_values_get_different_commitments(commitment_type):
+    engine = CommitmentEngine(commitment_type, seed=SEED)
+    first, second = engine.commit("same query"), engine.commit("same query")
+    assert first != second
+    batch = engine.commit_many(["same query", "same query"]).commitments
+    assert len(set(batch + [first, second])) == 4
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("commitment_type", SALTED_TYPES, ids=lambda t: t.name)
+def test_verify_depends_on_index(commitment_type):
+    engine = CommitmentEngine(commitment_type, seed=SEED)
+    commitment = engine.commit({"value": 1})
+    assert engine.verify({"value": 1}, commitment, 0)
+    assert not engine.verify({"value": 1}, commitment, 1)
+    assert not engine.verify({"value": 2}, commitment, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("commitment_type", SALTED_TYPES, ids=lambda t: t.name)
+def test_batch_matches_single_commits(commitment_type):
+    items = ["a", {"b": 2}, "c", "d", "e", "f"]
+    single = CommitmentEngine(commitment_type, seed=SEED)
+    expected = [single.commit(item) for item in items]
+    batch = CommitmentEngine(commitment_type, seed=SEED)
+    batch.commit("skip")
+    assert CommitmentEngine(commitment_type, seed=SEED).commit_many(items).commitments == expected
+    result = batch.commit_many(items)
+    assert batch.verify_many(items, result.commitments, result.start_index)
+
+
+@pytest.mark.unit
+def test_hmac_commitments_use_anchor_key():
+    items = ["x", "y"]
+    with_anchor = CommitmentEngine(CommitmentType.HMAC_SHA256, seed=SEED, anchor=b"k" * 32).commit_many(items)
+    derived = CommitmentEngine(CommitmentType.HMAC_SHA256, seed=SEED).commit_many(items)
+    assert with_anchor.commitments != derived.commitments
@@ -0,0 +1,70 @@
+"""
+Epoch signing tests: sealed epoch anchors are persisted in the ledger and
+proof capsules never carry an unsigned anchor without its epoch proof.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import contextlib
+import io
+
+import pytest
+
+from ciaf.api.framework import CIAFFramework
+from ciaf.core.enums import RecordType
+from ciaf.core.epoch_signing import EpochProof
+
+
+def make_framework(**overrides):
+    options = {"epoch_signing": True, "epoch_max_records": 4, "epoch_max_seconds": 3600.0}
+    options.update(overrides)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return CIAFFramework("epoch-test", **options)
+
+
+def anchor(framework, i):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return framework._anchor_and_emit(
+            {"inference_id": f"inf-{i}", "model_id": "model", "score": i}, RecordType.INFERENCE
+        )
+
+
+@pytest.mark.unit
+def test_sealed_epoch_anchors_are_persisted_in_ledger():
+    framework = make_framework()
+    receipts = [anchor(framework, i) for i in range(6)]
+    framework.flush_epoch()
+
+    epoch_anchors = framework.ledger.epoch_anchors
+    assert len(epoch_anchors) == 2
+    assert all(epoch_anchor.signature for epoch_anchor in epoch_anchors)
+    for receipt in receipts:
+        assert receipt.epoch_proof.epoch_anchor in epoch_anchors
+        assert receipt.epoch_proof.verify(receipt.anchor)
+
+
+@pytest.mark.unit
+def test_capsule_seals_open_epoch():
+    framework = make_framework()
+    anchor(framework, 0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        capsule = framework.materialize_proof_capsule("inf-0")
+
+    proof = EpochProof.from_dict(capsule["proofs"]["epoch_proof"])
+    assert proof.epoch_anchor.signature
+    assert proof.verify(framework.ledger.get_latest_anchor())
+    assert framework.ledger.epoch_anchors == [proof.epoch_anchor]
+
+
+@pytest.mark.unit
+def test_capsule_refused_when_epoch_not_retained():
+    framework = make_framework(epoch_max_records=1)
+    framework.epoch_signer.max_retained_epochs = 1
+    anchor(framework, 0)
+    latest = anchor(framework, 1)
+    framework.epoch_signer._evict_oldest_locked()
+    assert framework.epoch_signer.get_proof(latest.anchor) is None
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(ValueError, match="no longer retained"):
+        framework.materialize_proof_capsule("inf-1")
@@ -0,0 +1,75 @@
+"""
+Crash test for durable write-behind metadata storage.
+
+A child process saves records through HighPerformanceMetadataStorage in
+durable mode and prints every acknowledged ID. The test kills the child
+with SIGKILL mid-stream, reopens the database, and checks that every
+acknowledged record is present.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ciaf.metadata_storage import MetadataStorage
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+CRASH_CHILD = """
+import sys
+from ciaf.metadata_storage_optimized import HighPerformanceMetadataStorage
+
+storage = HighPerformanceMetadataStorage({
+    "storage_path": sys.argv[1],
+    "batch_write_size": 200,
+    "memory_buffer_size": 2000,
+    "durable_writes": True,
+})
+i = 0
+while True:
+    metadata_id = storage.save_metadata("crash_model", "inference", "prediction", {"i": i})
+    sys.stdout.write(metadata_id + "\\n")
+    sys.stdout.flush()
+    i += 1
+"""
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="requires SIGKILL")
+def test_durable_writes_survive_sigkill(tmp_path):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+    child = subprocess.Popen(
+        [sys.executable, "-c", CRASH_CHILD, str(tmp_path)],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=env,
+    )
+    acknowledged = []
+    try:
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            line = child.stdout.readline()
+            if not line:
+                break
+            acknowledged.append(line.strip())
+    finally:
+        child.send_signal(signal.SIGKILL)
+        child.wait()
+        child.stdout.close()
+
+    assert acknowledged, "child acknowledged no writes before SIGKILL"
+    storage = MetadataStorage(str(tmp_path), backend="sqlite")
+    try:
+        missing = [metadata_id for metadata_id in acknowledged if storage.get_metadata(metadata_id) is None]
+    finally:
+        storage.close()
+    assert missing == []
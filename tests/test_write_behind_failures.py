@@ -0,0 +1,104 @@
+"""
+Tests for failed batch writes of write-behind metadata storage.
+
+The underlying save_records is made to fail, transiently or for good, and
+the tests check that reads, stored data and raised errors agree.
+
+Created: 2026-10-16
+Author: Denzil James Greenwood
+Version: 1.0.0
+"""
+
+import sqlite3
+
+import pytest
+
+from ciaf.metadata_storage import MetadataStorage
+from ciaf.metadata_storage_optimized import HighPerformanceMetadataStorage
+
+
+def make_storage(path, **overrides):
+    config = {
+        "storage_path": str(path),
+        "batch_write_size": 10,
+        "write_retry_attempts": 3,
+        "write_retry_backoff_seconds": 0.0,
+    }
+    config.update(overrides)
+    return HighPerformanceMetadataStorage(config)
+
+
+def fail_writes(monkeypatch, storage, failures):
+    """Make the next ``failures`` batch writes raise 'database is locked'."""
+    save_records = storage._storage.save_records
+    remaining = [failures]
+
+    def flaky(*args, **kwargs):
+        if remaining[0] > 0:
+            remaining[0] -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return save_records(*args, **kwargs)
+
+    monkeypatch.setattr(storage._storage, "save_records", flaky)
+
+
+def stored(path, metadata_id):
+    storage = MetadataStorage(str(path), backend="sqlite")
+    try:
+        return storage.get_metadata(metadata_id)
+    finally:
+        storage.close()
+
+
+@pytest.mark.unit
+def test_transient_failure_is_retried(tmp_path, monkeypatch):
+    storage = make_storage(tmp_path)
+    fail_writes(monkeypatch, storage, 2)
+    metadata_id = storage.save_metadata("model", "inference", "prediction", {"i": 1})
+    storage.flush()
+    stats = storage.get_performance_stats()
+    storage.shutdown()
+
+    assert stats["write_retries"] == 2
+    assert stats["write_errors"] == 0
+    assert stored(tmp_path, metadata_id) is not None
+
+
+@pytest.mark.unit
+def test_failed_batch_is_evicted_and_reported(tmp_path, monkeypatch):
+    storage = make_storage(tmp_path)
+    fail_writes(monkeypatch, storage, 3)
+    metadata_id = storage.save_metadata("model", "inference", "prediction", {"i": 1})
+    with pytest.raises(RuntimeError, match="not written"):
+        storage.flush()
+
+    assert storage.get_metadata(metadata_id) is None
+    assert storage.get_model_metadata("model") == []
+    assert storage.get_performance_stats()["write_errors"] == 1
+
+    # Reported once; later writes go through
+    storage.flush()
+    later_id = storage.save_metadata("model", "inference", "prediction", {"i": 2})
+    storage.shutdown()
+    assert stored(tmp_path, metadata_id) is None
+    assert stored(tmp_path, later_id) is not None
+
+
+@pytest.mark.unit
+def test_failure_is_reported_on_shutdown(tmp_path, monkeypatch):
+    storage = make_storage(tmp_path)
+    fail_writes(monkeypatch, storage, 3)
+    storage.save_metadata("model", "inference", "prediction", {"i": 1})
+    with pytest.raises(RuntimeError, match="not written"):
+        storage.shutdown()
+
+
+@pytest.mark.unit
+def test_durable_failure_raises_from_save(tmp_path, monkeypatch):
+    storage = make_storage(tmp_path, durable_writes=True)
+    fail_writes(monkeypatch, storage, 3)
+    with pytest.raises(sqlite3.OperationalError):
+        storage.save_metadata("model", "inference", "prediction", {"i": 1})
+    assert storage.get_model_metadata("model") == []
+    assert len(storage.cache) == 0
+    storage.shutdown()